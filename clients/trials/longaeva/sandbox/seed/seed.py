@@ -15,9 +15,13 @@ Volumes (deterministic, seeded):
   GOLD.mart_daily_portfolio_exposure  ~190k rows  (mirrors stg_holdings_snapshot)
   GOLD.mart_issuer_risk_summary       ~50k rows  (200 issuers x 252 days)
 
+`--scale N` multiplies the portfolio count, so holdings/exposure grow ~N x
+(10 -> ~1.9M rows each, 100 -> ~19M); the other tables keep their size. The
+default (1) reproduces the dataset above exactly.
+
 Run:
   uv run --with 'snowflake-connector-python[pandas]' --with pandas --with numpy \\
-    python seed.py [--connection brighthive] [--reset]
+    python seed.py [--connection brighthive] [--reset] [--scale 10]
 
 `--reset` truncates target tables before loading. Idempotent without `--reset`
 because we use REPLACE-on-key inserts (pk-aware).
@@ -211,78 +215,122 @@ def gen_security_prices(rng: np.random.Generator, identifier_map: pd.DataFrame,
     return pd.DataFrame(rows)
 
 
+def _round_like_python(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """Elementwise `round(float(v), ndigits)`, bit for bit, without a Python call per value.
+
+    `np.round` scales, rounds and unscales, so it can land on the other side of a half-way
+    point than Python's correctly-rounded `round`. That only happens when the scaled value
+    sits within a few ulps of .5; those few are re-rounded with `round` itself.
+    """
+    out = np.round(values, ndigits)
+    scaled = values * 10.0**ndigits
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) <= 4 * np.spacing(np.abs(scaled))
+    if near_tie.any():
+        out[near_tie] = [round(v, ndigits) for v in values[near_tie].tolist()]
+    return out
+
+
 def gen_holdings_and_exposure(
     rng: np.random.Generator,
     identifier_map: pd.DataFrame,
     fiscal_calendar: pd.DataFrame,
     days: list[dt.date],
+    scale: int = 1,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Holdings + parallel exposure mart. Each portfolio holds 15-35 instruments."""
-    issuers = identifier_map.set_index("INTERNAL_ISSUER_ID")
+    """Holdings + parallel exposure mart. Each portfolio holds 15-35 instruments.
 
-    def fiscal_period_for(cohort: str, d: dt.date) -> str:
-        cal = fiscal_calendar[
-            (fiscal_calendar["ISSUER_COHORT"] == cohort)
-            & (fiscal_calendar["PERIOD_START_DATE"] <= d)
-            & (fiscal_calendar["PERIOD_END_DATE"] >= d)
-        ]
-        return cal["FISCAL_PERIOD_ID"].iloc[0] if len(cal) else None
-
-    holdings_rows = []
-    exposure_rows = []
-
-    portfolios = [f"P-{p:03d}" for p in range(N_PORTFOLIOS)]
+    Built as whole columns over a (day x portfolio x holding) cartesian index rather than row by
+    row. The RNG is drawn in the same order and amount as a per-day, per-portfolio loop (one
+    normal per holding, days outermost), so the frames — and everything generated after them
+    from the same `rng` — are identical for a given RNG_SEED. `scale` multiplies the number of
+    portfolios (10x ~ 1.9M rows, 100x ~ 19M); scale=1 is the canonical dataset.
+    """
+    portfolios = [f"P-{p:03d}" for p in range(N_PORTFOLIOS * scale)]
 
     # Per portfolio, fix a stable instrument set to make the data look real
-    portfolio_holdings_template: dict[str, list[str]] = {}
-    for p in portfolios:
+    templates: list[np.ndarray] = []
+    for _ in portfolios:
         n = rng.integers(*HOLDINGS_PER_PORT_PER_DAY)
-        chosen = rng.choice(identifier_map["INTERNAL_ISSUER_ID"].values, size=n, replace=False)
-        portfolio_holdings_template[p] = list(chosen)
-
-    for d in days:
-        for p, instruments in portfolio_holdings_template.items():
-            # Drift exposure ~ N(1M, 200k) per holding, weights normalize to ~1
-            raw_amounts = rng.normal(loc=1_000_000, scale=200_000, size=len(instruments))
-            raw_amounts = np.clip(raw_amounts, 50_000, None)
-            total = raw_amounts.sum()
-            for instr_idx, internal_issuer_id in enumerate(instruments):
-                amount = float(raw_amounts[instr_idx])
-                weight = amount / total
-                row = issuers.loc[internal_issuer_id]
-                country = row["PRIMARY_COUNTRY"]
-                sector = row["PRIMARY_SECTOR"]
-                cohort = row["ISSUER_COHORT"]
-                instr_id = f"INSTR-{int(internal_issuer_id.split('-')[1]):04d}"
-                fp_id = fiscal_period_for(cohort, d)
-
-                holdings_rows.append({
-                    "PORTFOLIO_ID": p,
-                    "INTERNAL_ISSUER_ID": internal_issuer_id,
-                    "INSTRUMENT_ID": instr_id,
-                    "AS_OF_DATE": d,
-                    "QUANTITY": round(amount / 100.0, 6),  # synthetic quantity
-                    "MARKET_VALUE_LOCAL": round(amount, 2),
-                    "MARKET_VALUE_USD": round(amount, 2),
-                    "CURRENCY": "USD",
-                    "SOURCE_SYSTEM": "synthetic_v1",
-                    "AS_OF_TIME": dt.datetime.combine(d, dt.time(20, 0)),
-                    "QUALITY_FLAG": "OK",
-                })
-                exposure_rows.append({
-                    "AS_OF_DATE": d,
-                    "PORTFOLIO_ID": p,
-                    "INTERNAL_ISSUER_ID": internal_issuer_id,
-                    "INSTRUMENT_ID": instr_id,
-                    "COUNTRY_CODE": country,
-                    "SECTOR_CODE": sector,
-                    "ASSET_CLASS_CODE": "EQUITY",
-                    "FISCAL_PERIOD_ID": fp_id,
-                    "EXPOSURE_AMOUNT_USD": round(amount, 2),
-                    "POSITION_COUNT": 1,
-                    "WEIGHT_PCT": round(float(weight), 6),
-                })
-    return pd.DataFrame(holdings_rows), pd.DataFrame(exposure_rows)
+        templates.append(rng.choice(identifier_map["INTERNAL_ISSUER_ID"].values, size=n, replace=False))
+    sizes = np.array([len(t) for t in templates])
+    per_day = int(sizes.sum())
+    n_days = len(days)
+
+    # Cartesian index: day-major, then portfolio, then holding — the loop's row order.
+    day_idx = np.repeat(np.arange(n_days), per_day)
+    slot_idx = np.tile(np.arange(per_day), n_days)
+    port_of_slot = np.repeat(np.arange(len(portfolios)), sizes)
+    issuer_of_slot = np.concatenate(templates)
+
+    # Drift exposure ~ N(1M, 200k) per holding, weights normalize to ~1
+    amounts = np.clip(rng.normal(loc=1_000_000, scale=200_000, size=n_days * per_day), 50_000, None)
+    # Weights per (day, portfolio) group. Each portfolio's block is summed as a (days, holdings)
+    # matrix so every group total is the same float a 1-D `.sum()` of that block gives.
+    by_day = amounts.reshape(n_days, per_day)
+    totals = np.empty_like(by_day)
+    bounds = np.concatenate(([0], np.cumsum(sizes)))
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        totals[:, start:stop] = by_day[:, start:stop].sum(axis=1, keepdims=True)
+    weights = amounts / totals.ravel()
+
+    frame = pd.DataFrame({
+        "INTERNAL_ISSUER_ID": issuer_of_slot[slot_idx],
+        "_DAY": day_idx,
+    })
+    # Issuer attributes: one merge against the identifier map (left merge keeps row order).
+    frame = frame.merge(
+        identifier_map[["INTERNAL_ISSUER_ID", "PRIMARY_COUNTRY", "PRIMARY_SECTOR", "ISSUER_COHORT"]],
+        on="INTERNAL_ISSUER_ID", how="left",
+    )
+    # Fiscal period: interval join of each (cohort, day) onto the cohort's [start, end] periods.
+    day_values = pd.to_datetime(pd.Series(days)).to_numpy()
+    periods = {}
+    for cohort, cal in fiscal_calendar.groupby("ISSUER_COHORT", sort=False):
+        intervals = pd.IntervalIndex.from_arrays(
+            pd.to_datetime(cal["PERIOD_START_DATE"]), pd.to_datetime(cal["PERIOD_END_DATE"]), closed="both",
+        )
+        hit = intervals.get_indexer(day_values)
+        ids = cal["FISCAL_PERIOD_ID"].to_numpy(dtype=object)
+        periods[cohort] = np.where(hit >= 0, ids[hit], None)
+    fiscal_ids = np.full(len(frame), None, dtype=object)
+    for cohort, by_day_id in periods.items():
+        mask = (frame["ISSUER_COHORT"] == cohort).to_numpy()
+        fiscal_ids[mask] = by_day_id[day_idx[mask]]
+
+    issuer_ids = frame["INTERNAL_ISSUER_ID"].to_numpy(dtype=object)
+    instrument_ids = "INSTR-" + frame["INTERNAL_ISSUER_ID"].str.split("-").str[1].str.zfill(4)
+    as_of_date = np.array(days, dtype=object)[day_idx]
+    as_of_time = np.array([dt.datetime.combine(d, dt.time(20, 0)) for d in days], dtype="datetime64[us]")[day_idx]
+    portfolio_ids = np.array(portfolios, dtype=object)[port_of_slot[slot_idx]]
+    amount_2dp = _round_like_python(amounts, 2)
+
+    holdings = pd.DataFrame({
+        "PORTFOLIO_ID": portfolio_ids,
+        "INTERNAL_ISSUER_ID": issuer_ids,
+        "INSTRUMENT_ID": instrument_ids.to_numpy(dtype=object),
+        "AS_OF_DATE": as_of_date,
+        "QUANTITY": _round_like_python(amounts / 100.0, 6),  # synthetic quantity
+        "MARKET_VALUE_LOCAL": amount_2dp,
+        "MARKET_VALUE_USD": amount_2dp.copy(),
+        "CURRENCY": "USD",
+        "SOURCE_SYSTEM": "synthetic_v1",
+        "AS_OF_TIME": as_of_time,
+        "QUALITY_FLAG": "OK",
+    })
+    exposure = pd.DataFrame({
+        "AS_OF_DATE": as_of_date,
+        "PORTFOLIO_ID": portfolio_ids,
+        "INTERNAL_ISSUER_ID": issuer_ids,
+        "INSTRUMENT_ID": instrument_ids.to_numpy(dtype=object),
+        "COUNTRY_CODE": frame["PRIMARY_COUNTRY"].to_numpy(dtype=object),
+        "SECTOR_CODE": frame["PRIMARY_SECTOR"].to_numpy(dtype=object),
+        "ASSET_CLASS_CODE": "EQUITY",
+        "FISCAL_PERIOD_ID": fiscal_ids,
+        "EXPOSURE_AMOUNT_USD": amount_2dp.copy(),
+        "POSITION_COUNT": 1,
+        "WEIGHT_PCT": _round_like_python(weights, 6),
+    })
+    return holdings, exposure
 
 
 def gen_corporate_actions(rng: np.random.Generator, identifier_map: pd.DataFrame, days: list[dt.date]) -> pd.DataFrame:
@@ -368,7 +416,11 @@ def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--connection", default="brighthive")
     parser.add_argument("--reset", action="store_true", help="TRUNCATE targets before load")
+    parser.add_argument("--scale", type=int, default=1,
+                        help="multiply the portfolio count (holdings/exposure volume); 1 = canonical dataset")
     args = parser.parse_args()
+    if args.scale < 1:
+        parser.error("--scale must be at least 1")
 
     rng = np.random.default_rng(RNG_SEED)
     days = trading_days(ASOF_END, DAYS)
@@ -386,7 +438,7 @@ def main() -> int:
     prices = gen_security_prices(rng, identifier_map, days)
     print(f"  prices: {len(prices):,} rows", file=sys.stderr)
 
-    holdings, exposure = gen_holdings_and_exposure(rng, identifier_map, fiscal, days)
+    holdings, exposure = gen_holdings_and_exposure(rng, identifier_map, fiscal, days, args.scale)
     print(f"  holdings: {len(holdings):,} rows, exposure: {len(exposure):,} rows",
           file=sys.stderr)
 
@@ -12,6 +12,15 @@ the real tmpfs mount reports, so filling the .mdf drops it and shrinking the
     python monitor.py                 # 70% floor (Frank's named threshold)
     python monitor.py --threshold 70  # explicit
     python monitor.py --json          # machine-readable, for a watchdog dry run
+    python monitor.py --watch --interval 30   # early warning: sample, trend, time-to-breach
+
+`--watch` samples every `--interval` seconds over the one pooled session,
+appends each reading to a SQLite time series (`.monitor_history.sqlite`,
+pruned to the newest HISTORY_MAX_SAMPLES like a ring buffer), fits a
+least-squares line to the last `--window-min` minutes and projects when free
+space crosses the floor — so the warning comes while there is still time to
+reclaim, not after the breach. History survives restarts, so a fresh watcher
+forecasts from its first sample.
 """
 
 from __future__ import annotations
@@ -19,13 +28,22 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import subprocess
+import sqlite3
 import sys
+import time
 from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # sandbox_sql lives one level up
+from sandbox_sql import connect  # noqa: E402
 
-_CONTAINER = "loopcapital-sql-sandbox"
 _DATABASE = "LoopCapitalAM"
 _DEFAULT_FREE_FLOOR_PCT = 70.0
+HISTORY_PATH = Path(__file__).resolve().parent / ".monitor_history.sqlite"  # gitignored
+HISTORY_MAX_SAMPLES = 10_000
+DEFAULT_INTERVAL_S = 30.0
+DEFAULT_WINDOW_MIN = 30.0
+MIN_TREND_SAMPLES = 3
 
 # One row per data/log file on the mounted volume — the real watchdog query.
 _VOLUME_STATS_SQL = (
@@ -68,41 +86,166 @@ class DiskVerdict:
 
 
 def read_disk_verdict(*, password: str, threshold_pct: float) -> DiskVerdict:
-    """Runs the real sys.dm_os_volume_stats query and shapes an OK/BREACH verdict."""
-    result = subprocess.run(
-        [
-            "docker", "exec", "-i", _CONTAINER,
-            "/opt/mssql-tools18/bin/sqlcmd",
-            "-S", "localhost", "-U", "sa", "-P", password, "-C",
-            "-d", _DATABASE, "-h", "-1", "-W", "-s", ",", "-Q", _VOLUME_STATS_SQL,
-        ],
-        capture_output=True, text=True,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(f"volume-stats query failed (exit {result.returncode}): {result.stderr.strip()}")
-
-    row = next(
-        (ln.strip() for ln in result.stdout.splitlines()
-         if ln.strip() and "," in ln and not ln.strip().startswith("-")),
-        "",
-    )
-    parts = [p.strip() for p in row.split(",")]
-    if len(parts) < 3:
-        raise RuntimeError(f"could not parse volume-stats output: {result.stdout!r}")
+    """Runs the real sys.dm_os_volume_stats query and shapes an OK/BREACH verdict.
+    Reuses the pooled LoopCapitalAM session (../sandbox_sql.py), so run_demo's
+    repeated checks are round trips, not fresh docker exec + login each time."""
+    result_sets = connect(password=password).execute(database=_DATABASE, query=_VOLUME_STATS_SQL)
+    rows = result_sets[-1] if result_sets else []
+    if not rows or len(rows[0]) < 3:
+        raise RuntimeError(f"could not read volume stats for {_DATABASE}: {result_sets!r}")
+    percent_free, total_mib, free_mib = rows[0][:3]
 
     return DiskVerdict(
-        percent_free=float(parts[0]),
-        total_mib=int(parts[1]),
-        free_mib=int(parts[2]),
+        percent_free=float(percent_free),
+        total_mib=int(total_mib),
+        free_mib=int(free_mib),
         threshold_pct=threshold_pct,
     )
 
 
+class SampleHistory:
+    """SQLite time series of volume readings, newest HISTORY_MAX_SAMPLES kept."""
+
+    def __init__(self, *, path: Path = HISTORY_PATH) -> None:
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS samples ("
+            " taken_at REAL NOT NULL, database TEXT NOT NULL, percent_free REAL NOT NULL,"
+            " free_mib INTEGER NOT NULL, total_mib INTEGER NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS samples_taken ON samples (database, taken_at)")
+
+    def append(self, *, taken_at: float, verdict: DiskVerdict) -> None:
+        with self._db:
+            self._db.execute(
+                "INSERT INTO samples VALUES (?, ?, ?, ?, ?)",
+                (taken_at, _DATABASE, verdict.percent_free, verdict.free_mib, verdict.total_mib),
+            )
+            self._db.execute(
+                "DELETE FROM samples WHERE rowid <= "
+                "(SELECT MAX(rowid) FROM samples) - ?",
+                (HISTORY_MAX_SAMPLES,),
+            )
+
+    def since(self, *, taken_after: float) -> list[tuple[float, float]]:
+        """(taken_at, percent_free) pairs, oldest first."""
+        return self._db.execute(
+            "SELECT taken_at, percent_free FROM samples WHERE database = ? AND taken_at > ? "
+            "ORDER BY taken_at",
+            (_DATABASE, taken_after),
+        ).fetchall()
+
+    def close(self) -> None:
+        self._db.close()
+
+
+@dataclass(frozen=True)
+class Forecast:
+    slope_pct_per_h: float           # negative = volume filling up
+    seconds_to_breach: float | None  # None = not trending toward the floor
+
+    def describe(self) -> str:
+        trend = f"trend {self.slope_pct_per_h:+.2f} pp/h"
+        if self.seconds_to_breach is None:
+            return f"{trend}, not heading for the floor"
+        if self.seconds_to_breach <= 0:
+            return f"{trend}, floor already crossed"
+        hours = self.seconds_to_breach / 3600
+        eta = f"{hours:.1f}h" if hours >= 1 else f"{self.seconds_to_breach / 60:.0f}m"
+        return f"{trend}, breach in ~{eta}"
+
+
+def forecast_breach(*, samples: list[tuple[float, float]], threshold_pct: float) -> Forecast | None:
+    """Least-squares slope through (time, percent_free), projected from the
+    latest reading to when it meets `threshold_pct`. The crossed/not-crossed
+    call is the latest reading's, same as the verdict printed next to it —
+    the fitted line lags a reclaim jump. None until there are
+    MIN_TREND_SAMPLES over a nonzero span."""
+    if len(samples) < MIN_TREND_SAMPLES:
+        return None
+    n = len(samples)
+    mean_t = sum(t for t, _ in samples) / n
+    mean_p = sum(p for _, p in samples) / n
+    var_t = sum((t - mean_t) ** 2 for t, _ in samples)
+    if var_t == 0:
+        return None
+    slope = sum((t - mean_t) * (p - mean_p) for t, p in samples) / var_t  # pp per second
+    latest_p = samples[-1][1]
+    if latest_p < threshold_pct:
+        return Forecast(slope_pct_per_h=slope * 3600, seconds_to_breach=0.0)
+    if slope >= 0:
+        return Forecast(slope_pct_per_h=slope * 3600, seconds_to_breach=None)
+    return Forecast(slope_pct_per_h=slope * 3600, seconds_to_breach=(threshold_pct - latest_p) / slope)
+
+
+def watch(
+    *,
+    password: str,
+    threshold_pct: float,
+    interval_s: float = DEFAULT_INTERVAL_S,
+    window_min: float = DEFAULT_WINDOW_MIN,
+    samples: int | None = None,
+    as_json: bool = False,
+    history_path: Path = HISTORY_PATH,
+) -> DiskVerdict:
+    """Sample until interrupted (or `samples` attempts); returns the last verdict.
+
+    A failed reading (SQL Server restarting, the session dropped) is logged
+    and skipped: the pooled session is released so the next attempt logs in
+    fresh, and the watchdog keeps sampling."""
+    history = SampleHistory(path=history_path)
+    attempts = 0
+    verdict: DiskVerdict | None = None
+    try:
+        while samples is None or attempts < samples:
+            if attempts:
+                time.sleep(interval_s)
+            attempts += 1
+            try:
+                reading = read_disk_verdict(password=password, threshold_pct=threshold_pct)
+            except RuntimeError as exc:
+                connect(password=password).release(database=_DATABASE)
+                print(f"{time.strftime('%H:%M:%S')} ⚠️  sample failed: {exc}", file=sys.stderr, flush=True)
+                continue
+            verdict = reading
+            now = time.time()
+            history.append(taken_at=now, verdict=verdict)
+            forecast = forecast_breach(
+                samples=history.since(taken_after=now - window_min * 60), threshold_pct=threshold_pct
+            )
+            if as_json:
+                print(json.dumps({
+                    **verdict.to_dict(),
+                    "taken_at": now,
+                    "trend_pct_per_h": forecast.slope_pct_per_h if forecast else None,
+                    "seconds_to_breach": forecast.seconds_to_breach if forecast else None,
+                }), flush=True)
+                continue
+            icon = "🚨" if verdict.breached else "✅"
+            outlook = forecast.describe() if forecast else "collecting samples for a trend"
+            print(f"{time.strftime('%H:%M:%S')} {icon} {verdict.percent_free:6.2f}% free "
+                  f"({verdict.free_mib} MiB) — {outlook}", flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        history.close()
+    if verdict is None:
+        raise RuntimeError("no sample taken")
+    return verdict
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument("--threshold", type=float, default=_DEFAULT_FREE_FLOOR_PCT,
                         help=f"free-space floor as a percent (default: {_DEFAULT_FREE_FLOOR_PCT})")
-    parser.add_argument("--json", action="store_true", help="emit machine-readable JSON")
+    parser.add_argument("--json", action="store_true", help="emit machine-readable JSON (one line per sample with --watch)")
+    parser.add_argument("--watch", action="store_true", help="sample continuously and forecast time-to-breach")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL_S,
+                        help=f"with --watch: seconds between samples (default: {DEFAULT_INTERVAL_S:.0f})")
+    parser.add_argument("--window-min", type=float, default=DEFAULT_WINDOW_MIN,
+                        help=f"with --watch: minutes of history the trend is fitted to (default: {DEFAULT_WINDOW_MIN:.0f})")
+    parser.add_argument("--samples", type=int, default=None, help="with --watch: stop after N samples")
+    parser.add_argument("--history", type=Path, default=HISTORY_PATH, help="with --watch: SQLite time-series file")
     args = parser.parse_args()
 
     password = os.environ.get("MSSQL_SA_PASSWORD")
@@ -110,6 +253,14 @@ def main() -> int:
         print("export MSSQL_SA_PASSWORD before running monitor.py", file=sys.stderr)
         return 2
 
+    if args.watch:
+        verdict = watch(
+            password=password, threshold_pct=args.threshold, interval_s=args.interval,
+            window_min=args.window_min, samples=args.samples, as_json=args.json,
+            history_path=args.history,
+        )
+        return 1 if verdict.breached else 0
+
     verdict = read_disk_verdict(password=password, threshold_pct=args.threshold)
 
     if args.json:
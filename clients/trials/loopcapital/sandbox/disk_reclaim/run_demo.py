@@ -5,13 +5,14 @@ The story, start to finish, every number read off sys.dm_os_volume_stats:
 
     1. MEASURE   baseline free % on the real tmpfs data volume
     2. BLOAT     nightly SSIS anti-pattern fills holdings_snapshot_raw → .mdf grows
-    3. BREACH    the 70%-free monitor fires: disk pressure below the safe floor
+    3. BREACH    the 70%-free monitor fires: disk pressure below the safe floor,
+                 plus where the bytes went and what the reclaim should free (space_report.py)
     4. RECLAIM   great dbt code rebuilds the data deduped + narrow-typed + columnstore
     5. RELEASE   drop the raw heap + DBCC SHRINKFILE → real bytes returned to the volume
     6. OK        the same 70% monitor flips back to OK — space actually freed
 
 Step 4 prefers real `dbt run` (dbt-sqlserver) if it's installed; otherwise it
-applies the model's identical transformation via sqlcmd so the demo always runs
+applies the model's identical transformation as T-SQL so the demo always runs
 end to end. Either way the artifact of record is dbt/models/holdings_current.sql.
 
     export MSSQL_SA_PASSWORD='...'
@@ -27,9 +28,11 @@ import subprocess
 import sys
 from pathlib import Path
 
-from monitor import read_disk_verdict
+from monitor import DiskVerdict, read_disk_verdict
+from sandbox_sql import connect  # on sys.path via monitor's import
+from seed_bloat import seed_bloat
+from space_report import format_space_report, read_space_report
 
-_CONTAINER = "loopcapital-sql-sandbox"
 _DATABASE = "LoopCapitalAM"
 _HERE = Path(__file__).resolve().parent
 _DBT_DIR = _HERE / "dbt"
@@ -72,28 +75,16 @@ CHECKPOINT;
 
 
 def sqlcmd(*, query: str, password: str) -> str:
-    result = subprocess.run(
-        [
-            "docker", "exec", "-i", _CONTAINER,
-            "/opt/mssql-tools18/bin/sqlcmd",
-            "-S", "localhost", "-U", "sa", "-P", password, "-C", "-b",
-            "-d", _DATABASE, "-Q", query,
-        ],
-        capture_output=True, text=True,
-    )
-    if result.returncode != 0:
-        print(result.stdout)
-        print(result.stderr, file=sys.stderr)
-        raise RuntimeError(f"sqlcmd failed (exit {result.returncode})")
-    return result.stdout
-
-
-def report(*, label: str, password: str, threshold: float) -> float:
+    """One batch on the pooled LoopCapitalAM session (../sandbox_sql.py)."""
+    return connect(password=password).sqlcmd(database=_DATABASE, query=query)
+
+
+def report(*, label: str, password: str, threshold: float) -> DiskVerdict:
     verdict = read_disk_verdict(password=password, threshold_pct=threshold)
     icon = "🚨" if verdict.breached else "✅"
     print(f"  {icon} {label}: {verdict.percent_free}% free "
           f"({verdict.free_mib} MiB of {verdict.total_mib} MiB) → {verdict.status}")
-    return verdict.percent_free
+    return verdict
 
 
 def _dbt_binary() -> str | None:
@@ -149,14 +140,17 @@ def main() -> int:
     print("\n=== Loop Capital disk-reclaim demo (real sandbox volume) ===\n")
 
     print("1. MEASURE baseline")
-    baseline = report(label="baseline", password=password, threshold=args.threshold)
+    baseline = report(label="baseline", password=password, threshold=args.threshold).percent_free
 
     print(f"\n2. BLOAT — appending {args.nights} nightly SSIS snapshots")
-    subprocess.run([sys.executable, str(_HERE / "seed_bloat.py"), "--nights", str(args.nights)],
-                   check=True, env={**os.environ})
+    print(seed_bloat(client=connect(password=password), nights=args.nights))
 
     print("\n3. MONITOR after bloat")
-    pressured = report(label="after bloat", password=password, threshold=args.threshold)
+    pressured_verdict = report(label="after bloat", password=password, threshold=args.threshold)
+    pressured = pressured_verdict.percent_free
+    space = read_space_report(password=password)
+    print()
+    print("   " + format_space_report(space, top=5).replace("\n", "\n   "))
 
     print("\n4. RECLAIM — great dbt code rebuilds the data")
     run_reclaim(password=password)
@@ -165,13 +159,18 @@ def main() -> int:
     sqlcmd(query=_RELEASE_SQL, password=password)
 
     print("\n6. MONITOR after reclaim")
-    reclaimed = report(label="after reclaim", password=password, threshold=args.threshold)
+    reclaimed_verdict = report(label="after reclaim", password=password, threshold=args.threshold)
+    reclaimed = reclaimed_verdict.percent_free
 
     print("\n=== Result ===")
     print(f"  baseline free:      {baseline:.2f}%")
     print(f"  under bloat:        {pressured:.2f}%  ({'BREACH' if pressured < args.threshold else 'OK'})")
     print(f"  after dbt reclaim:  {reclaimed:.2f}%  ({'BREACH' if reclaimed < args.threshold else 'OK'})")
-    print(f"  space reclaimed:    {reclaimed - pressured:+.2f} percentage points free\n")
+    print(f"  space reclaimed:    {reclaimed - pressured:+.2f} percentage points free")
+    if space.reclaim:
+        print(f"  volume bytes back:  {reclaimed_verdict.free_mib - pressured_verdict.free_mib:+,} MiB actual vs "
+              f"~{space.reclaim.returned_to_volume_bytes // (1024 * 1024):,} MiB estimated before the reclaim")
+    print()
     if pressured < args.threshold <= reclaimed:
         print("  ✅ 70% monitor flipped BREACH → OK. dbt reclaim freed real disk.\n")
         return 0
@@ -17,16 +17,25 @@ SHRINKFILE releases the bytes back to the volume — visible in monitor.py.
 
     export MSSQL_SA_PASSWORD='...'
     python seed_bloat.py --nights 40      # ~40 nightly snapshots of the holdings book
+    python seed_bloat.py --nights 365     # a year of them — still one INSERT
+
+All nights land in ONE set-based `INSERT ... WITH (TABLOCK)` (a numbers table
+cross-joined with holdings_raw), minimally logged into the heap, with a
+progress meter read off sys.dm_exec_requests from a second session.
 """
 
 from __future__ import annotations
 
 import argparse
 import os
-import subprocess
 import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # sandbox_sql lives one level up
+from sandbox_sql import SandboxSQL, connect  # noqa: E402
 
-_CONTAINER = "loopcapital-sql-sandbox"
 _DATABASE = "LoopCapitalAM"
 
 # The wide, redundant heap the nightly SSIS extract appends to. Deliberately
@@ -36,7 +45,7 @@ SET NOCOUNT ON;
 IF OBJECT_ID('dbo.holdings_snapshot_raw', 'U') IS NOT NULL
     DROP TABLE dbo.holdings_snapshot_raw;
 CREATE TABLE dbo.holdings_snapshot_raw (
-    snapshot_id     BIGINT IDENTITY PRIMARY KEY,
+    snapshot_id     BIGINT IDENTITY NOT NULL,   -- no PK: a true heap, as the extract left it
     snapshot_date   DATE            NOT NULL,
     portfolio_id    NVARCHAR(4000)  NOT NULL,   -- oversized: real code is <= 20 chars
     instrument_id   NVARCHAR(4000)  NOT NULL,   -- oversized
@@ -50,16 +59,22 @@ CREATE TABLE dbo.holdings_snapshot_raw (
 );
 """
 
-# One night's append: a full snapshot of every holding, padded with the
-# redundant JSON blob. Runs entirely server-side (no row-by-row round trips).
-_APPEND_ONE_NIGHT = """
+# Every night's append in ONE statement: a full snapshot of every holding per
+# night, padded with the redundant JSON blob. The nights come from an inline
+# numbers table cross-joined with the book; TABLOCK into the empty heap under
+# BULK_LOGGED makes the insert minimally logged, so the .ldf on the same tmpfs
+# doesn't balloon alongside the .mdf.
+_APPEND_ALL_NIGHTS = """
 SET NOCOUNT ON;
-DECLARE @night INT = {night};
-INSERT INTO dbo.holdings_snapshot_raw
+WITH nights AS (
+    SELECT TOP ({nights}) ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) AS night
+    FROM sys.all_objects AS a CROSS JOIN sys.all_objects AS b
+)
+INSERT INTO dbo.holdings_snapshot_raw WITH (TABLOCK)
     (snapshot_date, portfolio_id, instrument_id, quantity, price, market_value,
      currency, custodian, snapshot_json)
 SELECT
-    DATEADD(DAY, -@night, CAST(SYSUTCDATETIME() AS DATE)),
+    DATEADD(DAY, -n.night, CAST(SYSUTCDATETIME() AS DATE)),
     h.portfolio_id, h.instrument_id, h.quantity,
     100.0 + (h.holding_id % 400) * 0.25,
     h.quantity * (100.0 + (h.holding_id % 400) * 0.25),
@@ -70,25 +85,96 @@ SELECT
         + '","instrument":"' + h.instrument_id
         + '","note":"full denormalized snapshot row, no dedup, retained forever"}}'
         AS NVARCHAR(MAX)), 8)
-FROM dbo.holdings_raw AS h;
+FROM nights AS n CROSS JOIN dbo.holdings_raw AS h;
 """
 
+# The running INSERT, seen from a second session: the request's state plus the
+# insert operator's live row count (lightweight query profiling, on by default
+# since SQL Server 2019). Matches on the statement text, so it works whether the
+# loader is a pooled session or a docker exec sqlcmd.
+_PROGRESS_SQL = """
+SET NOCOUNT ON;
+SELECT TOP 1
+    r.total_elapsed_time / 1000.0,
+    ISNULL(r.wait_type, 'running'),
+    r.writes,
+    (SELECT MAX(p.row_count) FROM sys.dm_exec_query_profiles AS p
+     WHERE p.session_id = r.session_id AND p.physical_operator_name = 'Table Insert')
+FROM sys.dm_exec_requests AS r
+CROSS APPLY sys.dm_exec_sql_text(r.sql_handle) AS t
+WHERE r.session_id <> @@SPID
+  AND r.command = 'INSERT'
+  AND t.text LIKE '%INSERT INTO dbo.holdings_snapshot_raw WITH (TABLOCK)%';
+"""
+PROGRESS_POLL_S = 2.0
+
 
 def sqlcmd(*, query: str, password: str, database: str = _DATABASE) -> str:
-    result = subprocess.run(
-        [
-            "docker", "exec", "-i", _CONTAINER,
-            "/opt/mssql-tools18/bin/sqlcmd",
-            "-S", "localhost", "-U", "sa", "-P", password, "-C", "-b",
-            "-d", database, "-Q", query,
-        ],
-        capture_output=True, text=True,
+    """One batch on the pooled session for `database` (see ../sandbox_sql.py)."""
+    return connect(password=password).sqlcmd(database=database, query=query)
+
+
+def _watch_progress(*, client: SandboxSQL, expected_rows: int, done: threading.Event) -> None:
+    """Progress meter for the single INSERT, polled from the master session."""
+    while not done.wait(PROGRESS_POLL_S):
+        try:
+            rows = client.execute(database="master", query=_PROGRESS_SQL)[-1]
+        except RuntimeError:
+            return  # the meter is best-effort; the load itself reports real errors
+        if not rows:
+            continue
+        elapsed_s, wait, writes, inserted = rows[0]
+        if inserted is not None and expected_rows:
+            pct = min(100.0, int(inserted) * 100.0 / expected_rows)
+            print(f"  ...{int(inserted):,}/{expected_rows:,} rows ({pct:.0f}%), "
+                  f"{float(elapsed_s):.0f}s, {wait}")
+        else:
+            print(f"  ...{int(writes):,} pages written, {float(elapsed_s):.0f}s, {wait}")
+
+
+def seed_bloat(*, client: SandboxSQL, nights: int) -> str:
+    """Create the heap and append all `nights` snapshots in one minimally
+    logged statement; returns the row-count / .mdf-size summary as text."""
+    print(f"Creating dbo.holdings_snapshot_raw and appending {nights} nightly snapshots in one statement...")
+    recovery = client.scalar(
+        database="master",
+        query=f"SET NOCOUNT ON; SELECT recovery_model_desc FROM sys.databases WHERE name = '{_DATABASE}';",
+    )
+    client.execute(database=_DATABASE, query=_CREATE_BLOAT_TABLE)
+    book_rows = int(client.scalar(database=_DATABASE, query="SET NOCOUNT ON; SELECT COUNT(*) FROM dbo.holdings_raw;"))
+
+    # Minimal logging needs SIMPLE or BULK_LOGGED; put the original model back after.
+    if recovery == "FULL":
+        client.execute(database=_DATABASE, query="ALTER DATABASE CURRENT SET RECOVERY BULK_LOGGED;")
+    done = threading.Event()
+    meter = threading.Thread(
+        target=_watch_progress,
+        kwargs={"client": client, "expected_rows": book_rows * nights, "done": done},
+        daemon=True,
+    )
+    started = time.monotonic()
+    meter.start()
+    try:
+        client.execute(database=_DATABASE, query=_APPEND_ALL_NIGHTS.format(nights=nights))
+    finally:
+        done.set()
+        meter.join()
+        if recovery == "FULL":
+            client.execute(database=_DATABASE, query="ALTER DATABASE CURRENT SET RECOVERY FULL;")
+    print(f"  {book_rows * nights:,} rows ({nights} nights x {book_rows:,} holdings) "
+          f"in {time.monotonic() - started:.1f}s")
+
+    # Grow the .mdf to hold what we just wrote (tmpfs shows real pressure only
+    # once the data file actually claims the pages).
+    return client.sqlcmd(
+        database=_DATABASE,
+        query=(
+            "SET NOCOUNT ON; "
+            "SELECT COUNT(*) AS rows_in_raw FROM dbo.holdings_snapshot_raw; "
+            "SELECT CAST(SUM(size) * 8.0 / 1024 AS DECIMAL(10,1)) AS mdf_mib "
+            "FROM sys.database_files WHERE type_desc = 'ROWS';"
+        ),
     )
-    if result.returncode != 0:
-        print(result.stdout)
-        print(result.stderr, file=sys.stderr)
-        raise RuntimeError(f"sqlcmd failed (exit {result.returncode})")
-    return result.stdout
 
 
 def main() -> int:
@@ -102,24 +188,11 @@ def main() -> int:
         print("export MSSQL_SA_PASSWORD before running seed_bloat.py", file=sys.stderr)
         return 2
 
-    print(f"Creating dbo.holdings_snapshot_raw and appending {args.nights} nightly snapshots...")
-    sqlcmd(query=_CREATE_BLOAT_TABLE, password=password)
-    for night in range(1, args.nights + 1):
-        sqlcmd(query=_APPEND_ONE_NIGHT.format(night=night), password=password)
-        if night % 10 == 0:
-            print(f"  ...{night}/{args.nights} nights appended")
-
-    # Grow the .mdf to hold what we just wrote (tmpfs shows real pressure only
-    # once the data file actually claims the pages).
-    summary = sqlcmd(
-        query=(
-            "SET NOCOUNT ON; "
-            "SELECT COUNT(*) AS rows_in_raw FROM dbo.holdings_snapshot_raw; "
-            "SELECT CAST(SUM(size) * 8.0 / 1024 AS DECIMAL(10,1)) AS mdf_mib "
-            "FROM sys.database_files WHERE type_desc = 'ROWS';"
-        ),
-        password=password,
-    )
+    client = connect(password=password)
+    try:
+        summary = seed_bloat(client=client, nights=args.nights)
+    finally:
+        client.close()
     print(summary)
     print("Bloat seeded. Run ../disk_reclaim/monitor.py to see the volume breach the 70% floor.")
     return 0
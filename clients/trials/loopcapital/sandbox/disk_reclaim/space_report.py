@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""Where the bytes on the Loop Capital data volume go — and how many the
+reclaim will give back, estimated BEFORE it runs.
+
+monitor.py answers "how full is the volume" (one sys.dm_os_volume_stats row).
+This answers "full of what":
+
+  * per file   — sys.database_files: allocated vs used pages for the .mdf/.ldf
+  * per object — sys.dm_db_partition_stats joined to sys.allocation_units:
+                 every table/index ranked by reserved pages, with used, in-row,
+                 LOB and row-overflow pages split out (the snapshot_json blob
+                 shows up as LOB/in-row weight on holdings_snapshot_raw)
+  * reclaim    — what dbt/models/holdings_current.sql + the drop + SHRINKFILE
+                 would free: the raw heap's reserved pages, minus a rowstore
+                 upper bound for the deduped, narrow-typed model (columnstore
+                 only makes it smaller), and how much of that the shrink can
+                 hand back to the volume.
+
+    export MSSQL_SA_PASSWORD='...'
+    python space_report.py            # human-readable, top 15 objects
+    python space_report.py --top 50
+    python space_report.py --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # sandbox_sql lives one level up
+from sandbox_sql import connect  # noqa: E402
+
+_DATABASE = "LoopCapitalAM"
+_PAGE_BYTES = 8192
+_MIB = 1024 * 1024
+_RAW_TABLE = "dbo.holdings_snapshot_raw"
+_MODEL_TABLE = "dbo.holdings_current"
+_SHRINK_TARGET_MIB = 10  # run_demo's DBCC SHRINKFILE (@f, 10)
+# Fixed part of one holdings_current row in rowstore: 3 x DECIMAL(18,4) (9 bytes
+# each) + DATE (3) + row header, null bitmap and variable-column offsets (~11).
+_MODEL_FIXED_ROW_BYTES = 3 * 9 + 3 + 11
+
+_FILES_SQL = """
+SET NOCOUNT ON;
+SELECT name, type_desc, size, CAST(FILEPROPERTY(name, 'SpaceUsed') AS INT)
+FROM sys.database_files
+ORDER BY type, file_id;
+"""
+
+# One row per table/index. Reserved/used come from partition stats; the
+# allocation-unit split (1 = IN_ROW_DATA, 2 = LOB_DATA, 3 = ROW_OVERFLOW_DATA)
+# comes from sys.allocation_units, whose container_id is the partition's hobt.
+_OBJECTS_SQL = """
+SET NOCOUNT ON;
+SELECT
+    s.name + '.' + o.name,
+    ISNULL(i.name, '(heap)'),
+    i.type_desc,
+    SUM(CASE WHEN ps.index_id IN (0, 1) THEN ps.row_count ELSE 0 END),
+    SUM(ps.reserved_page_count),
+    SUM(ps.used_page_count),
+    SUM(au.in_row_pages),
+    SUM(au.lob_pages),
+    SUM(au.overflow_pages)
+FROM sys.dm_db_partition_stats AS ps
+JOIN sys.objects AS o ON o.object_id = ps.object_id
+JOIN sys.schemas AS s ON s.schema_id = o.schema_id
+JOIN sys.indexes AS i ON i.object_id = ps.object_id AND i.index_id = ps.index_id
+CROSS APPLY (
+    SELECT
+        SUM(CASE WHEN a.type = 1 THEN a.used_pages ELSE 0 END) AS in_row_pages,
+        SUM(CASE WHEN a.type = 2 THEN a.used_pages ELSE 0 END) AS lob_pages,
+        SUM(CASE WHEN a.type = 3 THEN a.used_pages ELSE 0 END) AS overflow_pages
+    FROM sys.allocation_units AS a
+    WHERE a.container_id = ps.partition_id
+) AS au
+WHERE o.is_ms_shipped = 0
+GROUP BY s.name, o.name, i.name, i.type_desc
+ORDER BY SUM(ps.reserved_page_count) DESC;
+"""
+
+# What holdings_current.sql would keep: one row per (portfolio, instrument),
+# with the two codes cast to VARCHAR(20) and currency to VARCHAR(3).
+_MODEL_ESTIMATE_SQL = """
+SET NOCOUNT ON;
+SELECT COUNT(*),
+       ISNULL(AVG(CAST(DATALENGTH(CAST(portfolio_id AS VARCHAR(20)))
+                     + DATALENGTH(CAST(instrument_id AS VARCHAR(20)))
+                     + DATALENGTH(CAST(currency AS VARCHAR(3))) AS FLOAT)), 0)
+FROM (
+    SELECT portfolio_id, instrument_id, MAX(currency) AS currency
+    FROM dbo.holdings_snapshot_raw
+    GROUP BY portfolio_id, instrument_id
+) AS latest;
+"""
+
+
+@dataclass(frozen=True)
+class FileUsage:
+    name: str
+    type_desc: str
+    size_pages: int
+    used_pages: int
+
+    @property
+    def free_pages(self) -> int:
+        return self.size_pages - self.used_pages
+
+
+@dataclass(frozen=True)
+class ObjectUsage:
+    table_name: str
+    index_name: str
+    index_type: str
+    row_count: int
+    reserved_pages: int
+    used_pages: int
+    in_row_pages: int
+    lob_pages: int
+    overflow_pages: int
+
+
+@dataclass(frozen=True)
+class ReclaimEstimate:
+    raw_reserved_bytes: int       # dropped with holdings_snapshot_raw
+    old_model_bytes: int          # the existing holdings_current, rebuilt
+    model_rows: int
+    model_upper_bound_bytes: int  # rowstore size of the new holdings_current; columnstore is smaller
+    freed_in_file_bytes: int      # lower bound on pages freed inside the .mdf
+    returned_to_volume_bytes: int  # what SHRINKFILE can then give back to the volume
+
+
+@dataclass(frozen=True)
+class SpaceReport:
+    files: list[FileUsage]
+    objects: list[ObjectUsage]
+    reclaim: ReclaimEstimate | None
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "database": _DATABASE,
+            "files": [asdict(f) for f in self.files],
+            "objects": [asdict(o) for o in self.objects],
+            "reclaim": asdict(self.reclaim) if self.reclaim else None,
+        }
+
+
+def _estimate_reclaim(*, password: str, files: list[FileUsage], objects: list[ObjectUsage]) -> ReclaimEstimate | None:
+    raw = [o for o in objects if o.table_name == _RAW_TABLE]
+    if not raw:
+        return None
+    raw_bytes = sum(o.reserved_pages for o in raw) * _PAGE_BYTES
+    old_model_bytes = sum(o.reserved_pages for o in objects if o.table_name == _MODEL_TABLE) * _PAGE_BYTES
+    rows = connect(password=password).execute(database=_DATABASE, query=_MODEL_ESTIMATE_SQL)[-1]
+    model_rows, avg_var_bytes = int(rows[0][0]), float(rows[0][1])
+    model_bytes = int(model_rows * (_MODEL_FIXED_ROW_BYTES + avg_var_bytes))
+    freed = max(0, raw_bytes + old_model_bytes - model_bytes)
+
+    data_files = [f for f in files if f.type_desc == "ROWS"]
+    size_bytes = sum(f.size_pages for f in data_files) * _PAGE_BYTES
+    used_after = max(0, sum(f.used_pages for f in data_files) * _PAGE_BYTES - freed)
+    shrunk_to = max(used_after, _SHRINK_TARGET_MIB * _MIB)
+    return ReclaimEstimate(
+        raw_reserved_bytes=raw_bytes,
+        old_model_bytes=old_model_bytes,
+        model_rows=model_rows,
+        model_upper_bound_bytes=model_bytes,
+        freed_in_file_bytes=freed,
+        returned_to_volume_bytes=max(0, size_bytes - shrunk_to),
+    )
+
+
+def read_space_report(*, password: str) -> SpaceReport:
+    """Per-file and per-object usage, plus the reclaim estimate when the raw heap exists."""
+    client = connect(password=password)
+    files = [
+        FileUsage(name=name, type_desc=type_desc, size_pages=int(size), used_pages=int(used or 0))
+        for name, type_desc, size, used in client.execute(database=_DATABASE, query=_FILES_SQL)[-1]
+    ]
+    objects = [
+        ObjectUsage(
+            table_name=table_name, index_name=index_name, index_type=index_type,
+            row_count=int(row_count), reserved_pages=int(reserved), used_pages=int(used),
+            in_row_pages=int(in_row or 0), lob_pages=int(lob or 0), overflow_pages=int(overflow or 0),
+        )
+        for table_name, index_name, index_type, row_count, reserved, used, in_row, lob, overflow
+        in client.execute(database=_DATABASE, query=_OBJECTS_SQL)[-1]
+    ]
+    return SpaceReport(
+        files=files, objects=objects,
+        reclaim=_estimate_reclaim(password=password, files=files, objects=objects),
+    )
+
+
+def _mib(pages: int) -> str:
+    return f"{pages * _PAGE_BYTES / _MIB:8.1f}"
+
+
+def format_space_report(report: SpaceReport, *, top: int = 15) -> str:
+    lines = ["Files:"]
+    for f in report.files:
+        lines.append(f"  {f.name:<24} {f.type_desc:<5} size {_mib(f.size_pages)} MiB  "
+                     f"used {_mib(f.used_pages)} MiB  free {_mib(f.free_pages)} MiB")
+    lines.append("")
+    lines.append(f"Top {min(top, len(report.objects))} objects by reserved space (MiB):")
+    lines.append(f"  {'table':<32} {'index':<24} {'rows':>10} {'reserved':>8} {'used':>8} "
+                 f"{'in-row':>8} {'LOB':>8} {'overflow':>8}")
+    for o in report.objects[:top]:
+        lines.append(f"  {o.table_name:<32} {o.index_name[:24]:<24} {o.row_count:>10,} "
+                     f"{_mib(o.reserved_pages)} {_mib(o.used_pages)} {_mib(o.in_row_pages)} "
+                     f"{_mib(o.lob_pages)} {_mib(o.overflow_pages)}")
+    if report.reclaim:
+        r = report.reclaim
+        lines += [
+            "",
+            "Reclaim estimate (holdings_current.sql + drop raw heap + SHRINKFILE), before running it:",
+            f"  drops {_RAW_TABLE:<28} {r.raw_reserved_bytes / _MIB:8.1f} MiB reserved",
+            f"  rebuilds {_MODEL_TABLE:<25} {r.old_model_bytes / _MIB:8.1f} MiB now -> "
+            f"<= {r.model_upper_bound_bytes / _MIB:.1f} MiB ({r.model_rows:,} rows, before columnstore)",
+            f"  frees >= {r.freed_in_file_bytes / _MIB:.1f} MiB inside the data file; "
+            f"shrink returns ~{r.returned_to_volume_bytes / _MIB:.1f} MiB to the volume",
+        ]
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=15, help="objects to list (default: 15)")
+    parser.add_argument("--json", action="store_true", help="emit machine-readable JSON")
+    args = parser.parse_args()
+
+    password = os.environ.get("MSSQL_SA_PASSWORD")
+    if not password:
+        print("export MSSQL_SA_PASSWORD before running space_report.py", file=sys.stderr)
+        return 2
+
+    report = read_space_report(password=password)
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(format_space_report(report, top=args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -19,6 +19,18 @@ Assertions map 1:1 to docs/specs/loopcapital-onprem-read-write-sandbox.md §3:
     INV-4  neither principal holds sysadmin/db_owner
     INV-5  both principals CAN read dbo (a boundary that blocks reads is broken, not safe)
 
+The matrix is split into independent probes — one principal, one connection, one
+transaction each — and the probes run concurrently, so a full pass costs roughly its
+slowest probe rather than the sum of all of them. Every probe is rolled back when it
+finishes (including the engineer's own-schema writes, unless --keep), so a denial that
+wrongly SUCCEEDS never leaves its damage behind, and probes cannot see each other's work.
+Each assertion reports how long its statement took.
+
+`--repeat N` is the soak mode: the whole matrix runs N times back to back, each round
+concurrent, and the summary counts how often each assertion held. A permission-engine
+regression that only shows under concurrent sessions (a cached permission check, a grant
+racing a login) surfaces as e.g. 19/20 rather than hiding behind one lucky single shot.
+
 Exit codes (contract, §2):
     0  every assertion held
     1  a boundary assertion FAILED — something did what it must not
@@ -28,14 +40,21 @@ Usage:
     export MSSQL_SA_PASSWORD='<throwaway-local-password>'
     export BRIGHTAGENT_READER_PASSWORD='...' BRIGHTAGENT_ENGINEER_PASSWORD='...'
     uv run --with pymssql python governed_write_check.py
+    uv run --with pymssql python governed_write_check.py --repeat 50     # soak
+    uv run --with pymssql python governed_write_check.py --workers 1     # one probe at a time
 """
 
 from __future__ import annotations
 
 import argparse
 import os
+import statistics
 import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from typing import Final
 
 import pymssql
@@ -65,11 +84,26 @@ class Assertion:
     description: str
     passed: bool
     detail: str = ""
+    seconds: float = 0.0
 
     def render(self) -> str:
         mark = "PASS" if self.passed else "FAIL"
         tail = f" — {self.detail}" if self.detail else ""
-        return f"{mark} {self.invariant} {self.description}{tail}"
+        return f"{mark} {self.invariant} {self.description}{tail} ({self.seconds * 1000:.0f} ms)"
+
+
+@dataclass(frozen=True)
+class Probe:
+    """An independent slice of the matrix: one principal, one connection, one transaction.
+
+    `run` makes its assertions on the connection it is handed; the runner rolls the
+    transaction back afterwards unless `commit` is set (only the engineer's own-schema
+    writes under --keep).
+    """
+
+    principal: str
+    run: Callable[[pymssql.Connection], list[Assertion]]
+    commit: bool = False
 
 
 def connect(*, user: str, password: str) -> pymssql.Connection:
@@ -153,58 +187,63 @@ def expect_denied(
     boundary that was never tested. That failure mode is silent and permanent, so the error
     number is checked rather than the mere fact of an exception.
     """
+    start = time.perf_counter()
+
+    def verdict(*, passed: bool, detail: str) -> Assertion:
+        return Assertion(
+            invariant=invariant,
+            description=description,
+            passed=passed,
+            detail=detail,
+            seconds=time.perf_counter() - start,
+        )
+
     try:
         with connection.cursor() as cursor:
             cursor.execute(statement)
-        connection.rollback()
     except pymssql.Error as exc:
         number = _error_number(exc)
         if number in PERMISSION_DENIED_ERRORS:
-            return Assertion(invariant=invariant, description=description, passed=True, detail=f"denied ({number})")
+            return verdict(passed=True, detail=f"denied ({number})")
         if number == AMBIGUOUS_DENIED_OR_MISSING and target_object:
             if _object_exists(connection=connection, target_object=target_object):
-                return Assertion(
-                    invariant=invariant,
-                    description=description,
+                return verdict(
                     passed=True,
                     detail=f"denied ({number}; {target_object} resolves, so this is permission, not absence)",
                 )
-            return Assertion(
-                invariant=invariant,
-                description=description,
+            return verdict(
                 passed=False,
                 detail=f"{target_object} does not resolve — fixture missing, boundary NOT tested",
             )
         if number == OBJECT_NOT_FOUND:
-            return Assertion(
-                invariant=invariant,
-                description=description,
+            return verdict(
                 passed=False,
                 detail="target table does not exist — fixture missing, boundary NOT tested",
             )
-        return Assertion(
-            invariant=invariant,
-            description=description,
-            passed=False,
-            detail=f"rejected, but not by a permission check: {_first_line(exc)}",
-        )
-    return Assertion(
-        invariant=invariant,
-        description=description,
-        passed=False,
-        detail="statement SUCCEEDED but must have been denied",
-    )
+        return verdict(passed=False, detail=f"rejected, but not by a permission check: {_first_line(exc)}")
+    # The probe's transaction is rolled back by the runner, so the escalation is undone too.
+    return verdict(passed=False, detail="statement SUCCEEDED but must have been denied")
 
 
 def expect_allowed(*, connection: pymssql.Connection, statement: str, invariant: str, description: str) -> Assertion:
-    """Assert a statement is PERMITTED. A boundary that blocks legitimate work is broken too."""
+    """Assert a statement is PERMITTED. A boundary that blocks legitimate work is broken too.
+
+    Nothing is committed here: the permission check happens when the statement executes,
+    and the probe's transaction is rolled back once the probe is done.
+    """
+    start = time.perf_counter()
     try:
         with connection.cursor() as cursor:
             cursor.execute(statement)
-        connection.commit()
     except pymssql.Error as exc:
-        return Assertion(invariant=invariant, description=description, passed=False, detail=_first_line(exc))
-    return Assertion(invariant=invariant, description=description, passed=True)
+        return Assertion(
+            invariant=invariant,
+            description=description,
+            passed=False,
+            detail=_first_line(exc),
+            seconds=time.perf_counter() - start,
+        )
+    return Assertion(invariant=invariant, description=description, passed=True, seconds=time.perf_counter() - start)
 
 
 def _first_line(exc: pymssql.Error) -> str:
@@ -213,125 +252,139 @@ def _first_line(exc: pymssql.Error) -> str:
     return text[:160]
 
 
-def check_reader(*, password: str) -> list[Assertion]:
-    """INV-5 then INV-1: the reader reads everything and writes nothing."""
-    results: list[Assertion] = []
-    with connect(user=READER, password=password) as connection:
-        results.append(
-            expect_allowed(
-                connection=connection,
-                statement="SELECT TOP 1 portfolio_id FROM dbo.mart_daily_portfolio_exposure",
-                invariant="INV-5",
-                description=f"{READER} can read the client's data",
-            )
-        )
-        results.append(
-            expect_denied(
-                connection=connection,
-                statement=(
-                    "INSERT INTO dbo.raw_positions (portfolio_id, security_id, quantity, as_of_date) "
-                    "VALUES ('PORT-BREACH', 'SEC-BREACH', 1, '2026-01-01')"
-                ),
-                invariant="INV-1",
-                description=f"{READER} cannot INSERT into the client's data",
-            )
-        )
-        results.append(
-            expect_denied(
-                connection=connection,
-                statement=f"UPDATE {CLIENT_TABLE} SET severity = 'BREACHED'",
-                invariant="INV-1",
-                description=f"{READER} cannot UPDATE the client's data",
-            )
-        )
-        results.append(
-            expect_denied(
-                connection=connection,
-                statement=f"CREATE TABLE {AGENT_SCHEMA}.reader_should_not_create (id INT)",
-                invariant="INV-1",
-                description=f"{READER} cannot CREATE tables",
-            )
-        )
-    return results
-
-
-def check_engineer(*, password: str, keep: bool) -> list[Assertion]:
-    """INV-2 and INV-3: writes land inside the agent's own schema and nowhere else."""
-    results: list[Assertion] = []
-    with connect(user=ENGINEER, password=password) as connection:
-        results.append(
-            expect_allowed(
-                connection=connection,
-                statement="SELECT TOP 1 portfolio_id FROM dbo.mart_daily_portfolio_exposure",
-                invariant="INV-5",
-                description=f"{ENGINEER} can read the client's data",
-            )
-        )
+def allowed_probe(*, principal: str, statement: str, invariant: str, description: str) -> Probe:
+    return Probe(
+        principal=principal,
+        run=lambda connection: [
+            expect_allowed(connection=connection, statement=statement, invariant=invariant, description=description)
+        ],
+    )
 
-        # Start from a clean slate so a prior --keep run cannot mask a real failure.
-        _drop_check_table(connection=connection)
 
-        results.append(
-            expect_allowed(
-                connection=connection,
-                statement=(
-                    f"CREATE TABLE {CHECK_TABLE} "
-                    "(portfolio_id VARCHAR(20) NOT NULL, exposure_usd DECIMAL(18,2), "
-                    "checked_at DATETIME2 NOT NULL DEFAULT SYSUTCDATETIME())"
-                ),
-                invariant="INV-2",
-                description=f"{ENGINEER} can CREATE inside its own schema",
-            )
-        )
-        results.append(
-            expect_allowed(
-                connection=connection,
-                # Literal values, deliberately NOT `INSERT ... SELECT FROM dbo`: sourcing from
-                # a client table would make this assertion silently depend on seed state, and
-                # an empty source would insert zero rows while still "succeeding".
-                statement=(
-                    f"INSERT INTO {CHECK_TABLE} (portfolio_id, exposure_usd) "
-                    "VALUES ('PORT-001-GROWTH', 12500000.00), ('PORT-002-INCOME', 8750000.00)"
-                ),
-                invariant="INV-2",
-                description=f"{ENGINEER} can INSERT into its own schema",
-            )
-        )
-        results.append(_verify_rows_landed(connection=connection))
-
-        results.append(
-            expect_denied(
-                connection=connection,
-                statement=f"UPDATE {CLIENT_TABLE} SET severity = 'BREACHED'",
-                invariant="INV-3",
-                description=f"{ENGINEER} cannot UPDATE the client's data",
-            )
-        )
-        results.append(
-            expect_denied(
-                connection=connection,
-                statement="DELETE FROM dbo.raw_positions",
-                invariant="INV-3",
-                description=f"{ENGINEER} cannot DELETE the client's data",
-            )
-        )
-        results.append(
+def denied_probe(
+    *,
+    principal: str,
+    statement: str,
+    invariant: str,
+    description: str,
+    target_object: str | None = None,
+) -> Probe:
+    return Probe(
+        principal=principal,
+        run=lambda connection: [
             expect_denied(
                 connection=connection,
-                statement="ALTER TABLE dbo.raw_positions ADD injected_column INT",
-                invariant="INV-3",
-                description=f"{ENGINEER} cannot ALTER the client's schema",
-                target_object="dbo.raw_positions",
+                statement=statement,
+                invariant=invariant,
+                description=description,
+                target_object=target_object,
             )
-        )
+        ],
+    )
 
-        if not keep:
-            _drop_check_table(connection=connection)  # INV-7: leave no residue
-    return results
+
+def reader_probes() -> list[Probe]:
+    """INV-5 then INV-1: the reader reads everything and writes nothing."""
+    return [
+        allowed_probe(
+            principal=READER,
+            statement="SELECT TOP 1 portfolio_id FROM dbo.mart_daily_portfolio_exposure",
+            invariant="INV-5",
+            description=f"{READER} can read the client's data",
+        ),
+        denied_probe(
+            principal=READER,
+            statement=(
+                "INSERT INTO dbo.raw_positions (portfolio_id, security_id, quantity, as_of_date) "
+                "VALUES ('PORT-BREACH', 'SEC-BREACH', 1, '2026-01-01')"
+            ),
+            invariant="INV-1",
+            description=f"{READER} cannot INSERT into the client's data",
+        ),
+        denied_probe(
+            principal=READER,
+            statement=f"UPDATE {CLIENT_TABLE} SET severity = 'BREACHED'",
+            invariant="INV-1",
+            description=f"{READER} cannot UPDATE the client's data",
+        ),
+        denied_probe(
+            principal=READER,
+            statement=f"CREATE TABLE {AGENT_SCHEMA}.reader_should_not_create (id INT)",
+            invariant="INV-1",
+            description=f"{READER} cannot CREATE tables",
+        ),
+    ]
+
+
+def engineer_probes(*, keep: bool) -> list[Probe]:
+    """INV-2 and INV-3: writes land inside the agent's own schema and nowhere else."""
+    return [
+        allowed_probe(
+            principal=ENGINEER,
+            statement="SELECT TOP 1 portfolio_id FROM dbo.mart_daily_portfolio_exposure",
+            invariant="INV-5",
+            description=f"{ENGINEER} can read the client's data",
+        ),
+        # CREATE -> INSERT -> read back depend on each other, so they share one probe.
+        Probe(principal=ENGINEER, run=_engineer_own_schema_writes, commit=keep),
+        denied_probe(
+            principal=ENGINEER,
+            statement=f"UPDATE {CLIENT_TABLE} SET severity = 'BREACHED'",
+            invariant="INV-3",
+            description=f"{ENGINEER} cannot UPDATE the client's data",
+        ),
+        denied_probe(
+            principal=ENGINEER,
+            statement="DELETE FROM dbo.raw_positions",
+            invariant="INV-3",
+            description=f"{ENGINEER} cannot DELETE the client's data",
+        ),
+        denied_probe(
+            principal=ENGINEER,
+            statement="ALTER TABLE dbo.raw_positions ADD injected_column INT",
+            invariant="INV-3",
+            description=f"{ENGINEER} cannot ALTER the client's schema",
+            target_object="dbo.raw_positions",
+        ),
+    ]
+
+
+def _engineer_own_schema_writes(connection: pymssql.Connection) -> list[Assertion]:
+    """INV-2 as one transaction. Rolled back afterwards (INV-7: leave no residue) unless --keep;
+    SQL Server DDL is transactional, so the CREATE is undone along with the rows."""
+    # Start from a clean slate so a prior --keep run cannot mask a real failure. This drop
+    # commits on its own, before the probe's transaction does any real work.
+    _drop_check_table(connection=connection)
+    return [
+        expect_allowed(
+            connection=connection,
+            statement=(
+                f"CREATE TABLE {CHECK_TABLE} "
+                "(portfolio_id VARCHAR(20) NOT NULL, exposure_usd DECIMAL(18,2), "
+                "checked_at DATETIME2 NOT NULL DEFAULT SYSUTCDATETIME())"
+            ),
+            invariant="INV-2",
+            description=f"{ENGINEER} can CREATE inside its own schema",
+        ),
+        expect_allowed(
+            connection=connection,
+            # Literal values, deliberately NOT `INSERT ... SELECT FROM dbo`: sourcing from
+            # a client table would make this assertion silently depend on seed state, and
+            # an empty source would insert zero rows while still "succeeding".
+            statement=(
+                f"INSERT INTO {CHECK_TABLE} (portfolio_id, exposure_usd) "
+                "VALUES ('PORT-001-GROWTH', 12500000.00), ('PORT-002-INCOME', 8750000.00)"
+            ),
+            invariant="INV-2",
+            description=f"{ENGINEER} can INSERT into its own schema",
+        ),
+        _verify_rows_landed(connection=connection),
+    ]
 
 
 def _verify_rows_landed(*, connection: pymssql.Connection) -> Assertion:
     """A permitted INSERT is only proof if the rows are actually readable afterwards."""
+    start = time.perf_counter()
     try:
         with connection.cursor() as cursor:
             cursor.execute(f"SELECT COUNT(*) FROM {CHECK_TABLE}")
@@ -342,12 +395,14 @@ def _verify_rows_landed(*, connection: pymssql.Connection) -> Assertion:
             description="rows written by the engineer are readable back",
             passed=False,
             detail=_first_line(exc),
+            seconds=time.perf_counter() - start,
         )
     return Assertion(
         invariant="INV-2",
         description="rows written by the engineer are readable back",
         passed=count > 0,
-        detail=f"{count} row(s)" if count else "table is empty after a committed INSERT",
+        detail=f"{count} row(s)" if count else "table is empty after a successful INSERT",
+        seconds=time.perf_counter() - start,
     )
 
 
@@ -361,7 +416,7 @@ def _drop_check_table(*, connection: pymssql.Connection) -> None:
         connection.rollback()
 
 
-def check_cross_database(*, engineer_password: str) -> list[Assertion]:
+def cross_database_probes() -> list[Probe]:
     """The instance hosts more than one database — reads widen across it, writes must not.
 
     Doc 1 grants read on "in-scope DBs" (plural), so catalog and cross-database parity need
@@ -369,56 +424,107 @@ def check_cross_database(*, engineer_password: str) -> list[Assertion]:
     by accident: granting reads across the instance while quietly granting writes with them.
     These assertions exist to make that regression impossible to miss.
     """
-    results: list[Assertion] = []
-    with connect(user=ENGINEER, password=engineer_password) as connection:
-        for database, table in (("OMS", "OMS.dbo.Trades"), ("TradeDW", "TradeDW.dbo.FactTrade")):
-            results.append(
-                expect_allowed(
-                    connection=connection,
-                    statement=f"SELECT TOP 1 Symbol FROM {table}",
-                    invariant="INV-5",
-                    description=f"{ENGINEER} can read {table} (cross-database, three-part name)",
-                )
+    probes: list[Probe] = []
+    for database, table in (("OMS", "OMS.dbo.Trades"), ("TradeDW", "TradeDW.dbo.FactTrade")):
+        probes.append(
+            allowed_probe(
+                principal=ENGINEER,
+                statement=f"SELECT TOP 1 Symbol FROM {table}",
+                invariant="INV-5",
+                description=f"{ENGINEER} can read {table} (cross-database, three-part name)",
             )
-            results.append(
-                expect_denied(
-                    connection=connection,
-                    statement=f"DELETE FROM {table}",
-                    invariant="INV-3",
-                    description=f"{ENGINEER} cannot write to {database} — reads widened, writes did not",
-                    target_object=table,
-                )
+        )
+        probes.append(
+            denied_probe(
+                principal=ENGINEER,
+                statement=f"DELETE FROM {table}",
+                invariant="INV-3",
+                description=f"{ENGINEER} cannot write to {database} — reads widened, writes did not",
+                target_object=table,
             )
-    return results
+        )
+    return probes
 
 
-def check_no_admin_rights(*, reader_password: str, engineer_password: str) -> list[Assertion]:
+def admin_rights_probes() -> list[Probe]:
     """INV-4: a principal that can grant itself more permission has no boundary at all."""
-    results: list[Assertion] = []
-    for principal, password in ((READER, reader_password), (ENGINEER, engineer_password)):
-        try:
-            with connect(user=principal, password=password) as connection, connection.cursor() as cursor:
-                cursor.execute("SELECT IS_SRVROLEMEMBER('sysadmin'), IS_ROLEMEMBER('db_owner')")
-                sysadmin, db_owner = cursor.fetchone()
-        except pymssql.Error as exc:
-            results.append(
-                Assertion(
-                    invariant="INV-4",
-                    description=f"{principal} role membership is checkable",
-                    passed=False,
-                    detail=_first_line(exc),
-                )
-            )
-            continue
-        results.append(
+    return [
+        Probe(principal=principal, run=partial(_check_role_membership, principal=principal))
+        for principal in (READER, ENGINEER)
+    ]
+
+
+def _check_role_membership(connection: pymssql.Connection, *, principal: str) -> list[Assertion]:
+    start = time.perf_counter()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT IS_SRVROLEMEMBER('sysadmin'), IS_ROLEMEMBER('db_owner')")
+            sysadmin, db_owner = cursor.fetchone()
+    except pymssql.Error as exc:
+        return [
             Assertion(
                 invariant="INV-4",
-                description=f"{principal} is neither sysadmin nor db_owner",
-                passed=not sysadmin and not db_owner,
-                detail=f"sysadmin={sysadmin} db_owner={db_owner}",
+                description=f"{principal} role membership is checkable",
+                passed=False,
+                detail=_first_line(exc),
+                seconds=time.perf_counter() - start,
             )
+        ]
+    return [
+        Assertion(
+            invariant="INV-4",
+            description=f"{principal} is neither sysadmin nor db_owner",
+            passed=not sysadmin and not db_owner,
+            detail=f"sysadmin={sysadmin} db_owner={db_owner}",
+            seconds=time.perf_counter() - start,
         )
-    return results
+    ]
+
+
+def build_matrix(*, keep: bool) -> list[Probe]:
+    """Every probe, in report order. None depends on another, so any subset can run at once."""
+    return [*reader_probes(), *engineer_probes(keep=keep), *cross_database_probes(), *admin_rights_probes()]
+
+
+def run_probe(*, probe: Probe, passwords: dict[str, str]) -> list[Assertion]:
+    """Run one probe on its own connection, inside its own transaction.
+
+    Connection errors propagate (exit 2: the check could not run); everything the probe
+    does is rolled back afterwards unless the probe asked to keep it.
+    """
+    with connect(user=probe.principal, password=passwords[probe.principal]) as connection:
+        try:
+            assertions = probe.run(connection)
+            if probe.commit:
+                connection.commit()
+        finally:
+            connection.rollback()  # no-op after a commit
+    return assertions
+
+
+def run_matrix(*, probes: list[Probe], passwords: dict[str, str], workers: int) -> tuple[list[Assertion], float]:
+    """Run every probe, `workers` at a time; returns the assertions in matrix order and the wall time."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        batches = list(executor.map(lambda probe: run_probe(probe=probe, passwords=passwords), probes))
+    return [assertion for batch in batches for assertion in batch], time.perf_counter() - start
+
+
+def summarize_soak(rounds: list[list[Assertion]]) -> list[str]:
+    """One line per assertion across every round: how often it held, and its p50/max latency."""
+    by_check: dict[tuple[str, str], list[Assertion]] = {}
+    for assertions in rounds:
+        for assertion in assertions:
+            by_check.setdefault((assertion.invariant, assertion.description), []).append(assertion)
+    lines = []
+    for (invariant, description), runs in by_check.items():
+        held = sum(run.passed for run in runs)
+        millis = [run.seconds * 1000 for run in runs]
+        lines.append(
+            f"{'PASS' if held == len(runs) else 'FAIL'} {held:>4}/{len(runs):<4} "
+            f"p50 {statistics.median(millis):6.0f} ms  max {max(millis):6.0f} ms  {invariant} {description}"
+        )
+    return lines
 
 
 def main() -> int:
@@ -426,9 +532,24 @@ def main() -> int:
     parser.add_argument(
         "--keep",
         action="store_true",
-        help="leave the engineer's table in place for manual inspection (default: drop it)",
+        help="leave the engineer's table in place for manual inspection (default: roll it back)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        metavar="N",
+        help="soak mode: run the whole matrix N times and report how often each assertion held (default: 1)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="probes in flight at once, one connection each (default: every probe at once)",
     )
     args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
 
     reader_password = os.environ.get("BRIGHTAGENT_READER_PASSWORD")
     engineer_password = os.environ.get("BRIGHTAGENT_ENGINEER_PASSWORD")
@@ -440,24 +561,40 @@ def main() -> int:
         )
         return 2
 
-    print(f"Governed read/write boundary — {HOST}:{PORT}/{DATABASE}\n")
+    probes = build_matrix(keep=args.keep)
+    workers = args.workers or len(probes)
+    passwords = {READER: reader_password, ENGINEER: engineer_password}
+
+    print(f"Governed read/write boundary — {HOST}:{PORT}/{DATABASE}")
+    print(f"{len(probes)} probes, {workers} at a time, {args.repeat} round(s)\n")
+    rounds: list[list[Assertion]] = []
     try:
-        results = [
-            *check_reader(password=reader_password),
-            *check_engineer(password=engineer_password, keep=args.keep),
-            *check_cross_database(engineer_password=engineer_password),
-            *check_no_admin_rights(reader_password=reader_password, engineer_password=engineer_password),
-        ]
+        for round_number in range(1, args.repeat + 1):
+            results, wall_s = run_matrix(probes=probes, passwords=passwords, workers=workers)
+            rounds.append(results)
+            failed = [result for result in results if not result.passed]
+            if args.repeat == 1:
+                for result in results:
+                    print(result.render())
+                statement_s = sum(result.seconds for result in results)
+                print(f"\n{len(results) - len(failed)}/{len(results)} assertions held "
+                      f"in {wall_s:.2f}s wall ({statement_s:.2f}s of statements).")
+            else:
+                print(f"round {round_number:>4}/{args.repeat}: {len(results) - len(failed)}/{len(results)} held "
+                      f"in {wall_s:.2f}s")
+                for result in failed:
+                    print(f"    {result.render()}")
     except pymssql.Error as exc:
         print(f"ERROR: could not connect as a governed principal — {_first_line(exc)}", file=sys.stderr)
         print("Is the sandbox up (./setup.sh), and do the passwords match?", file=sys.stderr)
         return 2
 
-    for result in results:
-        print(result.render())
+    if args.repeat > 1:
+        print(f"\nAcross {args.repeat} rounds:")
+        for line in summarize_soak(rounds):
+            print(f"  {line}")
 
-    failed = [result for result in results if not result.passed]
-    print(f"\n{len(results) - len(failed)}/{len(results)} assertions held.")
+    failed = [result for results in rounds for result in results if not result.passed]
     if failed:
         print(f"{len(failed)} BOUNDARY FAILURE(S) — a principal did something it must not.", file=sys.stderr)
         return 1
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""Benchmark manifest assembly in introspect_local.py — no database needed.
+
+Builds a synthetic catalog (default 2,000 tables / 50,000 columns of mixed types) and times
+turning it into a `SchemaManifest`:
+
+  four-query      the previous path: column flags, PK set and row estimates as separate
+                  lookups joined onto INFORMATION_SCHEMA-shaped rows, a ColumnSpec per column
+  per-model       the joined rows `fetch_catalog` returns, a ColumnSpec per column
+  model_construct the joined rows validated once with a TypeAdapter, models built unvalidated
+  validate-once   `build_manifest`: the joined rows grouped into plain dicts, one
+                  SchemaManifest.model_validate (the current path)
+
+Python-side, four-query, per-model and validate-once land within a few percent of each other
+and swap places from run to run (e.g. validate-once at 0.97x/0.85x/1.01x of four-query against
+per-model at 0.96x/0.92x/1.02x over three runs): all of them spend most of their time creating
+50k model instances. model_construct is pure Python in pydantic 2 and is consistently slowest
+(0.66x-0.74x). What
+the joined query removes is on the database side — three extra catalog round trips and the
+INFORMATION_SCHEMA views — which this benchmark does not model; time `introspect_local.py`
+against the container for that. Run it a few times before reading much into one ratio.
+
+Every manifest is compared field for field with the four-query one before numbers are printed.
+
+Usage (from repo root):
+    uv run --with pymssql --with pydantic python \\
+        clients/trials/loopcapital/sandbox/manifest/bench_introspect.py
+    ... --tables 200 --columns-per-table 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+from pydantic import TypeAdapter
+
+from introspect_local import CatalogRow, _catalog_sql_type, build_manifest, reconstruct_sql_type
+from manifest_model import SANDBOX_DATABASE, CaptureSource, ColumnSpec, KeyRole, SchemaManifest, TableSpec
+
+CAPTURED_AT = "2026-01-01T00:00:00Z"
+
+# (data_type, max_length bytes, precision, scale) as sys.columns reports them.
+_TYPES: list[tuple[str, int, int, int]] = [
+    ("int", 4, 10, 0),
+    ("bigint", 8, 19, 0),
+    ("varchar", 20, 0, 0),
+    ("varchar", -1, 0, 0),
+    ("nvarchar", 100, 0, 0),
+    ("char", 9, 0, 0),
+    ("decimal", 9, 18, 4),
+    ("numeric", 9, 19, 2),
+    ("float", 8, 53, 0),
+    ("date", 3, 10, 0),
+    ("datetime2", 8, 27, 7),
+    ("bit", 1, 1, 0),
+    ("uniqueidentifier", 16, 0, 0),
+]
+
+
+def synthetic_catalog(*, tables: int, columns_per_table: int, seed: int = 7) -> list[CatalogRow]:
+    """Rows in exactly the shape `_CATALOG_QUERY` returns, ordered the same way."""
+    rng = random.Random(seed)
+    rows: list[CatalogRow] = []
+    for t in range(tables):
+        schema = "dbo" if t % 5 else "staging"
+        row_estimate = rng.randrange(0, 5_000_000)
+        for c in range(columns_per_table):
+            data_type, max_length, precision, scale = _TYPES[0] if c == 0 else rng.choice(_TYPES)
+            rows.append((
+                schema, f"table_{t:05d}", f"column_{c:03d}", data_type, max_length, precision, scale,
+                c > 0 and rng.random() < 0.6, c == 0 and t % 3 == 0, c == columns_per_table - 1 and t % 7 == 0,
+                c == 0, row_estimate,
+            ))
+    return rows
+
+
+def four_query_manifest(*, rows: list[CatalogRow]) -> SchemaManifest:
+    """The previous assembly, fed the same catalog split back into its four result sets."""
+    flags = {(r[0], r[1], r[2]): (r[8], r[9]) for r in rows}
+    pk_columns = {(r[0], r[1], r[2]) for r in rows if r[10]}
+    row_estimates = {(r[0], r[1]): r[11] for r in rows}
+    info_schema = [
+        (r[0], r[1], r[2], r[3],
+         r[4] // 2 if r[3] == "nvarchar" and r[4] != -1 else r[4], r[5], r[6], "YES" if r[7] else "NO")
+        for r in rows
+    ]
+
+    tables: dict[str, TableSpec] = {}
+    for schema, table, column, data_type, char_len, precision, scale, is_nullable in info_schema:
+        qualified = f"{schema}.{table}"
+        identity, computed = flags.get((schema, table, column), (False, False))
+        column_spec = ColumnSpec(
+            name=column,
+            sql_type=reconstruct_sql_type(data_type=data_type, char_len=char_len, precision=precision, scale=scale),
+            nullable=(is_nullable == "YES"),
+            key=KeyRole.PRIMARY if (schema, table, column) in pk_columns else KeyRole.NONE,
+            identity=identity,
+            computed=computed,
+        )
+        if qualified not in tables:
+            tables[qualified] = TableSpec(name=qualified, columns=[], row_estimate=row_estimates.get((schema, table), 0))
+        tables[qualified].columns.append(column_spec)
+    return SchemaManifest(
+        captured_at=CAPTURED_AT,
+        source=CaptureSource.LOCAL_INTROSPECT,
+        database=SANDBOX_DATABASE,
+        tables=[tables[name] for name in sorted(tables)],
+    )
+
+
+def per_model_manifest(*, rows: list[CatalogRow]) -> SchemaManifest:
+    tables: dict[str, TableSpec] = {}
+    for (
+        schema, table, column, data_type, max_length, precision, scale,
+        nullable, identity, computed, primary, estimate,
+    ) in rows:
+        qualified = f"{schema}.{table}"
+        spec = tables.get(qualified)
+        if spec is None:
+            spec = tables[qualified] = TableSpec(name=qualified, columns=[], row_estimate=estimate)
+        spec.columns.append(ColumnSpec(
+            name=column, sql_type=_catalog_sql_type(data_type, max_length, precision, scale), nullable=nullable,
+            key=KeyRole.PRIMARY if primary else KeyRole.NONE, identity=identity, computed=computed,
+        ))
+    return SchemaManifest(
+        captured_at=CAPTURED_AT, source=CaptureSource.LOCAL_INTROSPECT, database=SANDBOX_DATABASE,
+        tables=[tables[name] for name in sorted(tables)],
+    )
+
+
+_CATALOG_ROWS: TypeAdapter[list[CatalogRow]] = TypeAdapter(list[CatalogRow])
+
+
+def model_construct_manifest(*, rows: list[CatalogRow]) -> SchemaManifest:
+    tables: dict[str, TableSpec] = {}
+    for (
+        schema, table, column, data_type, max_length, precision, scale,
+        nullable, identity, computed, primary, estimate,
+    ) in _CATALOG_ROWS.validate_python(rows):
+        qualified = f"{schema}.{table}"
+        spec = tables.get(qualified)
+        if spec is None:
+            spec = tables[qualified] = TableSpec.model_construct(name=qualified, columns=[], row_estimate=estimate)
+        spec.columns.append(ColumnSpec.model_construct(
+            name=column, sql_type=_catalog_sql_type(data_type, max_length, precision, scale), nullable=nullable,
+            key=KeyRole.PRIMARY if primary else KeyRole.NONE, identity=identity, computed=computed,
+        ))
+    return SchemaManifest.model_construct(
+        captured_at=CAPTURED_AT, source=CaptureSource.LOCAL_INTROSPECT, database=SANDBOX_DATABASE,
+        tables=[tables[name] for name in sorted(tables)],
+    )
+
+
+def validate_once_manifest(*, rows: list[CatalogRow]) -> SchemaManifest:
+    return build_manifest(rows=rows, database=SANDBOX_DATABASE, captured_at=CAPTURED_AT)
+
+
+BUILDERS = {
+    "four-query": four_query_manifest,
+    "per-model": per_model_manifest,
+    "model_construct": model_construct_manifest,
+    "validate-once": validate_once_manifest,
+}
+
+
+def _best_of(*, repeats: int, build, rows: list[CatalogRow]) -> tuple[float, SchemaManifest]:
+    best, manifest = float("inf"), None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        manifest = build(rows=rows)
+        best = min(best, time.perf_counter() - start)
+    return best, manifest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", type=int, default=2_000)
+    parser.add_argument("--columns-per-table", type=int, default=25)
+    parser.add_argument("--repeats", type=int, default=5, help="best-of-N timing (default: 5)")
+    args = parser.parse_args()
+
+    rows = synthetic_catalog(tables=args.tables, columns_per_table=args.columns_per_table)
+    print(f"Synthetic catalog: {args.tables:,} tables, {len(rows):,} columns")
+
+    baseline_s, baseline = _best_of(repeats=args.repeats, build=four_query_manifest, rows=rows)
+    expected = baseline.model_dump(mode="json")
+    for name, build in BUILDERS.items():
+        seconds, manifest = (
+            (baseline_s, baseline) if build is four_query_manifest
+            else _best_of(repeats=args.repeats, build=build, rows=rows)
+        )
+        if manifest.model_dump(mode="json") != expected:
+            print(f"{name} manifest differs from the four-query manifest", file=sys.stderr)
+            return 1
+        print(f"  {name:<16} {seconds * 1000:8.1f} ms ({len(rows) / seconds:>10,.0f} columns/s)   "
+              f"{baseline_s / seconds:4.2f}x")
+    print("All manifests are identical.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
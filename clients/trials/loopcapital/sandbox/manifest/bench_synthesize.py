@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark the row vs columnar synthetic generators — no database needed.
+
+Times generation only (the part `apply_schema_and_seed` does in Python before handing batches to
+the driver) for every seedable table in the manifest, and checks INV-10 for the columnar mode by
+generating each table twice more and comparing SHA-256 digests of the rows (untimed). Falls back to a
+representative mixed-type table when no manifest has been captured yet.
+
+Usage (from repo root):
+    uv run --with pymssql --with pydantic --with numpy python \\
+        clients/trials/loopcapital/sandbox/manifest/bench_synthesize.py --rows 1000000
+    ... --skip-row     # 1M rows per table is slow in row mode; time only columnar
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import sys
+import time
+from pathlib import Path
+
+from manifest_model import ColumnSpec, KeyRole, TableSpec, load_manifest
+from synthesize import (
+    DEFAULT_SEED,
+    MANIFEST_PATH,
+    _seedable_columns,
+    synth_columns,
+    synth_rows,
+)
+
+BENCH_TABLE = TableSpec(
+    name="dbo.bench_positions",
+    columns=[
+        ColumnSpec(name="position_id", sql_type="INT", nullable=False, key=KeyRole.PRIMARY),
+        ColumnSpec(name="portfolio_code", sql_type="VARCHAR(20)", nullable=False),
+        ColumnSpec(name="cusip", sql_type="CHAR(9)", nullable=True),
+        ColumnSpec(name="quantity", sql_type="DECIMAL(18,4)", nullable=False),
+        ColumnSpec(name="market_value", sql_type="DECIMAL(19,2)", nullable=True),
+        ColumnSpec(name="weight", sql_type="FLOAT", nullable=True),
+        ColumnSpec(name="as_of_date", sql_type="DATE", nullable=False),
+        ColumnSpec(name="loaded_at", sql_type="DATETIME2", nullable=True),
+        ColumnSpec(name="is_active", sql_type="BIT", nullable=False),
+        ColumnSpec(name="batch_guid", sql_type="UNIQUEIDENTIFIER", nullable=True),
+    ],
+)
+
+
+def _time(*, generate, table: TableSpec, rows: int, seed: int) -> float:
+    """Seconds to generate every row of `table` (materialized, as the insert path does)."""
+    columns = _seedable_columns(table)
+    start = time.perf_counter()
+    produced = sum(len(chunk) for chunk in generate(table=table, columns=columns, rows=rows, seed=seed))
+    elapsed = time.perf_counter() - start
+    assert produced == rows
+    return elapsed
+
+
+def _digest(*, generate, table: TableSpec, rows: int, seed: int) -> str:
+    """SHA-256 over every row's repr — the INV-10 fingerprint (untimed)."""
+    digest = hashlib.sha256()
+    for chunk in generate(table=table, columns=_seedable_columns(table), rows=rows, seed=seed):
+        for row in chunk:
+            digest.update(repr(row).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows per table (default: 1,000,000)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--manifest", type=Path, default=MANIFEST_PATH)
+    parser.add_argument("--skip-row", action="store_true", help="skip the (slow) row generator")
+    args = parser.parse_args()
+
+    if args.manifest.exists():
+        tables = [t for t in load_manifest(path=args.manifest).tables if _seedable_columns(t)]
+        print(f"{len(tables)} tables from {args.manifest.name}, {args.rows:,} rows each")
+    else:
+        tables = [BENCH_TABLE]
+        print(f"No manifest at {args.manifest} — using {BENCH_TABLE.name} "
+              f"({len(BENCH_TABLE.columns)} mixed-type columns), {args.rows:,} rows")
+
+    totals = {"row": 0.0, "columnar": 0.0}
+    for table in tables:
+        columnar_s = _time(generate=synth_columns, table=table, rows=args.rows, seed=args.seed)
+        first = _digest(generate=synth_columns, table=table, rows=args.rows, seed=args.seed)
+        second = _digest(generate=synth_columns, table=table, rows=args.rows, seed=args.seed)
+        if first != second:
+            print(f"  {table.name}: columnar output differs between runs — INV-10 violated", file=sys.stderr)
+            return 1
+        totals["columnar"] += columnar_s
+        line = f"  {table.name:<40} columnar {columnar_s:7.2f}s ({args.rows / columnar_s:>12,.0f} rows/s)"
+        if not args.skip_row:
+            row_s = _time(generate=synth_rows, table=table, rows=args.rows, seed=args.seed)
+            totals["row"] += row_s
+            line += f"   row {row_s:7.2f}s ({args.rows / row_s:>10,.0f} rows/s)   {row_s / columnar_s:4.1f}x"
+        print(line)
+
+    print(f"\nColumnar total {totals['columnar']:.2f}s — byte-identical across runs (INV-10 holds).")
+    if not args.skip_row:
+        print(f"Row total      {totals['row']:.2f}s — {totals['row'] / totals['columnar']:.1f}x slower.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,19 +1,27 @@
 #!/usr/bin/env python3
 """Capture the sandbox schema shape READ-ONLY from staging platform-core (BH-1404, production path).
 
-Runs a single authenticated GraphQL query against `api.staging.brighthive.net` for one workspace's
-data assets, then maps each asset's `fields` into a faithful `schema_manifest.json` (source=staging).
+Runs authenticated GraphQL queries against `api.staging.brighthive.net` for one workspace's data
+assets, then maps each asset's `fields` into a faithful `schema_manifest.json` (source=staging).
 This is how the committed shape stays current with what the platform actually catalogued for Frank's
 on-prem SQL Server stack — the assets land in the catalog via an OpenMetadata scan of the
 Brighthive-owned stand-in, never by touching Loop Capital's real server (INV-11).
 
 Guarantees baked in:
-  * READ-ONLY — one GraphQL *query*, no mutation.
+  * READ-ONLY — GraphQL *queries* only, no mutation.
   * The bearer token is read from `$BH_API_TOKEN` and NEVER written to disk (INV-8). SSO separately
     (the token is minted by a normal staging login) and export it before running.
   * No real Loop Capital rows are ever produced (INV-9) — this captures shape only: table + column
     types. Row synthesis happens later, deterministically, in `synthesize.py`.
 
+Large workspaces are captured a page at a time (`dataAssets(pagination: {limit, offset})`,
+`--page-size` assets per request) so no single request approaches `HTTP_TIMEOUT_S`. The first
+page reports `resultCount`; the remaining pages are fetched concurrently (`--concurrency`). Each
+page is appended to a checkpoint under `_raw/` as soon as it lands, so an interrupted capture
+re-run with the same arguments fetches only the pages it is missing (`--fresh` starts over). The
+manifest is then assembled by streaming the checkpoint one page at a time — only the mapped
+tables are held, never the whole response.
+
 The staging catalog carries OpenMetadata-style *logical* column types (INT / DECIMAL / VARCHAR ...),
 not the physical SQL Server DDL, so the emitted types are a documented approximation. For the
 byte-faithful shape used by the round-trip smoke test, use `introspect_local.py` instead.
@@ -22,7 +30,7 @@ Usage (from repo root, via `make capture-loopcapital`):
     export BH_API_TOKEN='<staging bearer token from an SSO login>'
     uv run --with pymssql --with pydantic python \\
         clients/trials/loopcapital/sandbox/manifest/capture_from_staging.py \\
-        --workspace-id <staging-loopcapital-workspace-uuid>
+        --workspace-id <staging-loopcapital-workspace-uuid> [--page-size 200] [--concurrency 4] [--fresh]
 """
 
 from __future__ import annotations
@@ -33,6 +41,8 @@ import json
 import os
 import sys
 import urllib.request
+from collections.abc import Iterable, Iterator
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Final
 
@@ -55,14 +65,17 @@ API_URL_ENV: Final[str] = "BH_API_URL"
 WORKSPACE_ENV: Final[str] = "BH_WORKSPACE_ID"
 HTTP_TIMEOUT_S: Final[int] = 60
 DEFAULT_SCHEMA: Final[str] = "dbo"
+DEFAULT_PAGE_SIZE: Final[int] = 200  # assets per request — small enough to stay well inside HTTP_TIMEOUT_S
+DEFAULT_CONCURRENCY: Final[int] = 4  # pages in flight at once
 
-# Workspace-scoped, READ-ONLY. Column shape comes from `fields`; row data is never requested.
+# Workspace-scoped, READ-ONLY, one page of assets per request. Column shape comes from `fields`;
+# row data is never requested.
 CAPTURE_QUERY: Final[str] = """
-query CaptureLoopCapitalShape($input: WorkspaceInput!) {
+query CaptureLoopCapitalShape($input: WorkspaceInput!, $limit: Int!, $offset: Int!) {
   workspace(input: $input) {
     id
     name
-    dataAssets {
+    dataAssets(pagination: {limit: $limit, offset: $offset}) {
       resultCount
       dataAssets {
         id
@@ -132,10 +145,15 @@ def qualified_table_name(*, asset: dict) -> str:
     return f"{DEFAULT_SCHEMA}.{parts[-1]}" if parts else f"{DEFAULT_SCHEMA}.unknown_table"
 
 
-def run_query(*, api_url: str, token: str, workspace_id: str) -> dict:
-    """POST the READ-ONLY capture query with a bearer token; return the parsed JSON body."""
+def run_query(
+    *, api_url: str, token: str, workspace_id: str, offset: int = 0, limit: int = DEFAULT_PAGE_SIZE
+) -> dict:
+    """POST the READ-ONLY capture query for one page of assets; return the parsed JSON body."""
     payload = json.dumps(
-        {"query": CAPTURE_QUERY, "variables": {"input": {"workspaceId": workspace_id}}}
+        {
+            "query": CAPTURE_QUERY,
+            "variables": {"input": {"workspaceId": workspace_id}, "limit": limit, "offset": offset},
+        }
     ).encode("utf-8")
     request = urllib.request.Request(
         api_url,
@@ -150,24 +168,40 @@ def run_query(*, api_url: str, token: str, workspace_id: str) -> dict:
     return body
 
 
-def build_manifest(*, workspace: dict, captured_at: str) -> SchemaManifest:
-    """Map a workspace's data assets into a shape-only manifest (source=staging, no rows)."""
-    assets = (workspace.get("dataAssets") or {}).get("dataAssets") or []
+def table_from_asset(*, asset: dict) -> TableSpec | None:
+    """One data asset's shape as a table, or None when the catalog has no fields for it."""
+    fields = asset.get("fields") or []
+    if not fields:
+        return None  # a shape sandbox needs typed columns; skip assets the catalog has no fields for
+    columns = [
+        ColumnSpec(
+            name=field["name"],
+            sql_type=to_sqlserver_type(data_type=field["dataType"]),
+            nullable=True,  # staging catalog does not expose nullability — permissive default
+            key=KeyRole.NONE,  # nor keys; introspect_local recovers PKs from the real backend
+        )
+        for field in fields
+    ]
+    return TableSpec(name=qualified_table_name(asset=asset), columns=columns, row_estimate=0)
+
+
+def build_manifest(*, assets: Iterable[dict], captured_at: str) -> SchemaManifest:
+    """Map data assets into a shape-only manifest (source=staging, no rows).
+
+    `assets` is consumed once, lazily, so a caller can stream it page by page; only the mapped
+    tables are kept. An asset seen twice (offset pages shifting under a live catalog) counts once.
+    """
+    seen: set[str] = set()
     tables: list[TableSpec] = []
     for asset in assets:
-        fields = asset.get("fields") or []
-        if not fields:
-            continue  # a shape sandbox needs typed columns; skip assets the catalog has no fields for
-        columns = [
-            ColumnSpec(
-                name=field["name"],
-                sql_type=to_sqlserver_type(data_type=field["dataType"]),
-                nullable=True,  # staging catalog does not expose nullability — permissive default
-                key=KeyRole.NONE,  # nor keys; introspect_local recovers PKs from the real backend
-            )
-            for field in fields
-        ]
-        tables.append(TableSpec(name=qualified_table_name(asset=asset), columns=columns, row_estimate=0))
+        asset_id = asset.get("id")
+        if asset_id is not None:
+            if asset_id in seen:
+                continue
+            seen.add(asset_id)
+        table = table_from_asset(asset=asset)
+        if table is not None:
+            tables.append(table)
 
     tables.sort(key=lambda table: table.name)  # diff-stable ordering
     return SchemaManifest(
@@ -178,11 +212,160 @@ def build_manifest(*, workspace: dict, captured_at: str) -> SchemaManifest:
     )
 
 
+def _page_assets(*, body: dict) -> tuple[dict, list[dict]]:
+    """(workspace, this page's assets) from a response body; RuntimeError if no workspace."""
+    workspace = (body.get("data") or {}).get("workspace")
+    if not workspace:
+        raise RuntimeError("no workspace returned — check the id and the token's access")
+    return workspace, (workspace.get("dataAssets") or {}).get("dataAssets") or []
+
+
+class CaptureCheckpoint:
+    """Append-only JSONL record of a capture in progress: a header line, then one line per page.
+
+    The header pins what the pages belong to (workspace, endpoint, page size, resultCount,
+    captured_at); a checkpoint whose header doesn't match the current arguments is not resumed.
+    Lines are written whole and flushed as each page lands, so a crash loses at most the pages
+    in flight; a torn last line is cut off on resume, before new pages are appended after it.
+    The token is never written — it is not part of any response body.
+    """
+
+    def __init__(self, *, path: Path) -> None:
+        self.path = path
+        self.header: dict | None = None
+        self.done_offsets: set[int] = set()
+
+    def load(self, *, expect: dict) -> bool:
+        """Pick up a previous run's pages if its header matches `expect`; True when resuming."""
+        if not self.path.exists():
+            return False
+        self._truncate_torn_tail()
+        lines = self._lines()
+        header = next(lines, None)
+        if not header or any(header.get(key) != value for key, value in expect.items()):
+            return False
+        self.header = header
+        self.done_offsets = {page["offset"] for page in lines}
+        return True
+
+    def start(self, *, header: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(header) + "\n")
+        self.header = header
+        self.done_offsets = set()
+
+    def append_page(self, *, offset: int, assets: list[dict]) -> None:
+        with self.path.open("a") as handle:
+            handle.write(json.dumps({"offset": offset, "assets": assets}) + "\n")
+        self.done_offsets.add(offset)
+
+    def pages(self) -> Iterator[tuple[int, list[dict]]]:
+        """Every checkpointed (offset, assets) page, streamed one at a time (page order doesn't
+        matter: `build_manifest` sorts tables by name)."""
+        for page in self._lines(skip_header=True):
+            yield page["offset"], page["assets"]
+
+    def _lines(self, *, skip_header: bool = False) -> Iterator[dict]:
+        with self.path.open() as handle:
+            if skip_header:
+                next(handle, None)
+            for line in handle:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # a torn line; the caller checks every offset is still covered
+
+    def _truncate_torn_tail(self) -> None:
+        """Cut the file back to its last complete line, so appended pages can't land behind a torn one."""
+        with self.path.open("r+b") as handle:
+            keep = 0
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                keep += len(line)
+            if keep < handle.seek(0, os.SEEK_END):
+                print(f"  Dropping a torn write at the end of {self.path.name}; its page will be re-fetched.")
+                handle.truncate(keep)
+
+
+def capture_pages(
+    *,
+    api_url: str,
+    token: str,
+    workspace_id: str,
+    checkpoint: CaptureCheckpoint,
+    page_size: int,
+    concurrency: int,
+    captured_at: str,
+    fresh: bool,
+) -> dict:
+    """Fetch every page of the workspace's assets into `checkpoint`; returns its header.
+
+    Resumes from the checkpoint unless `fresh`. The first page (synchronous) supplies the
+    workspace name and `resultCount`; the rest are fetched `concurrency` at a time and
+    checkpointed as each completes. A failed page stops the capture: queued pages are cancelled,
+    pages already in flight are still checkpointed, and the next run picks up from there.
+    """
+    expect = {"workspace_id": workspace_id, "api_url": api_url, "page_size": page_size}
+    if not fresh and checkpoint.load(expect=expect):
+        print(f"  Resuming from {checkpoint.path.name}: {len(checkpoint.done_offsets)} page(s) already captured.")
+    else:
+        workspace, assets = _page_assets(
+            body=run_query(api_url=api_url, token=token, workspace_id=workspace_id, offset=0, limit=page_size)
+        )
+        result_count = int((workspace.get("dataAssets") or {}).get("resultCount") or len(assets))
+        checkpoint.start(
+            header={**expect, "workspace_name": workspace.get("name"), "result_count": result_count,
+                    "captured_at": captured_at}
+        )
+        checkpoint.append_page(offset=0, assets=assets)
+
+    result_count = checkpoint.header["result_count"]
+    pending = [o for o in range(0, result_count, page_size) if o not in checkpoint.done_offsets]
+    total_pages = len(range(0, result_count, page_size)) or 1
+    print(f"  {result_count} assets in {total_pages} page(s) of {page_size}; {len(pending)} to fetch.")
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        futures = {
+            pool.submit(run_query, api_url=api_url, token=token, workspace_id=workspace_id,
+                        offset=offset, limit=page_size): offset
+            for offset in pending
+        }
+        error: Exception | None = None
+        for future in as_completed(futures):
+            offset = futures[future]
+            try:
+                _, assets = _page_assets(body=future.result())
+            except CancelledError:
+                continue
+            except (OSError, ValueError, RuntimeError) as exc:
+                # Stop queueing more pages, but still checkpoint the ones already in flight.
+                if error is None:
+                    error = exc
+                    for other in futures:
+                        other.cancel()
+                continue
+            checkpoint.append_page(offset=offset, assets=assets)
+            print(f"    page @{offset}: {len(assets)} assets ({len(checkpoint.done_offsets)}/{total_pages} pages)")
+    if error is not None:
+        raise error
+    return checkpoint.header
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument("--workspace-id", default=os.environ.get(WORKSPACE_ENV), help=f"staging workspace UUID (or ${WORKSPACE_ENV})")
     parser.add_argument("--out", type=Path, default=MANIFEST_PATH, help="output manifest path")
     parser.add_argument("--api-url", default=os.environ.get(API_URL_ENV, STAGING_API_URL), help=f"GraphQL endpoint (or ${API_URL_ENV})")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE,
+                        help=f"assets per request (default: {DEFAULT_PAGE_SIZE})")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"pages fetched at once (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--fresh", action="store_true", help="ignore any checkpoint from an interrupted run")
     args = parser.parse_args()
 
     token = os.environ.get(TOKEN_ENV)
@@ -195,23 +378,49 @@ def main() -> int:
 
     captured_at = datetime.datetime.now(datetime.UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
     print(f"Capturing workspace {args.workspace_id} shape from {args.api_url} (READ-ONLY)...")
-    body = run_query(api_url=args.api_url, token=token, workspace_id=args.workspace_id)
 
-    workspace = (body.get("data") or {}).get("workspace")
-    if not workspace:
-        print(f"no workspace returned for {args.workspace_id} — check the id and the token's access", file=sys.stderr)
+    # The checkpoint doubles as the raw dump for debugging — gitignored, and the token is NEVER
+    # part of any response body. It is renamed to `raw_path` once the capture completes.
+    checkpoint = CaptureCheckpoint(path=RAW_DIR / f"capture_{args.workspace_id}.partial.jsonl")
+    raw_path = RAW_DIR / f"capture_{args.workspace_id}.jsonl"
+    try:
+        header = capture_pages(
+            api_url=args.api_url, token=token, workspace_id=args.workspace_id, checkpoint=checkpoint,
+            page_size=args.page_size, concurrency=args.concurrency, captured_at=captured_at, fresh=args.fresh,
+        )
+    except (OSError, ValueError, RuntimeError) as exc:  # URLError/timeouts are OSErrors
+        print(f"capture stopped: {exc}", file=sys.stderr)
+        if checkpoint.done_offsets:
+            print(f"  {len(checkpoint.done_offsets)} page(s) kept in {checkpoint.path} — re-run to resume.",
+                  file=sys.stderr)
         return 1
 
-    # Raw dump for debugging only — gitignored, and the token is NEVER part of the response body.
-    RAW_DIR.mkdir(parents=True, exist_ok=True)
-    raw_path = RAW_DIR / f"capture_{args.workspace_id}.json"
-    raw_path.write_text(json.dumps(body, indent=2) + "\n")
+    asset_ids = set()
+    read_offsets: set[int] = set()
+
+    def streamed() -> Iterator[dict]:
+        for offset, assets in checkpoint.pages():
+            read_offsets.add(offset)
+            for asset in assets:
+                asset_ids.add(asset.get("id"))
+                yield asset
 
-    manifest = build_manifest(workspace=workspace, captured_at=captured_at)
+    manifest = build_manifest(assets=streamed(), captured_at=header["captured_at"])
+    missing = sorted(set(range(0, header["result_count"], args.page_size)) - read_offsets)
+    if missing:
+        # Recorded as fetched but unreadable now — never write a manifest short of those tables.
+        print(f"capture incomplete: page(s) at offset {missing} could not be read back from "
+              f"{checkpoint.path} — re-run with --fresh.", file=sys.stderr)
+        return 1
     dump_manifest(manifest=manifest, path=args.out)
+    checkpoint.path.replace(raw_path)
+    if len(asset_ids) != header["result_count"]:
+        # Offset pages over a catalog that changed mid-capture can skip or repeat assets.
+        print(f"WARNING: captured {len(asset_ids)} distinct assets but the catalog reported "
+              f"{header['result_count']} — it changed during the capture; re-run with --fresh.", file=sys.stderr)
 
     total_columns = sum(len(t.columns) for t in manifest.tables)
-    print(f"Captured {workspace.get('name', '?')} -> {args.out}")
+    print(f"Captured {header.get('workspace_name') or '?'} -> {args.out}")
     print(f"  {len(manifest.tables)} tables, {total_columns} columns, source={manifest.source.value}")
     print(f"  raw response: {raw_path} (gitignored)")
     for table in manifest.tables:
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """Introspect OUR OWN sandbox container into a schema manifest (BH-1404, local path).
 
-Reads `INFORMATION_SCHEMA.COLUMNS` + `sys.columns` (identity/computed) + primary-key metadata
-from the running `LoopCapitalAM` container and writes a faithful `schema_manifest.json`. This is
-the dev-bootstrap + round-trip-proof path: it produces the committed manifest from a REAL backend
-(never hand-typed — see test-behavior-real.md), and lets `synthesize.py` rebuild the same shape.
+Reads every user-table column — type, nullability, identity/computed flags, primary-key
+membership and the table's row estimate — from the running `LoopCapitalAM` container in ONE
+joined catalog query (`sys.tables`/`sys.columns`/`sys.indexes`/`sys.partitions`), and writes a
+faithful `schema_manifest.json`. This is the dev-bootstrap + round-trip-proof path: it produces
+the committed manifest from a REAL backend (never hand-typed — see test-behavior-real.md), and
+lets `synthesize.py` rebuild the same shape.
 
 It reads only from the local Brighthive-owned container (source=local-introspect). It NEVER
 connects to Loop Capital's real on-prem server — that is what `capture_from_staging.py` guards
@@ -20,6 +22,7 @@ from __future__ import annotations
 
 import argparse
 import datetime
+import functools
 import os
 import sys
 from pathlib import Path
@@ -30,10 +33,8 @@ import pymssql
 from manifest_model import (
     SANDBOX_DATABASE,
     CaptureSource,
-    ColumnSpec,
     KeyRole,
     SchemaManifest,
-    TableSpec,
     dump_manifest,
 )
 
@@ -63,85 +64,103 @@ def reconstruct_sql_type(
     return data_type.upper()
 
 
-def fetch_column_flags(*, cursor: pymssql.Cursor) -> dict[tuple[str, str, str], tuple[bool, bool]]:
-    """(schema, table, column) -> (is_identity, is_computed) for every user-table column."""
-    cursor.execute(
-        "SELECT SCHEMA_NAME(t.schema_id), t.name, c.name, c.is_identity, c.is_computed "
-        "FROM sys.tables t JOIN sys.columns c ON c.object_id = t.object_id"
-    )
-    return {(row[0], row[1], row[2]): (bool(row[3]), bool(row[4])) for row in cursor.fetchall()}
-
-
-def fetch_primary_key_columns(*, cursor: pymssql.Cursor) -> set[tuple[str, str, str]]:
-    """(schema, table, column) tuples that participate in a primary key."""
-    cursor.execute(
-        "SELECT SCHEMA_NAME(t.schema_id), t.name, c.name "
-        "FROM sys.indexes i "
-        "JOIN sys.index_columns ic ON ic.object_id = i.object_id AND ic.index_id = i.index_id "
-        "JOIN sys.columns c ON c.object_id = ic.object_id AND c.column_id = ic.column_id "
-        "JOIN sys.tables t ON t.object_id = i.object_id "
-        "WHERE i.is_primary_key = 1"
-    )
-    return {(row[0], row[1], row[2]) for row in cursor.fetchall()}
+# One round trip for the whole catalog: every user-table column with its type parts, flags,
+# primary-key membership and the table's row estimate. Mirrors what the INFORMATION_SCHEMA
+# views report (DATA_TYPE is the base system type; CLR types fall back to their own name)
+# without their per-row permission checks and COLUMNPROPERTY calls.
+_CATALOG_QUERY: Final[str] = """
+SELECT SCHEMA_NAME(t.schema_id), t.name, c.name,
+       ISNULL(TYPE_NAME(c.system_type_id), TYPE_NAME(c.user_type_id)),
+       c.max_length, c.precision, c.scale,
+       c.is_nullable, c.is_identity, c.is_computed,
+       CAST(CASE WHEN ic.column_id IS NULL THEN 0 ELSE 1 END AS BIT),
+       ISNULL(p.row_estimate, 0)
+FROM sys.tables t
+JOIN sys.columns c ON c.object_id = t.object_id
+LEFT JOIN sys.indexes pk ON pk.object_id = t.object_id AND pk.is_primary_key = 1
+LEFT JOIN sys.index_columns ic
+    ON ic.object_id = pk.object_id AND ic.index_id = pk.index_id AND ic.column_id = c.column_id
+LEFT JOIN (
+    SELECT object_id, SUM(rows) AS row_estimate
+    FROM sys.partitions
+    WHERE index_id IN (0, 1)
+    GROUP BY object_id
+) p ON p.object_id = t.object_id
+ORDER BY SCHEMA_NAME(t.schema_id), t.name, c.column_id
+"""
 
+# (schema, table, column, data_type, max_length, precision, scale,
+#  is_nullable, is_identity, is_computed, is_primary_key, row_estimate)
+CatalogRow = tuple[str, str, str, str, int, int, int, bool, bool, bool, bool, int]
 
-def fetch_row_estimates(*, cursor: pymssql.Cursor) -> dict[tuple[str, str], int]:
-    """(schema, table) -> estimated row count from partition stats — a number, never row data."""
-    cursor.execute(
-        "SELECT SCHEMA_NAME(t.schema_id), t.name, SUM(p.rows) "
-        "FROM sys.tables t JOIN sys.partitions p ON p.object_id = t.object_id "
-        "WHERE p.index_id IN (0, 1) GROUP BY SCHEMA_NAME(t.schema_id), t.name"
-    )
-    return {(row[0], row[1]): int(row[2] or 0) for row in cursor.fetchall()}
+_UNICODE_TYPES: Final[frozenset[str]] = frozenset({"nchar", "nvarchar"})
+
+
+@functools.cache
+def _catalog_sql_type(data_type: str, max_length: int, precision: int, scale: int) -> str:
+    """`reconstruct_sql_type` from sys.columns parts. Cached: a catalog repeats a handful of
+    types across tens of thousands of columns.
+
+    sys.columns.max_length is in bytes; INFORMATION_SCHEMA's length is in characters.
+    """
+    char_len = max_length
+    if max_length != _MAX_LENGTH_SENTINEL and data_type.lower() in _UNICODE_TYPES:
+        char_len = max_length // 2
+    return reconstruct_sql_type(data_type=data_type, char_len=char_len, precision=precision, scale=scale)
+
+
+def fetch_catalog(*, cursor: pymssql.Cursor) -> list[CatalogRow]:
+    """Every user-table column in the database, in one joined catalog query."""
+    cursor.execute(_CATALOG_QUERY)
+    return cursor.fetchall()
+
+
+def build_manifest(*, rows: list[CatalogRow], database: str, captured_at: str) -> SchemaManifest:
+    """Assemble joined catalog rows into a manifest.
+
+    Rows are grouped into plain dicts and the whole manifest is validated once, by one
+    `SchemaManifest.model_validate` — a single pydantic-core call instead of one per column.
+    On the Python side that is no faster or slower than building a `ColumnSpec` per column
+    beyond run-to-run noise (see bench_introspect.py); it is simply one validation call. The
+    real win of this path is on the database side: one joined catalog query instead of four
+    round trips.
+    """
+    tables: dict[str, dict] = {}
+    for (
+        schema, table, column, data_type, max_length, precision, scale,
+        nullable, identity, computed, primary, row_estimate,
+    ) in rows:
+        qualified = f"{schema}.{table}"
+        spec = tables.get(qualified)
+        if spec is None:
+            spec = tables[qualified] = {"name": qualified, "columns": [], "row_estimate": row_estimate}
+        spec["columns"].append({
+            "name": column,
+            "sql_type": _catalog_sql_type(data_type, max_length, precision, scale),
+            "nullable": nullable,
+            "key": KeyRole.PRIMARY if primary else KeyRole.NONE,
+            "identity": identity,
+            "computed": computed,
+        })
+    return SchemaManifest.model_validate({
+        "captured_at": captured_at,
+        "source": CaptureSource.LOCAL_INTROSPECT,
+        "database": database,
+        "tables": [tables[name] for name in sorted(tables)],
+    })
 
 
 def introspect(*, host: str, port: int, password: str, database: str) -> SchemaManifest:
     """Read the running container's schema into a faithful, typed manifest."""
     conn = pymssql.connect(host, "sa", password, database, port=port, timeout=60)
-    cursor = conn.cursor()
-
-    flags = fetch_column_flags(cursor=cursor)
-    pk_columns = fetch_primary_key_columns(cursor=cursor)
-    row_estimates = fetch_row_estimates(cursor=cursor)
-
-    # Base tables only (exclude views), ordered for a deterministic, diff-stable manifest.
-    cursor.execute(
-        "SELECT c.TABLE_SCHEMA, c.TABLE_NAME, c.COLUMN_NAME, c.DATA_TYPE, "
-        "c.CHARACTER_MAXIMUM_LENGTH, c.NUMERIC_PRECISION, c.NUMERIC_SCALE, c.IS_NULLABLE "
-        "FROM INFORMATION_SCHEMA.COLUMNS c "
-        "JOIN INFORMATION_SCHEMA.TABLES t "
-        "  ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME "
-        "WHERE t.TABLE_TYPE = 'BASE TABLE' "
-        "ORDER BY c.TABLE_SCHEMA, c.TABLE_NAME, c.ORDINAL_POSITION"
-    )
-
-    tables: dict[str, TableSpec] = {}
-    for schema, table, column, data_type, char_len, precision, scale, is_nullable in cursor.fetchall():
-        qualified = f"{schema}.{table}"
-        identity, computed = flags.get((schema, table, column), (False, False))
-        column_spec = ColumnSpec(
-            name=column,
-            sql_type=reconstruct_sql_type(
-                data_type=data_type, char_len=char_len, precision=precision, scale=scale
-            ),
-            nullable=(is_nullable == "YES"),
-            key=KeyRole.PRIMARY if (schema, table, column) in pk_columns else KeyRole.NONE,
-            identity=identity,
-            computed=computed,
-        )
-        if qualified not in tables:
-            tables[qualified] = TableSpec(
-                name=qualified, columns=[], row_estimate=row_estimates.get((schema, table), 0)
-            )
-        tables[qualified].columns.append(column_spec)
-
-    conn.close()
-
-    return SchemaManifest(
-        captured_at=datetime.datetime.now(datetime.UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z"),
-        source=CaptureSource.LOCAL_INTROSPECT,
+    try:
+        rows = fetch_catalog(cursor=conn.cursor())
+    finally:
+        conn.close()
+    return build_manifest(
+        rows=rows,
         database=database,
-        tables=[tables[name] for name in sorted(tables)],
+        captured_at=datetime.datetime.now(datetime.UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z"),
     )
 
 
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Table- and column-level diff between two schema manifests (BH-1405, incremental recreate).
+
+`synthesize.py --incremental` / `recreate.py --incremental` use this to rebuild only what a
+manifest change actually touched: added tables are created, changed tables are dropped and
+rebuilt, removed tables are dropped, and every other table keeps its already-seeded rows. A
+one-column recapture then costs one table, not the whole database.
+
+A table counts as changed when anything `render_create_table` or the generators read differs:
+the ordered column list and each column's name, type, nullability, key role, IDENTITY and
+computed flags. Column ORDER is part of the shape — the row generator draws cells in column
+order, so a reorder changes the rows, not just the DDL. `row_estimate` is a capture-time
+statistic the synthesizer never reads (rows come from `--rows`), so it is not a change.
+
+Also a CLI, for reviewing a recapture before committing it:
+    git show HEAD:clients/trials/loopcapital/sandbox/schema_manifest.json > /tmp/old.json
+    uv run --with pydantic python clients/trials/loopcapital/sandbox/manifest/manifest_diff.py /tmp/old.json
+Exit code 0 = same shape, 1 = the manifests differ (like `diff`).
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Final
+
+from manifest_model import ColumnSpec, KeyRole, SchemaManifest, TableSpec, load_manifest
+
+MANIFEST_PATH: Final[Path] = Path(__file__).resolve().parent.parent / "schema_manifest.json"
+
+
+def _describe_column(column: ColumnSpec) -> str:
+    flags = [flag for flag, on in (("IDENTITY", column.identity), ("computed", column.computed)) if on]
+    if column.key is not KeyRole.NONE:
+        flags.append(column.key.value)
+    tail = f" [{', '.join(flags)}]" if flags else ""
+    return f"{column.sql_type} {'NULL' if column.nullable else 'NOT NULL'}{tail}"
+
+
+@dataclass(frozen=True)
+class ColumnChange:
+    """One column that was added, removed or altered between two versions of a table."""
+
+    name: str
+    before: ColumnSpec | None
+    after: ColumnSpec | None
+
+    @property
+    def kind(self) -> str:
+        if self.before is None:
+            return "added"
+        if self.after is None:
+            return "removed"
+        return "changed"
+
+    def render(self) -> str:
+        if self.before is None:
+            return f"+ {self.name} {_describe_column(self.after)}"
+        if self.after is None:
+            return f"- {self.name} {_describe_column(self.before)}"
+        return f"~ {self.name} {_describe_column(self.before)} -> {_describe_column(self.after)}"
+
+
+@dataclass(frozen=True)
+class TableDiff:
+    """A table present in both manifests whose shape differs."""
+
+    name: str
+    columns: list[ColumnChange] = field(default_factory=list)
+    reordered: bool = False  # same columns, different ordinal positions
+
+    def render(self) -> str:
+        lines = [f"  ~ {self.name}"]
+        lines += [f"      {change.render()}" for change in self.columns]
+        if self.reordered:
+            lines.append("      column order changed")
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class ManifestDiff:
+    """What it takes to turn a database built from `old` into one built from `new`."""
+
+    added: list[TableSpec]
+    removed: list[TableSpec]
+    changed: list[TableDiff]
+    unchanged: list[str]
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def render(self) -> str:
+        lines = [
+            f"{len(self.added)} added, {len(self.changed)} changed, {len(self.removed)} removed, "
+            f"{len(self.unchanged)} unchanged"
+        ]
+        lines += [f"  + {table.name} ({len(table.columns)} columns)" for table in self.added]
+        lines += [diff.render() for diff in self.changed]
+        lines += [f"  - {table.name}" for table in self.removed]
+        return "\n".join(lines)
+
+
+def diff_table(*, old: TableSpec, new: TableSpec) -> TableDiff | None:
+    """Column-level diff of two versions of one table; None when the shape is identical."""
+    if old.columns == new.columns:
+        return None
+    before = {column.name: column for column in old.columns}
+    after = {column.name: column for column in new.columns}
+    changes = [
+        ColumnChange(name=column.name, before=before.get(column.name), after=column)
+        for column in new.columns
+        if before.get(column.name) != column
+    ]
+    changes += [
+        ColumnChange(name=column.name, before=column, after=None)
+        for column in old.columns
+        if column.name not in after
+    ]
+    kept_old = [column.name for column in old.columns if column.name in after]
+    kept_new = [column.name for column in new.columns if column.name in before]
+    return TableDiff(name=new.name, columns=changes, reordered=kept_old != kept_new)
+
+
+def diff_manifests(*, old: SchemaManifest, new: SchemaManifest) -> ManifestDiff:
+    """Table-level diff (added/removed/changed/unchanged), with column detail for changed tables."""
+    old_tables = {table.name: table for table in old.tables}
+    new_tables = {table.name: table for table in new.tables}
+    changed: list[TableDiff] = []
+    unchanged: list[str] = []
+    for name, table in new_tables.items():
+        if name not in old_tables:
+            continue
+        table_diff = diff_table(old=old_tables[name], new=table)
+        if table_diff is None:
+            unchanged.append(name)
+        else:
+            changed.append(table_diff)
+    return ManifestDiff(
+        added=[table for name, table in new_tables.items() if name not in old_tables],
+        removed=[table for name, table in old_tables.items() if name not in new_tables],
+        changed=changed,
+        unchanged=unchanged,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("old", type=Path, help="the previous schema_manifest.json")
+    parser.add_argument("new", type=Path, nargs="?", default=MANIFEST_PATH,
+                        help="the new manifest (default: the committed schema_manifest.json)")
+    args = parser.parse_args()
+
+    diff = diff_manifests(old=load_manifest(path=args.old), new=load_manifest(path=args.new))
+    print(diff.render())
+    return 0 if diff.is_empty else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
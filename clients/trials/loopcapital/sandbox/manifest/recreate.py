@@ -11,8 +11,12 @@ schema+seed work is delegated to `synthesize.py` so there is one synthesis mecha
 
 Usage (from repo root, via `make sandbox-recreate`):
     export MSSQL_SA_PASSWORD='<throwaway-local-password>'
-    uv run --with pymssql --with pydantic python \\
-        clients/trials/loopcapital/sandbox/manifest/recreate.py --rows 200 --seed 42
+    uv run --with pymssql --with pydantic --with numpy python \\
+        clients/trials/loopcapital/sandbox/manifest/recreate.py --rows 200 --seed 42 \\
+        [--generator columnar] [--loader bcp] [--workers 4] [--incremental]
+
+`--incremental` keeps the existing database and rebuilds only the tables the manifest changed
+since the last apply (see `synthesize.apply_incremental`); the default is a full drop + rebuild.
 """
 
 from __future__ import annotations
@@ -27,17 +31,22 @@ from typing import Final
 
 from manifest_model import load_manifest
 from synthesize import (
+    CONTAINER_NAME,
     DEFAULT_HOST,
     DEFAULT_PORT,
     DEFAULT_ROWS,
     DEFAULT_SEED,
+    DEFAULT_WORKERS,
+    GENERATORS,
+    LOADERS,
     MANIFEST_PATH,
+    apply_incremental,
     apply_schema_and_seed,
     recreate_database,
+    record_applied_state,
 )
 
 SANDBOX_DIR: Final[Path] = Path(__file__).resolve().parent.parent
-CONTAINER_NAME: Final[str] = "loopcapital-sql-sandbox"
 HEALTH_TIMEOUT_S: Final[int] = 120
 HEALTH_POLL_S: Final[int] = 2
 
@@ -73,6 +82,14 @@ def main() -> int:
     parser.add_argument("--rows", type=int, default=DEFAULT_ROWS, help=f"rows per table (default: {DEFAULT_ROWS})")
     parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help=f"RNG seed (default: {DEFAULT_SEED})")
     parser.add_argument("--manifest", type=Path, default=MANIFEST_PATH, help="path to schema_manifest.json")
+    parser.add_argument("--generator", choices=GENERATORS, default="row",
+                        help="row = per-cell (original seeds); columnar = NumPy, for large --rows")
+    parser.add_argument("--loader", choices=LOADERS, default="insert",
+                        help="insert = executemany over pymssql; bcp = container bcp into a heap, PK after")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"tables seeded concurrently, one connection each (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--incremental", action="store_true",
+                        help="rebuild only tables the manifest changed since the last apply (default: drop everything)")
     parser.add_argument("--skip-boot", action="store_true", help="assume the container is already running")
     args = parser.parse_args()
 
@@ -96,10 +113,19 @@ def main() -> int:
     print(f"Recreating {manifest.database} from {args.manifest.name} "
           f"({len(manifest.tables)} tables, source={manifest.source.value}, rows={args.rows}, seed={args.seed})...")
 
-    recreate_database(host=host, port=port, password=password, database=manifest.database)
-    total = apply_schema_and_seed(
-        host=host, port=port, password=password, manifest=manifest, rows=args.rows, seed=args.seed
+    common = dict(
+        host=host, port=port, password=password, manifest=manifest, rows=args.rows, seed=args.seed,
+        generator=args.generator, loader=args.loader, workers=args.workers,
     )
+    if args.incremental:
+        total = apply_incremental(**common)
+    else:
+        recreate_database(host=host, port=port, password=password, database=manifest.database)
+        total = apply_schema_and_seed(**common)
+        record_applied_state(
+            host=host, port=port, password=password, manifest=manifest, rows=args.rows, seed=args.seed,
+            generator=args.generator,
+        )
     print(f"\nRecreate complete — {len(manifest.tables)} tables, {total} synthetic rows, from git alone.")
     return 0
 
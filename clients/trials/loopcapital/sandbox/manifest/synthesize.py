@@ -6,26 +6,62 @@ Reads a committed `schema_manifest.json`, rebuilds the manifest's tables as fait
 same `--seed` -> byte-identical database every time (git-only reproducibility, INV-10). No real
 Loop Capital rows are ever produced or committed (INV-9); every value is synthesized from the RNG.
 
+Two generators, each byte-identical per seed on its own (INV-10) but not to each other:
+  * `row` (default) — `synth_value` per cell from a table-scoped `random.Random`. The original
+    mode; existing seeds keep producing the databases they always have.
+  * `columnar` — `synth_columns` builds whole columns at once from NumPy `Generator`s. Each
+    (table, column, chunk of `COLUMNAR_CHUNK_ROWS`) gets its own stream derived by SHA-256 from
+    the seed and names, so output doesn't depend on table/column order or on how the caller
+    batches rows. For 1M-row tables; see `bench_synthesize.py`. NumPy pins its bit generators
+    but not every distribution across releases — the guarantee is per seed *and* NumPy version.
+
+Two loaders (`--loader`), same rows either way:
+  * `insert` (default) — `executemany` in `INSERT_BATCH`-row batches over pymssql.
+  * `bcp` — writes each table to a character-format data file, `docker cp`s it into the container
+    and runs the container's own `bcp ... in -h TABLOCK` against a heap: the table is created
+    without its PRIMARY KEY, bulk-loaded minimally logged, and the key (the only index/constraint
+    the manifest DDL carries) is built once afterwards. For large `--rows` / `--generator columnar`.
+
+With `--workers N` (N > 1), tables are created and seeded concurrently, one process and
+connection per table in flight; the default is one table at a time. Every RNG is table-scoped and
+no FKs are enforced, so any worker count builds the same database; the CLI reports per-table
+rows/s and a total-time summary.
+
 Manifest mode owns the whole `LoopCapitalAM` database while active: this drops and recreates it so
 a recreate is always pristine. It does not run alongside scenario mode (`reset.py`).
 
+`--incremental` skips the drop: it diffs the manifest against the one last applied (recorded in
+`.applied_manifest.json` after every apply; see `manifest_diff.py`) and creates only added tables,
+rebuilds only changed ones and drops removed ones. Untouched tables keep their rows, which are the
+rows a full rebuild would produce anyway. It falls back to a full rebuild when the database was
+recreated behind its back or `--rows`/`--seed`/`--generator` changed.
+
 Usage (run from repo root; the container must already be up):
     export MSSQL_SA_PASSWORD='<throwaway-local-password>'
-    uv run --with pymssql --with pydantic python \\
-        clients/trials/loopcapital/sandbox/manifest/synthesize.py --rows 200 --seed 42
+    uv run --with pymssql --with pydantic --with numpy python \\
+        clients/trials/loopcapital/sandbox/manifest/synthesize.py --rows 200 --seed 42 \\
+        [--generator columnar] [--loader bcp] [--workers 4] [--incremental]
 """
 
 from __future__ import annotations
 
 import argparse
 import datetime
+import hashlib
+import json
 import os
 import random
+import subprocess
 import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
-from typing import Final
+from typing import Final, Iterator
 
+import numpy as np
 import pymssql
 
 from manifest_model import (
@@ -35,8 +71,14 @@ from manifest_model import (
     TableSpec,
     load_manifest,
 )
+from manifest_diff import diff_manifests
 
 MANIFEST_PATH: Final = Path(__file__).resolve().parent.parent / "schema_manifest.json"
+# The last manifest + seed parameters applied to the container — `--incremental` diffs against it.
+APPLIED_STATE_PATH: Final = Path(__file__).resolve().parent.parent / ".applied_manifest.json"
+CONTAINER_NAME: Final[str] = "loopcapital-sql-sandbox"
+BCP_BIN: Final[str] = "/opt/mssql-tools18/bin/bcp"
+BCP_BATCH_ROWS: Final[int] = 100_000  # rows per bcp commit
 
 DEFAULT_HOST: Final[str] = "127.0.0.1"  # NOT localhost — IPv6 ::1 stalls TLS on the emulated container
 DEFAULT_PORT: Final[int] = 1433
@@ -44,6 +86,11 @@ DEFAULT_ROWS: Final[int] = 200
 DEFAULT_SEED: Final[int] = 42
 INSERT_BATCH: Final[int] = 500
 NULL_FRACTION: Final[float] = 0.08  # deterministic fraction of nullable cells left NULL
+GENERATORS: Final[tuple[str, ...]] = ("row", "columnar")
+LOADERS: Final[tuple[str, ...]] = ("insert", "bcp")
+DEFAULT_WORKERS: Final[int] = 1  # serial unless --workers asks for a pool
+COLUMNAR_CHUNK_ROWS: Final[int] = 65_536  # part of the columnar seed derivation — changing it changes output
+_ALPHABET: Final = np.frombuffer(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789", dtype=np.uint8)
 
 # SQL Server type families — drives per-column value synthesis.
 _INT_TYPES: Final[frozenset[str]] = frozenset({"int", "bigint", "smallint", "tinyint"})
@@ -132,17 +179,128 @@ def synth_value(*, column: ColumnSpec, rng: random.Random, row_index: int) -> ob
     return f"SYN-{row_index:06d}"
 
 
+def _stable_int(text: str) -> int:
+    """64-bit integer from SHA-256 — stable across processes, unlike the salted built-in `hash()`."""
+    return int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+
+
+def table_seed(*, seed: int, table_name: str) -> int:
+    """Stable per-table seed for the columnar generator: independent of table order in the manifest."""
+    return _stable_int(f"{seed}:{table_name}")
+
+
+def _column_rng(*, table_seed_value: int, column: ColumnSpec, chunk_index: int) -> np.random.Generator:
+    """One independent stream per (table, column, chunk) — keyed by name, so adding a column
+    elsewhere in the table never shifts this column's values."""
+    return np.random.default_rng([table_seed_value, _stable_int(column.name), chunk_index])
+
+
+def synth_column(*, column: ColumnSpec, rng: np.random.Generator, start: int, stop: int) -> list[object]:
+    """Rows [start, stop) of one column as insert-ready Python values, generated in one shot.
+
+    Mirrors `synth_value`'s type families, ranges, and PK formats; values differ (different RNG).
+    """
+    n = stop - start
+    base = _base_type(column.sql_type)
+    is_pk = column.key is KeyRole.PRIMARY
+    null_mask = rng.random(n) < NULL_FRACTION if column.nullable and not is_pk else None
+    index = np.arange(start, stop, dtype=np.int64)
+
+    values: list[object]
+    if base in _INT_TYPES:
+        values = (index if is_pk else rng.integers(1, 1_000_001, size=n)).tolist()
+    elif base in _REAL_TYPES:
+        values = _synth_decimals(column=column, rng=rng, n=n)
+    elif base in _DATE_TYPES:
+        days = rng.integers(0, 365, size=n)
+        values = (np.datetime64("2026-01-01", "D") + days).tolist()
+    elif base in _DATETIME_TYPES:
+        seconds = rng.integers(0, 365, size=n) * 86_400 + rng.integers(0, 86_400, size=n)
+        values = (np.datetime64("2026-01-01T00:00:00", "s") + seconds).astype("datetime64[us]").tolist()
+    elif base == "bit":
+        values = rng.integers(0, 2, size=n).tolist()
+    elif base == "uniqueidentifier":
+        high = rng.integers(0, 2**32, size=n, dtype=np.uint64).tolist()
+        values = [f"{h:08x}-0000-4000-8000-{i:012x}" for h, i in zip(high, range(start, stop))]
+    elif base in _STRING_TYPES:
+        length = _string_length(column.sql_type)
+        if is_pk:
+            prefix = column.name.upper()[:6]
+            values = [f"{prefix}-{i:08d}"[:length] for i in range(start, stop)]
+        else:
+            width = min(length, 12)
+            codes = _ALPHABET[rng.integers(0, len(_ALPHABET), size=(n, width))]
+            values = np.ascontiguousarray(codes).view(f"S{width}").ravel().astype(f"U{width}").tolist()
+    else:
+        values = [f"SYN-{i:06d}" for i in range(start, stop)]
+
+    if null_mask is not None:
+        for i in np.flatnonzero(null_mask).tolist():
+            values[i] = None
+    return values
+
+
+def _synth_decimals(*, column: ColumnSpec, rng: np.random.Generator, n: int) -> list[object]:
+    """whole + frac/10_000 like `synth_value`, but rounded in integer space (half-even, as
+    `Decimal.quantize`) and turned into a `Decimal` only at the end — no per-cell quantize."""
+    precision, scale = _decimal_precision(column.sql_type)
+    upper = min(10 ** max(1, precision - scale) - 1, 1_000_000)
+    ten_thousandths = rng.integers(0, upper + 1, size=n) * 10_000 + rng.integers(0, 10_000, size=n)
+    if scale >= 4:
+        scaled, exponent = ten_thousandths, -4
+    else:
+        step = 10 ** (4 - scale)
+        quotient, remainder = np.divmod(ten_thousandths, step)
+        half = step // 2
+        scaled = quotient + ((remainder > half) | ((remainder == half) & (quotient % 2 == 1)))
+        exponent = -scale
+    if _base_type(column.sql_type) in {"float", "real"}:
+        return (scaled / 10 ** -exponent).tolist()
+    return [Decimal(v).scaleb(exponent) for v in scaled.tolist()]
+
+
+def synth_columns(*, table: TableSpec, columns: list[ColumnSpec], rows: int, seed: int) -> Iterator[list[tuple[object, ...]]]:
+    """Columnar generator: yields row tuples one `COLUMNAR_CHUNK_ROWS` chunk at a time (bounded memory)."""
+    seed_value = table_seed(seed=seed, table_name=table.name)
+    for chunk_index, start in enumerate(range(0, rows, COLUMNAR_CHUNK_ROWS)):
+        stop = min(rows, start + COLUMNAR_CHUNK_ROWS)
+        column_values = [
+            synth_column(
+                column=c,
+                rng=_column_rng(table_seed_value=seed_value, column=c, chunk_index=chunk_index),
+                start=start,
+                stop=stop,
+            )
+            for c in columns
+        ]
+        yield list(zip(*column_values))
+
+
+def synth_rows(*, table: TableSpec, columns: list[ColumnSpec], rows: int, seed: int) -> Iterator[list[tuple[object, ...]]]:
+    """Row generator (the original mode): one `synth_value` per cell, batched by `INSERT_BATCH`."""
+    rng = random.Random(f"{seed}:{table.name}")  # table-scoped, so order-independent + deterministic
+    batch: list[tuple[object, ...]] = []
+    for row_index in range(rows):
+        batch.append(tuple(synth_value(column=c, rng=rng, row_index=row_index) for c in columns))
+        if len(batch) >= INSERT_BATCH:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 def _seedable_columns(table: TableSpec) -> list[ColumnSpec]:
     """Columns we write on INSERT — everything except IDENTITY columns (the engine owns those)."""
     return [c for c in table.columns if not c.identity]
 
 
-def render_create_table(*, table: TableSpec) -> str:
+def render_create_table(*, table: TableSpec, with_primary_key: bool = True) -> str:
     """Faithful CREATE TABLE from the manifest: types, nullability, IDENTITY, single-column PK.
 
     Computed columns are materialized as plain columns of their captured type (documented
     simplification — a shape sandbox needs the column present and typed, not the expression).
     Foreign keys are not enforced; synthetic rows are shape-faithful, not referentially linked.
+    `with_primary_key=False` creates a heap for bulk loading; `render_add_primary_key` adds it after.
     """
     lines: list[str] = []
     for column in table.columns:
@@ -150,12 +308,94 @@ def render_create_table(*, table: TableSpec) -> str:
         null = "NOT NULL" if not column.nullable else "NULL"
         lines.append(f"    [{column.name}] {column.sql_type}{identity} {null}")
     pk_cols = [c.name for c in table.columns if c.key is KeyRole.PRIMARY]
-    if pk_cols:
+    if pk_cols and with_primary_key:
         lines.append("    PRIMARY KEY (" + ", ".join(f"[{c}]" for c in pk_cols) + ")")
     body = ",\n".join(lines)
     return f"CREATE TABLE [{table.schema_name}].[{table.bare_name}] (\n{body}\n);"
 
 
+def render_add_primary_key(*, table: TableSpec) -> str | None:
+    """The PRIMARY KEY `render_create_table` would have declared inline, as an ALTER; None if no PK."""
+    pk_cols = [c.name for c in table.columns if c.key is KeyRole.PRIMARY]
+    if not pk_cols:
+        return None
+    return (
+        f"ALTER TABLE [{table.schema_name}].[{table.bare_name}] "
+        "ADD PRIMARY KEY (" + ", ".join(f"[{c}]" for c in pk_cols) + ");"
+    )
+
+
+def _bcp_field(value: object) -> str:
+    """One value in bcp character format. Empty = NULL (loaded with -k)."""
+    if value is None:
+        return ""
+    if isinstance(value, Decimal):
+        return format(value, "f")  # never '0E-4' — bcp can't parse exponent notation into DECIMAL
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, float):
+        return repr(value)
+    text = str(value)
+    if "\t" in text or "\n" in text:
+        raise ValueError(f"value {text!r} contains a bcp terminator")
+    return text
+
+
+def write_bcp_file(
+    *, path: Path, table: TableSpec, columns: list[ColumnSpec], chunks: Iterator[list[tuple[object, ...]]]
+) -> int:
+    """Write rows as a bcp `-c` data file (tab / newline) in table column order; returns rows written.
+
+    IDENTITY columns get a placeholder field — without `-E`, bcp ignores it and the engine assigns
+    the value, exactly as INSERT does when the column is omitted.
+    """
+    seeded = {c.name: i for i, c in enumerate(columns)}
+    layout = [seeded.get(c.name) for c in table.columns]
+    written = 0
+    with path.open("w", encoding="utf-8", newline="\n") as out:
+        for chunk in chunks:
+            out.writelines(
+                "\t".join("0" if i is None else _bcp_field(row[i]) for i in layout) + "\n"
+                for row in chunk
+            )
+            written += len(chunk)
+    return written
+
+
+def bcp_load_table(
+    *,
+    table: TableSpec,
+    columns: list[ColumnSpec],
+    chunks: Iterator[list[tuple[object, ...]]],
+    password: str,
+    database: str,
+) -> int:
+    """Bulk-load one table through the container's `bcp` (TABLOCK, minimally logged into a heap)."""
+    with tempfile.TemporaryDirectory(prefix="synthesize-bcp-") as tmp:
+        local = Path(tmp) / f"{table.schema_name}.{table.bare_name}.dat"
+        written = write_bcp_file(path=local, table=table, columns=columns, chunks=chunks)
+        remote = f"/tmp/{local.name}"
+        subprocess.run(["docker", "cp", str(local), f"{CONTAINER_NAME}:{remote}"], check=True)
+    try:
+        result = subprocess.run(
+            [
+                "docker", "exec", CONTAINER_NAME, BCP_BIN,
+                f"[{database}].[{table.schema_name}].[{table.bare_name}]", "in", remote,
+                "-c", "-k", "-b", str(BCP_BATCH_ROWS), "-h", "TABLOCK",
+                "-S", "localhost", "-U", "sa", "-P", password, "-u",
+            ],
+            capture_output=True, text=True,
+        )
+    finally:
+        subprocess.run(["docker", "exec", CONTAINER_NAME, "rm", "-f", remote], check=False)
+    if result.returncode != 0:
+        print(result.stdout, file=sys.stderr)
+        raise RuntimeError(f"bcp into {table.name} failed (exit {result.returncode}) — see output above")
+    return written
+
+
 def recreate_database(*, host: str, port: int, password: str, database: str) -> None:
     """Drop and recreate the target database for a pristine, deterministic manifest-mode rebuild."""
     conn = pymssql.connect(host, "sa", password, "master", port=port, timeout=60)
@@ -172,58 +412,314 @@ def recreate_database(*, host: str, port: int, password: str, database: str) ->
     print(f"  Database {database} dropped + recreated (ground zero).")
 
 
-def apply_schema_and_seed(
-    *, host: str, port: int, password: str, manifest: SchemaManifest, rows: int, seed: int
-) -> int:
-    """Create every manifest table and seed deterministic rows; returns total rows inserted."""
-    conn = pymssql.connect(host, "sa", password, manifest.database, port=port, timeout=120)
-    conn.autocommit(True)
-    cur = conn.cursor()
-    total_inserted = 0
-
-    for table_index, table in enumerate(manifest.tables):
+@dataclass(frozen=True)
+class TableSeedResult:
+    """One table's create + seed, as reported by a worker."""
+
+    name: str
+    rows: int
+    seconds: float
+    note: str = ""
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+def seed_table(
+    *,
+    host: str,
+    port: int,
+    password: str,
+    database: str,
+    table: TableSpec,
+    rows: int,
+    seed: int,
+    generator: str = "row",
+    loader: str = "insert",
+) -> TableSeedResult:
+    """Drop, create and seed one table on its own connection.
+
+    Safe to run concurrently per table: a table's rows come only from its table-scoped RNG, so
+    scheduling can't change the data.
+    """
+    started = time.perf_counter()
+    generate = synth_columns if generator == "columnar" else synth_rows
+    bulk = loader == "bcp"
+    conn = pymssql.connect(host, "sa", password, database, port=port, timeout=120)
+    try:
+        conn.autocommit(True)
+        cur = conn.cursor()
         cur.execute(
             f"IF OBJECT_ID('[{table.schema_name}].[{table.bare_name}]', 'U') IS NOT NULL "
             f"DROP TABLE [{table.schema_name}].[{table.bare_name}];"
         )
-        cur.execute(render_create_table(table=table))
-
         columns = _seedable_columns(table)
+        # Bulk loads go into a heap; the PK (clustered index) is built once, after the data.
+        cur.execute(render_create_table(table=table, with_primary_key=not (bulk and columns)))
         if not columns:
-            print(f"  {table.name}: schema only (all columns IDENTITY).")
-            continue
+            return TableSeedResult(
+                name=table.name, rows=0, seconds=time.perf_counter() - started,
+                note="schema only (all columns IDENTITY)",
+            )
+
+        if bulk:
+            inserted = bcp_load_table(
+                table=table, columns=columns,
+                chunks=generate(table=table, columns=columns, rows=rows, seed=seed),
+                password=password, database=database,
+            )
+            add_pk = render_add_primary_key(table=table)
+            if add_pk:
+                cur.execute(add_pk)
+            return TableSeedResult(
+                name=table.name, rows=inserted, seconds=time.perf_counter() - started,
+                note="bcp, PK built after load" if add_pk else "bcp",
+            )
 
         col_list = ", ".join(f"[{c.name}]" for c in columns)
         placeholders = ", ".join(["%s"] * len(columns))
         insert_sql = (
             f"INSERT INTO [{table.schema_name}].[{table.bare_name}] ({col_list}) VALUES ({placeholders})"
         )
-
-        rng = random.Random(f"{seed}:{table.name}")  # table-scoped, so order-independent + deterministic
-        batch: list[tuple[object, ...]] = []
         inserted = 0
-        for row_index in range(rows):
-            batch.append(tuple(synth_value(column=c, rng=rng, row_index=row_index) for c in columns))
-            if len(batch) >= INSERT_BATCH:
+        for chunk in generate(table=table, columns=columns, rows=rows, seed=seed):
+            for offset in range(0, len(chunk), INSERT_BATCH):
+                batch = chunk[offset : offset + INSERT_BATCH]
                 cur.executemany(insert_sql, batch)
                 inserted += len(batch)
-                batch = []
-        if batch:
-            cur.executemany(insert_sql, batch)
-            inserted += len(batch)
+        return TableSeedResult(name=table.name, rows=inserted, seconds=time.perf_counter() - started)
+    finally:
+        conn.close()
 
-        total_inserted += inserted
-        print(f"  {table.name}: {inserted} rows.")
 
-    conn.close()
+def _print_result(result: TableSeedResult) -> None:
+    if result.rows == 0 and result.note:
+        print(f"  {result.name}: {result.note} ({result.seconds:.2f}s).")
+        return
+    note = f", {result.note}" if result.note else ""
+    print(f"  {result.name}: {result.rows} rows in {result.seconds:.2f}s "
+          f"({result.rows_per_s:,.0f} rows/s{note}).")
+
+
+def apply_schema_and_seed(
+    *,
+    host: str,
+    port: int,
+    password: str,
+    manifest: SchemaManifest,
+    rows: int,
+    seed: int,
+    generator: str = "row",
+    loader: str = "insert",
+    workers: int = 1,
+) -> int:
+    """Create every manifest table and seed deterministic rows; returns total rows inserted.
+
+    `workers > 1` seeds tables concurrently in separate processes (the row generator is pure
+    Python, so threads would serialize on the GIL), each on its own connection. The database is
+    identical for any worker count; only the order of the progress lines changes.
+    """
+    if generator not in GENERATORS:
+        raise ValueError(f"unknown generator {generator!r}; expected one of {GENERATORS}")
+    if loader not in LOADERS:
+        raise ValueError(f"unknown loader {loader!r}; expected one of {LOADERS}")
+    started = time.perf_counter()
+    common = dict(
+        host=host, port=port, password=password, database=manifest.database,
+        rows=rows, seed=seed, generator=generator, loader=loader,
+    )
+
+    results: list[TableSeedResult] = []
+    if workers <= 1:
+        for table in manifest.tables:
+            results.append(seed_table(table=table, **common))
+            _print_result(results[-1])
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, max(1, len(manifest.tables)))) as pool:
+            futures = [pool.submit(seed_table, table=table, **common) for table in manifest.tables]
+            for future in as_completed(futures):
+                results.append(future.result())
+                _print_result(results[-1])
+
+    elapsed = time.perf_counter() - started
+    total_inserted = sum(r.rows for r in results)
+    table_time = sum(r.seconds for r in results)
+    print(f"\n  Seeded {len(results)} tables, {total_inserted:,} rows in {elapsed:.2f}s wall "
+          f"({total_inserted / elapsed if elapsed > 0 else 0.0:,.0f} rows/s; {table_time:.2f}s of "
+          f"per-table work across workers={workers}).")
     return total_inserted
 
 
+@dataclass(frozen=True)
+class AppliedState:
+    """What the database currently holds, as far as manifest mode knows — the `old` side of an
+    incremental diff. Written after every successful apply (full or incremental)."""
+
+    database: str
+    database_created: str  # sys.databases.create_date; changes if anything else drops/recreates it
+    rows: int
+    seed: int
+    generator: str
+    manifest: SchemaManifest
+
+
+def _database_created(*, host: str, port: int, password: str, database: str) -> str | None:
+    """The database's create_date as ISO text, or None if it does not exist."""
+    conn = pymssql.connect(host, "sa", password, "master", port=port, timeout=60)
+    try:
+        cur = conn.cursor()
+        cur.execute("SELECT create_date FROM sys.databases WHERE name = %s", (database,))
+        row = cur.fetchone()
+    finally:
+        conn.close()
+    return row[0].isoformat() if row else None
+
+
+def load_applied_state(*, path: Path) -> AppliedState | None:
+    """The last recorded apply, or None when there is none (or it can't be read)."""
+    try:
+        raw = json.loads(path.read_text())
+        return AppliedState(
+            database=raw["database"],
+            database_created=raw["database_created"],
+            rows=raw["rows"],
+            seed=raw["seed"],
+            generator=raw["generator"],
+            manifest=SchemaManifest.model_validate(raw["manifest"]),
+        )
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def record_applied_state(
+    *, host: str, port: int, password: str, manifest: SchemaManifest, rows: int, seed: int, generator: str,
+    path: Path = APPLIED_STATE_PATH,
+) -> None:
+    """Remember what was just applied, so the next `--incremental` run can diff against it."""
+    created = _database_created(host=host, port=port, password=password, database=manifest.database)
+    state = {
+        "database": manifest.database,
+        "database_created": created,
+        "rows": rows,
+        "seed": seed,
+        "generator": generator,
+        "manifest": manifest.model_dump(mode="json"),
+    }
+    path.write_text(json.dumps(state, indent=2) + "\n")
+
+
+def _existing_tables(*, host: str, port: int, password: str, database: str) -> set[str]:
+    conn = pymssql.connect(host, "sa", password, database, port=port, timeout=60)
+    try:
+        cur = conn.cursor()
+        cur.execute("SELECT SCHEMA_NAME(schema_id) + '.' + name FROM sys.tables")
+        return {row[0].lower() for row in cur.fetchall()}
+    finally:
+        conn.close()
+
+
+def drop_tables(*, host: str, port: int, password: str, database: str, tables: list[TableSpec]) -> None:
+    conn = pymssql.connect(host, "sa", password, database, port=port, timeout=60)
+    try:
+        conn.autocommit(True)
+        cur = conn.cursor()
+        for table in tables:
+            cur.execute(
+                f"IF OBJECT_ID('[{table.schema_name}].[{table.bare_name}]', 'U') IS NOT NULL "
+                f"DROP TABLE [{table.schema_name}].[{table.bare_name}];"
+            )
+            print(f"  {table.name}: dropped (no longer in the manifest).")
+    finally:
+        conn.close()
+
+
+def _full_rebuild_reason(
+    *, state: AppliedState | None, created: str | None, manifest: SchemaManifest, rows: int, seed: int, generator: str
+) -> str | None:
+    """Why an incremental apply can't trust the recorded state; None when it can."""
+    if created is None:
+        return f"{manifest.database} does not exist yet"
+    if state is None:
+        return f"no record of a previous apply at {APPLIED_STATE_PATH.name}"
+    if state.database != manifest.database or state.database_created != created:
+        return f"{manifest.database} was recreated since the last apply (e.g. by scenario mode)"
+    if (state.rows, state.seed, state.generator) != (rows, seed, generator):
+        return "--rows/--seed/--generator changed, which changes every table's rows"
+    return None
+
+
+def apply_incremental(
+    *,
+    host: str,
+    port: int,
+    password: str,
+    manifest: SchemaManifest,
+    rows: int,
+    seed: int,
+    generator: str = "row",
+    loader: str = "insert",
+    workers: int = 1,
+    state_path: Path = APPLIED_STATE_PATH,
+) -> int:
+    """Bring the database from the last applied manifest to `manifest`, touching only what changed.
+
+    Added tables are created, changed tables dropped and rebuilt, removed tables dropped; the rest
+    keep their rows. Every RNG is table-scoped, so a rebuilt table gets exactly the rows a full
+    recreate would give it — the result is the same database either way (INV-10). Falls back to a
+    full recreate when the recorded state can't be trusted. Returns rows inserted.
+    """
+    created = _database_created(host=host, port=port, password=password, database=manifest.database)
+    state = load_applied_state(path=state_path)
+    reason = _full_rebuild_reason(
+        state=state, created=created, manifest=manifest, rows=rows, seed=seed, generator=generator
+    )
+    common = dict(host=host, port=port, password=password, rows=rows, seed=seed,
+                  generator=generator, loader=loader, workers=workers)
+    if reason:
+        print(f"  Full rebuild: {reason}.")
+        recreate_database(host=host, port=port, password=password, database=manifest.database)
+        total = apply_schema_and_seed(manifest=manifest, **common)
+    else:
+        diff = diff_manifests(old=state.manifest, new=manifest)
+        print(f"  Manifest diff vs last apply: {diff.render()}")
+        existing = _existing_tables(host=host, port=port, password=password, database=manifest.database)
+        by_name = {table.name: table for table in manifest.tables}
+        missing = {
+            name for name in diff.unchanged
+            if f"{by_name[name].schema_name}.{by_name[name].bare_name}".lower() not in existing
+        }
+        for name in sorted(missing):
+            print(f"  {name}: unchanged in the manifest but missing from the database — rebuilding.")
+        if diff.removed:
+            drop_tables(host=host, port=port, password=password, database=manifest.database, tables=diff.removed)
+        rebuild = {table.name for table in diff.added} | {table.name for table in diff.changed} | missing
+        if rebuild:
+            subset = manifest.model_copy(update={"tables": [t for t in manifest.tables if t.name in rebuild]})
+            total = apply_schema_and_seed(manifest=subset, **common)
+        else:
+            total = 0
+        print(f"  {len(manifest.tables) - len(rebuild)} of {len(manifest.tables)} tables left untouched.")
+    record_applied_state(
+        host=host, port=port, password=password, manifest=manifest, rows=rows, seed=seed, generator=generator,
+        path=state_path,
+    )
+    return total
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument("--rows", type=int, default=DEFAULT_ROWS, help=f"rows per table (default: {DEFAULT_ROWS})")
     parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help=f"RNG seed (default: {DEFAULT_SEED})")
     parser.add_argument("--manifest", type=Path, default=MANIFEST_PATH, help="path to schema_manifest.json")
+    parser.add_argument("--generator", choices=GENERATORS, default="row",
+                        help="row = per-cell (original seeds); columnar = NumPy, for large --rows")
+    parser.add_argument("--loader", choices=LOADERS, default="insert",
+                        help="insert = executemany over pymssql; bcp = container bcp into a heap, PK after")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"tables seeded concurrently, one connection each (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--incremental", action="store_true",
+                        help="rebuild only tables the manifest changed since the last apply (default: drop everything)")
     args = parser.parse_args()
 
     password = os.environ.get("MSSQL_SA_PASSWORD")
@@ -240,12 +736,22 @@ def main() -> int:
 
     manifest = load_manifest(path=args.manifest)
     print(f"Synthesizing {manifest.database} from {args.manifest.name} "
-          f"({len(manifest.tables)} tables, source={manifest.source.value}, rows={args.rows}, seed={args.seed})...")
+          f"({len(manifest.tables)} tables, source={manifest.source.value}, rows={args.rows}, seed={args.seed}, "
+          f"generator={args.generator}, loader={args.loader}, workers={args.workers})...")
 
-    recreate_database(host=host, port=port, password=password, database=manifest.database)
-    total = apply_schema_and_seed(
-        host=host, port=port, password=password, manifest=manifest, rows=args.rows, seed=args.seed
+    common = dict(
+        host=host, port=port, password=password, manifest=manifest, rows=args.rows, seed=args.seed,
+        generator=args.generator, loader=args.loader, workers=args.workers,
     )
+    if args.incremental:
+        total = apply_incremental(**common)
+    else:
+        recreate_database(host=host, port=port, password=password, database=manifest.database)
+        total = apply_schema_and_seed(**common)
+        record_applied_state(
+            host=host, port=port, password=password, manifest=manifest, rows=args.rows, seed=args.seed,
+            generator=args.generator,
+        )
     print(f"\nSynthesize complete — {len(manifest.tables)} tables, {total} synthetic rows.")
     return 0
 
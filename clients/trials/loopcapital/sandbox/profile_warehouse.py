@@ -22,18 +22,47 @@ SynapseConnection -> create_data_asset_profile, brightbot/utils/data_profiler.py
 queries that chain would run, against holdings_raw, to prove the capability —
 it does not re-implement brightbot's profiler, it demonstrates what it can do.
 
+Every column is profiled in ONE aggregate scan (`build_profile_query`), not
+one COUNT(*) plus a scan per column. For wide or large tables,
+`--approx-distinct` uses APPROX_COUNT_DISTINCT and `--sample-percent` adds
+TABLESAMPLE, so the cost stays about one (partial) scan.
+
 Usage:
     export MSSQL_SA_PASSWORD='...'   # same value used by setup.sh
     uv run --with pymssql python profile_warehouse.py
+    uv run --with pymssql python profile_warehouse.py --table dbo.holdings_raw --approx-distinct --sample-percent 10
+    uv run --with pymssql python profile_warehouse.py --all [--manifest schema_manifest.json] [--workers 4] [--force]
+
+`--all` profiles the whole database: tables come from INFORMATION_SCHEMA
+(optionally narrowed to a manifest), run largest `row_estimate` first over a
+small connection pool, and each lands as `_profiles/<db>/<schema.table>.json`.
+Re-runs are incremental — a table whose change token (modify_date, row count,
+statistics modification counters) hasn't moved keeps its stored profile.
 """
 
 from __future__ import annotations
 
+import argparse
 import json
 import os
+import queue
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+SANDBOX_DIR = Path(__file__).resolve().parent
+PROFILES_DIR = SANDBOX_DIR / "_profiles"  # gitignored — one JSON per table
+MANIFEST_PATH = SANDBOX_DIR / "schema_manifest.json"
+DEFAULT_WORKERS = 4
+
+# COUNT(DISTINCT) / APPROX_COUNT_DISTINCT reject these; their distinct count is reported as 0.
+_NOT_COMPARABLE_TYPES = frozenset({"text", "ntext", "image", "xml", "geography", "geometry"})
+# COUNT(col) rejects the legacy LOB types too; their non-null count uses SUM(CASE ... IS NULL).
+_LEGACY_LOB_TYPES = frozenset({"text", "ntext", "image"})
 
 
 @dataclass(frozen=True)
@@ -63,12 +92,16 @@ class DatasetProfile:
     table_name: str
     row_count: int
     columns: list[ColumnProfile] = field(default_factory=list)
+    sample_percent: float | None = None  # None = every row scanned
+    approx_distinct: bool = False
 
     def to_dict(self) -> dict[str, Any]:
         return {
             "database_name": self.database_name,
             "table_name": self.table_name,
             "row_count": self.row_count,
+            "sample_percent": self.sample_percent,
+            "approx_distinct": self.approx_distinct,
             "columns": [
                 {
                     "name": c.name,
@@ -82,48 +115,272 @@ class DatasetProfile:
         }
 
 
-def profile_table(*, connection: Any, database: str, table: str) -> DatasetProfile:
+def _quote(identifier: str) -> str:
+    return "[" + identifier.replace("]", "]]") + "]"
+
+
+def _split_table(table: str) -> tuple[str, str]:
+    schema, _, name = table.rpartition(".")
+    return (schema or "dbo"), name
+
+
+def build_profile_query(
+    *,
+    table: str,
+    columns: list[tuple[str, str]],
+    approx_distinct: bool = False,
+    sample_percent: float | None = None,
+) -> str:
+    """ONE aggregate SELECT covering every column — a single scan instead of
+    one per column. Nulls come from COUNT(*) - COUNT(col) (a SUM(CASE) for
+    text/ntext/image, which COUNT rejects), so each column costs two
+    aggregates over the same pass. `approx_distinct` swaps
+    COUNT(DISTINCT) for APPROX_COUNT_DISTINCT (SQL Server 2019+, ~2% error,
+    no per-column sort/hash spill); `sample_percent` adds TABLESAMPLE."""
+    schema, name = _split_table(table)
+    aggregates = ["COUNT_BIG(*)"]
+    for col_name, sql_type in columns:
+        col = _quote(col_name)
+        if sql_type.lower() in _LEGACY_LOB_TYPES:
+            aggregates.append(f"SUM(CASE WHEN {col} IS NULL THEN 0 ELSE 1 END)")
+        else:
+            aggregates.append(f"COUNT_BIG({col})")
+        if sql_type.lower() in _NOT_COMPARABLE_TYPES:
+            aggregates.append("CAST(NULL AS BIGINT)")  # DISTINCT isn't defined for these types
+        elif approx_distinct:
+            aggregates.append(f"APPROX_COUNT_DISTINCT({col})")
+        else:
+            aggregates.append(f"COUNT_BIG(DISTINCT {col})")
+    sample = f" TABLESAMPLE ({sample_percent:g} PERCENT)" if sample_percent else ""
+    return (
+        "SELECT " + ",\n       ".join(aggregates)
+        + f"\nFROM {_quote(schema)}.{_quote(name)}{sample};"
+    )
+
+
+def profile_table(
+    *,
+    connection: Any,
+    database: str,
+    table: str,
+    approx_distinct: bool = False,
+    sample_percent: float | None = None,
+) -> DatasetProfile:
     """Real, read-only profiling queries — the same query CLASS brightbot's
     compute_warehouse_metrics runs (row count, per-column null rate,
-    per-column distinct count), against a real SQL Server connection."""
-    cursor = connection.cursor()
+    per-column distinct count), against a real SQL Server connection.
 
-    cursor.execute(f"SELECT COUNT(*) FROM {table};")
-    row_count = cursor.fetchone()[0]
+    One metadata lookup plus ONE scan for the whole table (see
+    `build_profile_query`). With `sample_percent`, rates and distinct counts
+    are computed over the sampled pages — distinct counts become a lower
+    bound — while `row_count` stays the table's true count, read from
+    partition metadata rather than a second scan."""
+    schema, name = _split_table(table)
+    cursor = connection.cursor()
 
     cursor.execute(
         """
         SELECT c.COLUMN_NAME, c.DATA_TYPE
         FROM INFORMATION_SCHEMA.COLUMNS c
-        WHERE c.TABLE_NAME = %s
+        WHERE c.TABLE_SCHEMA = %s AND c.TABLE_NAME = %s
         ORDER BY c.ORDINAL_POSITION;
         """,
-        (table.split(".")[-1],),
+        (schema, name),
     )
-    columns_meta = cursor.fetchall()
+    columns_meta = [(col_name, sql_type) for col_name, sql_type in cursor.fetchall()]
 
-    columns: list[ColumnProfile] = []
-    for col_name, sql_type in columns_meta:
-        cursor.execute(
-            f"SELECT SUM(CASE WHEN [{col_name}] IS NULL THEN 1 ELSE 0 END), "
-            f"COUNT(DISTINCT [{col_name}]) FROM {table};"
+    cursor.execute(
+        build_profile_query(
+            table=table, columns=columns_meta,
+            approx_distinct=approx_distinct, sample_percent=sample_percent,
         )
-        null_count, distinct_count = cursor.fetchone()
+    )
+    result = cursor.fetchone()
+    scanned_rows = result[0] or 0
+
+    columns: list[ColumnProfile] = []
+    for index, (col_name, sql_type) in enumerate(columns_meta):
+        non_null, distinct_count = result[1 + 2 * index], result[2 + 2 * index]
         columns.append(
             ColumnProfile(
                 name=col_name,
                 sql_type=sql_type,
-                row_count=row_count,
-                null_count=null_count or 0,
+                row_count=scanned_rows,
+                null_count=scanned_rows - (non_null or 0),
                 distinct_count=distinct_count or 0,
             )
         )
 
+    row_count = scanned_rows
+    if sample_percent:
+        cursor.execute(
+            "SELECT SUM(row_count) FROM sys.dm_db_partition_stats "
+            "WHERE object_id = OBJECT_ID(%s) AND index_id IN (0, 1);",
+            (f"{_quote(schema)}.{_quote(name)}",),
+        )
+        row_count = cursor.fetchone()[0] or 0
+
     return DatasetProfile(
-        database_name=database, table_name=table, row_count=row_count, columns=columns
+        database_name=database,
+        table_name=table,
+        row_count=row_count,
+        columns=columns,
+        sample_percent=sample_percent,
+        approx_distinct=approx_distinct,
     )
 
 
+@dataclass(frozen=True)
+class TableTarget:
+    """A table to profile, with the metadata that schedules it and decides
+    whether it changed since the last run — all from catalog views, no scan."""
+
+    table_name: str  # schema-qualified, e.g. "dbo.holdings_raw"
+    row_estimate: int
+    change_token: str
+
+
+# One catalog query for every user table: row estimate from partition stats,
+# plus the change token — DDL modify_date, row count, and the statistics
+# modification counters (rows changed since each stat was last updated) with
+# their last-update times, so an in-place UPDATE moves the token too.
+_TARGETS_QUERY = """
+SELECT t.TABLE_SCHEMA + '.' + t.TABLE_NAME,
+       ISNULL(ps.row_count, 0),
+       CONVERT(VARCHAR(33), o.modify_date, 126),
+       ISNULL(st.modifications, 0),
+       ISNULL(CONVERT(VARCHAR(33), st.last_updated, 126), '')
+FROM INFORMATION_SCHEMA.TABLES t
+JOIN sys.objects o ON o.object_id = OBJECT_ID(QUOTENAME(t.TABLE_SCHEMA) + '.' + QUOTENAME(t.TABLE_NAME))
+OUTER APPLY (
+    SELECT SUM(p.row_count) AS row_count FROM sys.dm_db_partition_stats p
+    WHERE p.object_id = o.object_id AND p.index_id IN (0, 1)
+) ps
+OUTER APPLY (
+    SELECT SUM(sp.modification_counter) AS modifications, MAX(sp.last_updated) AS last_updated
+    FROM sys.stats s CROSS APPLY sys.dm_db_stats_properties(s.object_id, s.stats_id) sp
+    WHERE s.object_id = o.object_id
+) st
+WHERE t.TABLE_TYPE = 'BASE TABLE';
+"""
+
+
+def list_tables(*, connection: Any, manifest_path: Path | None = None) -> list[TableTarget]:
+    """Every user table, largest `row_estimate` first. With a manifest, only
+    the tables it names (read as plain JSON — this script stays pymssql-only)."""
+    cursor = connection.cursor()
+    cursor.execute(_TARGETS_QUERY)
+    targets = [
+        TableTarget(
+            table_name=table_name,
+            row_estimate=row_estimate,
+            change_token=f"{modified}|{row_estimate}|{modifications}|{stats_updated}",
+        )
+        for table_name, row_estimate, modified, modifications, stats_updated in cursor.fetchall()
+    ]
+    if manifest_path is not None:
+        wanted = {t["name"] for t in json.loads(manifest_path.read_text())["tables"]}
+        targets = [t for t in targets if t.table_name in wanted]
+    return sorted(targets, key=lambda t: (-t.row_estimate, t.table_name))
+
+
+class ConnectionPool:
+    """Fixed set of open connections handed out one per worker thread.
+    pymssql releases the GIL while waiting on the server, so threads overlap
+    the scans; each connection is only ever used by one thread at a time."""
+
+    def __init__(self, *, connect: Callable[[], Any], size: int) -> None:
+        self._idle: queue.Queue[Any] = queue.Queue()
+        self._all = [connect() for _ in range(size)]
+        for connection in self._all:
+            self._idle.put(connection)
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        for connection in self._all:
+            connection.close()
+
+
+def _profile_path(*, out_dir: Path, database: str, table_name: str) -> Path:
+    return out_dir / database / f"{table_name}.json"
+
+
+def _is_current(*, path: Path, change_token: str, options: dict[str, Any]) -> bool:
+    """True when the stored profile was taken at this change token with the same options."""
+    try:
+        stored = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return False
+    return stored.get("change_token") == change_token and stored.get("options") == options
+
+
+@dataclass(frozen=True)
+class TableRunResult:
+    table_name: str
+    row_estimate: int
+    skipped: bool
+    seconds: float = 0.0
+
+
+def profile_database(
+    *,
+    pool: ConnectionPool,
+    database: str,
+    targets: list[TableTarget],
+    workers: int,
+    out_dir: Path = PROFILES_DIR,
+    approx_distinct: bool = False,
+    sample_percent: float | None = None,
+    force: bool = False,
+) -> list[TableRunResult]:
+    """Profile `targets` concurrently and write one `DatasetProfile` JSON each.
+
+    Submitted largest-first, so the long scans start immediately and the
+    small tables fill in around them instead of one big table running alone
+    at the end. Tables whose change token matches their stored profile are
+    skipped unless `force`."""
+    options = {"approx_distinct": approx_distinct, "sample_percent": sample_percent}
+
+    def run(target: TableTarget) -> TableRunResult:
+        path = _profile_path(out_dir=out_dir, database=database, table_name=target.table_name)
+        if not force and _is_current(path=path, change_token=target.change_token, options=options):
+            return TableRunResult(table_name=target.table_name, row_estimate=target.row_estimate, skipped=True)
+        started = time.perf_counter()
+        with pool.connection() as connection:
+            profile = profile_table(
+                connection=connection, database=database, table=target.table_name,
+                approx_distinct=approx_distinct, sample_percent=sample_percent,
+            )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(
+            {"change_token": target.change_token, "options": options, "profile": profile.to_dict()},
+            indent=2,
+        ) + "\n")
+        return TableRunResult(
+            table_name=target.table_name, row_estimate=target.row_estimate,
+            skipped=False, seconds=time.perf_counter() - started,
+        )
+
+    results: list[TableRunResult] = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [executor.submit(run, target) for target in targets]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if result.skipped:
+                print(f"  {result.table_name:<40} unchanged — skipped")
+            else:
+                print(f"  {result.table_name:<40} ~{result.row_estimate:>12,} rows  {result.seconds:7.2f}s")
+    return results
+
+
 def surface_bank_value(profile: DatasetProfile) -> str:
     """The 'context added value info to the bank' framing — translates the
     raw profile into what Frank's team would actually care about, not a
@@ -144,7 +401,45 @@ def surface_bank_value(profile: DatasetProfile) -> str:
     return "\n".join(lines)
 
 
+def _profile_all(*, connect: Callable[[], Any], args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+    pool = ConnectionPool(connect=connect, size=max(1, args.workers))
+    try:
+        with pool.connection() as connection:
+            targets = list_tables(connection=connection, manifest_path=args.manifest)
+        print(f"Profiling {len(targets)} tables in LoopCapitalAM with {args.workers} connections "
+              f"-> {args.out_dir / 'LoopCapitalAM'}")
+        results = profile_database(
+            pool=pool, database="LoopCapitalAM", targets=targets, workers=args.workers,
+            out_dir=args.out_dir, approx_distinct=args.approx_distinct,
+            sample_percent=args.sample_percent, force=args.force,
+        )
+    finally:
+        pool.close()
+    skipped = sum(r.skipped for r in results)
+    print(f"\n{len(results) - skipped} profiled, {skipped} unchanged, "
+          f"{time.perf_counter() - started:.2f}s total.")
+    return 0
+
+
 def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--table", default="dbo.holdings_raw", help="schema.table to profile (default: dbo.holdings_raw)")
+    parser.add_argument("--approx-distinct", action="store_true",
+                        help="APPROX_COUNT_DISTINCT instead of exact COUNT(DISTINCT) (~2%% error, far less memory)")
+    parser.add_argument("--sample-percent", type=float, default=None,
+                        help="profile a TABLESAMPLE of this many percent of pages instead of every row")
+    parser.add_argument("--all", action="store_true",
+                        help="profile every table in the database (largest first, concurrently) into --out-dir")
+    parser.add_argument("--manifest", type=Path, default=None,
+                        help=f"with --all: only the tables named in this manifest (e.g. {MANIFEST_PATH.name})")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"with --all: concurrent connections (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--out-dir", type=Path, default=PROFILES_DIR,
+                        help="with --all: where per-table DatasetProfile JSON is written")
+    parser.add_argument("--force", action="store_true", help="with --all: re-profile unchanged tables too")
+    args = parser.parse_args()
+
     try:
         import pymssql
     except ImportError:
@@ -160,17 +455,28 @@ def main() -> int:
     # (brightbot/tools/warehouse_connections.py:277-286) — encryption
     # disabled here since this sandbox has no TLS cert configured, unlike
     # a real Azure/RDS target where encryption="require" is the default.
-    connection = pymssql.connect(
-        server="localhost",
-        port=1433,
-        user="sa",
-        password=password,
-        database="LoopCapitalAM",
-        tds_version="7.4",
-    )
+    def connect() -> Any:
+        return pymssql.connect(
+            server="localhost",
+            port=1433,
+            user="sa",
+            password=password,
+            database="LoopCapitalAM",
+            tds_version="7.4",
+        )
 
+    if args.all:
+        return _profile_all(connect=connect, args=args)
+
+    connection = connect()
     try:
-        profile = profile_table(connection=connection, database="LoopCapitalAM", table="dbo.holdings_raw")
+        profile = profile_table(
+            connection=connection,
+            database="LoopCapitalAM",
+            table=args.table,
+            approx_distinct=args.approx_distinct,
+            sample_percent=args.sample_percent,
+        )
     finally:
         connection.close()
 
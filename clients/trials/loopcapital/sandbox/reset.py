@@ -27,20 +27,36 @@ Scenarios (each maps to a real Golden Case this sandbox exists to prove):
                   1 (Succeeded) — the exact status BrightHive's watchdog
                   must learn to treat differently once Invariant 19 lands.
 
+Every batch goes through sandbox_sql's pooled per-database sessions (one
+login per database for the whole run) when pymssql is available, and falls
+back to one `docker exec sqlcmd` per batch when it isn't.
+
 Usage:
     export MSSQL_SA_PASSWORD='...'
+    uv run --with pymssql python reset.py --scenario baseline   # persistent sessions
     python reset.py --scenario disk-pressure
     python reset.py --scenario type-drift --seed 99   # different RNG seed, same scenario
+    python reset.py --scenario cancelled-run --snapshot --anchor-date 2026-01-15   # seconds once captured
+
+--snapshot: the first run for a (scenario, seed, rows, anchor date) key does
+the full build and captures a backup of LoopCapitalAM; every later run with
+the same key is a single RESTORE ... WITH REPLACE plus the msdb/disk steps
+the backup can't hold (see "Scenario snapshots" below).
 """
 
 from __future__ import annotations
 
 import argparse
+import datetime
+import hashlib
 import os
 import subprocess
 import sys
 import time
 from dataclasses import dataclass
+from pathlib import Path
+
+from sandbox_sql import connect
 
 SCENARIOS = ("baseline", "disk-pressure", "type-drift", "cancelled-run")
 
@@ -58,47 +74,25 @@ class ResetConfig:
 
 
 def sqlcmd(*, database: str, query: str, password: str) -> str:
-    """Runs one batch against the sandbox via docker exec — mirrors setup.sh's
-    own SQLCMD invocation (same -C/-b flags) so this script fails loudly on a
-    real SQL error instead of silently continuing, per the same fix applied
-    to setup.sh after review."""
-    result = subprocess.run(
-        [
-            "docker", "exec", "-i", "loopcapital-sql-sandbox",
-            "/opt/mssql-tools18/bin/sqlcmd",
-            "-S", "localhost", "-U", "sa", "-P", password, "-C", "-b",
-            "-d", database, "-Q", query,
-        ],
-        capture_output=True, text=True,
-    )
-    print(result.stdout)
-    if result.returncode != 0:
-        print(result.stderr, file=sys.stderr)
-        raise RuntimeError(f"sqlcmd failed (exit {result.returncode}) — see stderr above")
-    return result.stdout
+    """Runs one batch on the pooled session for `database` (sandbox_sql) and
+    echoes its output. Fails loudly on a real SQL error — RuntimeError, the
+    same contract setup.sh's SQLCMD -b flag gives — instead of silently
+    continuing, per the same fix applied to setup.sh after review."""
+    output = connect(password=password).sqlcmd(database=database, query=query)
+    if output.strip():
+        print(output)
+    return output
 
 
 def run_sql_file_respecting_use(*, path: str, password: str, default_database: str = "master") -> None:
     """Runs a .sql file's GO-separated batches, switching database on each
-    literal `USE <db>;` batch. Each batch is a SEPARATE docker exec process
-    (no shared session across calls), so a `USE` in one batch has no effect
-    on the next unless THIS function explicitly tracks it and passes -d per
-    batch — confirmed the hard way: an earlier version that ran every batch
-    against a single fixed database silently created holdings_raw in the
-    wrong database, and sqlcmd's own -b strict-error-checking is what
-    surfaced "Invalid object name" instead of failing silently."""
-    with open(path) as f:
-        content = f.read()
-    current_db = default_database
-    for batch in content.split("\nGO"):
-        stripped = batch.strip()
-        if not stripped:
-            continue
-        upper = stripped.upper().rstrip(";")
-        if upper.startswith("USE "):
-            current_db = upper.split(" ", 1)[1].strip()
-            continue
-        sqlcmd(database=current_db, query=batch, password=password)
+    literal `USE <db>;` batch. The switch selects the pooled session for that
+    database rather than sending USE — confirmed the hard way that the
+    database must be tracked explicitly: an earlier version that ran every
+    batch against a single fixed database silently created holdings_raw in
+    the wrong database, and strict error checking is what surfaced "Invalid
+    object name" instead of failing silently."""
+    connect(password=password).run_sql_file(path=path, default_database=default_database)
 
 
 def drop_and_recreate_database(*, password: str) -> None:
@@ -108,6 +102,7 @@ def drop_and_recreate_database(*, password: str) -> None:
     by a container restart, which is exactly what happens between sessions
     since LoopCapitalAM deliberately lives on the ephemeral tmpfs mount)."""
     print("Dropping LoopCapitalAM if it exists (ground zero)...")
+    connect(password=password).release(database="LoopCapitalAM")  # our own session would block the DROP
     sqlcmd(
         database="master",
         query="IF EXISTS (SELECT name FROM sys.databases WHERE name = 'LoopCapitalAM') "
@@ -159,25 +154,19 @@ def create_agent_jobs_and_wait(*, password: str, timeout_s: int = 60) -> None:
         path="sql/02_create_agent_jobs.sql", password=password, default_database="msdb"
     )
     print("Waiting for both Agent jobs to reach a terminal history row...")
+    client = connect(password=password)
     elapsed = 0
     while True:
-        output = sqlcmd(
+        # One round trip on the pooled msdb session per poll. The value is read
+        # as a scalar, not parsed out of printed output (caught in review: an
+        # earlier version compared sqlcmd's WHOLE multi-line output to "2",
+        # which never matched and looped until the timeout every time).
+        completed = str(client.scalar(
             database="msdb",
             query="SET NOCOUNT ON; SELECT COUNT(DISTINCT j.job_id) FROM sysjobs j "
             "JOIN sysjobhistory h ON h.job_id = j.job_id WHERE h.step_id = 0 "
             "AND j.name IN ('LoopCapital_NightlyExtract_OK', 'LoopCapital_NightlyExtract_FAILED');",
-            password=password,
-        )
-        # sqlcmd's default output includes a header row + a "---" separator
-        # before the value — take the last non-empty, non-dash line rather
-        # than assuming the whole output is bare (caught in review: an
-        # earlier version compared the WHOLE multi-line output to "2",
-        # which never matched and looped until the timeout every time).
-        data_lines = [
-            line.strip() for line in output.splitlines()
-            if line.strip() and not line.strip().startswith("-")
-        ]
-        completed = data_lines[-1] if data_lines else ""
+        ))
         if completed == "2":
             print("  Both jobs have a terminal history row.")
             return
@@ -187,7 +176,58 @@ def create_agent_jobs_and_wait(*, password: str, timeout_s: int = 60) -> None:
         elapsed += 2
 
 
+def fill_disk() -> None:
+    print("Scenario 'disk-pressure' (GC-15): delegating to fill_disk.sh...")
+    result = subprocess.run(["./fill_disk.sh"], capture_output=True, text=True)
+    print(result.stdout)
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        raise RuntimeError("fill_disk.sh failed")
+
+
+def append_type_drift_row(*, password: str) -> None:
+    print("Scenario 'type-drift' (GC-16): appending rows with quantity written as a "
+          "string, simulating a NUMBER->FLOAT source-column drift...")
+    # holdings_raw.quantity is DECIMAL(18,4) — a real drift would arrive
+    # via SSIS writing a value the column can't natively hold without an
+    # implicit conversion. This inserts a value that SUCCEEDS today
+    # (DECIMAL accepts a numeric string) but fails once the demo's
+    # "real" drift scenario narrows the column further — left here as
+    # the seed hook GC-16's e2e test can extend once BH-1047 exists to
+    # react to it; this script's job is producing the drifted ROW, not
+    # simulating BH-1047's classification logic.
+    sqlcmd(
+        database="LoopCapitalAM",
+        query="""
+        INSERT INTO holdings_raw (portfolio_id, instrument_id, quantity, as_of_date)
+        VALUES ('PORT-001', 'INST-DRIFT', CAST('99999.9999' AS DECIMAL(18,4)),
+                CAST(SYSUTCDATETIME() AS DATE));
+        """,
+        password=password,
+    )
+
+
+def mark_latest_ok_run_cancelled(*, password: str) -> None:
+    print("Scenario 'cancelled-run' (GC-14): marking the OK job's latest run as "
+          "Cancelled (status=3) instead of Succeeded...")
+    sqlcmd(
+        database="msdb",
+        query="""
+        UPDATE h SET h.run_status = 3
+        FROM sysjobhistory h JOIN sysjobs j ON j.job_id = h.job_id
+        WHERE j.name = 'LoopCapital_NightlyExtract_OK' AND h.step_id = 0
+          AND h.instance_id = (
+            SELECT MAX(instance_id) FROM sysjobhistory h2
+            WHERE h2.job_id = h.job_id AND h2.step_id = 0
+          );
+        """,
+        password=password,
+    )
+
+
 def apply_scenario(*, config: ResetConfig, password: str) -> None:
+    if config.scenario not in SCENARIOS:
+        raise ValueError(f"Unknown scenario: {config.scenario}")
     seed_baseline(
         password=password,
         row_count=config.row_count,
@@ -196,59 +236,136 @@ def apply_scenario(*, config: ResetConfig, password: str) -> None:
     )
     create_agent_jobs_and_wait(password=password)
 
-    if config.scenario == "baseline":
-        return
-
     if config.scenario == "disk-pressure":
-        print("Scenario 'disk-pressure' (GC-15): delegating to fill_disk.sh...")
-        result = subprocess.run(["./fill_disk.sh"], capture_output=True, text=True)
-        print(result.stdout)
-        if result.returncode != 0:
-            print(result.stderr, file=sys.stderr)
-            raise RuntimeError("fill_disk.sh failed")
-        return
+        fill_disk()
+    elif config.scenario == "type-drift":
+        append_type_drift_row(password=password)
+    elif config.scenario == "cancelled-run":
+        mark_latest_ok_run_cancelled(password=password)
+
+
+# ── Scenario snapshots (--snapshot) ───────────────────────────────
+#
+# A scenario touches three places, and only one of them is LoopCapitalAM:
+#   * LoopCapitalAM — schema, seed rows, the type-drift row. Captured as a
+#     COPY_ONLY full backup after the first build and restored WITH REPLACE
+#     on every later reset with the same key.
+#   * msdb — the Agent jobs and their history (cancelled-run edits it). Not
+#     in the backup; rebuilt only when the jobs are missing or their latest
+#     OK-job outcome doesn't match the scenario, so a warm reset skips the
+#     sp_start_job wait entirely.
+#   * the tmpfs volume — fill_disk.sh's filler file. Always re-run for
+#     disk-pressure (it is idempotent, sized absolutely).
+#
+# Backups live on the container's persistent system volume, not the tmpfs:
+# a .bak on the tmpfs would itself eat the free space GC-15 measures, and
+# would vanish with the tmpfs on every container restart. RESTORE recreates
+# the .mdf/.ldf at their original tmpfs paths either way.
+
+SNAPSHOT_DIR = "/var/opt/mssql/backup/scenarios"
+_OK_JOB_LATEST_STATUS_SQL = """
+SET NOCOUNT ON;
+SELECT TOP 1 h.run_status
+FROM sysjobhistory h JOIN sysjobs j ON j.job_id = h.job_id
+WHERE j.name = 'LoopCapital_NightlyExtract_OK' AND h.step_id = 0
+ORDER BY h.instance_id DESC;
+"""
+_JOBS_READY_SQL = """
+SET NOCOUNT ON;
+SELECT COUNT(DISTINCT j.job_id) FROM sysjobs j
+JOIN sysjobhistory h ON h.job_id = j.job_id WHERE h.step_id = 0
+AND j.name IN ('LoopCapital_NightlyExtract_OK', 'LoopCapital_NightlyExtract_FAILED');
+"""
 
+
+def snapshot_path(*, config: ResetConfig) -> str:
+    """Backup file for this scenario key: scenario, seed, row count and the
+    effective anchor date — today's date when none is pinned, since an
+    unpinned seed (and type-drift's row) slides with the calendar. A
+    fingerprint of sql/01 and this script invalidates snapshots whenever the
+    schema or seed logic changes."""
+    today = datetime.date.today().isoformat()
+    anchor = config.anchor_date or f"today-{today}"
     if config.scenario == "type-drift":
-        print("Scenario 'type-drift' (GC-16): appending rows with quantity written as a "
-              "string, simulating a NUMBER->FLOAT source-column drift...")
-        # holdings_raw.quantity is DECIMAL(18,4) — a real drift would arrive
-        # via SSIS writing a value the column can't natively hold without an
-        # implicit conversion. This inserts a value that SUCCEEDS today
-        # (DECIMAL accepts a numeric string) but fails once the demo's
-        # "real" drift scenario narrows the column further — left here as
-        # the seed hook GC-16's e2e test can extend once BH-1047 exists to
-        # react to it; this script's job is producing the drifted ROW, not
-        # simulating BH-1047's classification logic.
-        sqlcmd(
-            database="LoopCapitalAM",
-            query="""
-            INSERT INTO holdings_raw (portfolio_id, instrument_id, quantity, as_of_date)
-            VALUES ('PORT-001', 'INST-DRIFT', CAST('99999.9999' AS DECIMAL(18,4)),
-                    CAST(SYSUTCDATETIME() AS DATE));
-            """,
-            password=password,
-        )
-        return
+        anchor += f"-drift-{today}"  # the drift row is stamped with the build day
+    fingerprint = hashlib.sha256(
+        Path("sql/01_create_database.sql").read_bytes() + Path(__file__).read_bytes()
+    ).hexdigest()[:12]
+    return (
+        f"{SNAPSHOT_DIR}/LoopCapitalAM__{config.scenario}__seed{config.rng_seed}"
+        f"__rows{config.row_count}__{anchor}__{fingerprint}.bak"
+    )
+
+
+def snapshot_exists(*, path: str, password: str) -> bool:
+    exists = connect(password=password).scalar(
+        database="master", query=f"EXEC master.dbo.xp_fileexist N'{path}';"
+    )
+    return str(exists) == "1"
 
+
+def capture_snapshot(*, path: str, password: str) -> None:
+    print(f"Capturing scenario snapshot -> {path}")
+    client = connect(password=password)
+    client.execute(database="master", query=f"EXEC master.dbo.xp_create_subdir N'{SNAPSHOT_DIR}';")
+    client.execute(
+        database="master",
+        query=f"BACKUP DATABASE LoopCapitalAM TO DISK = N'{path}' WITH COPY_ONLY, INIT, FORMAT;",
+    )
+
+
+def restore_snapshot(*, path: str, password: str) -> None:
+    """Ground zero in one RESTORE. SINGLE_USER first so a lingering session
+    (a watchdog dry run, SSMS) can't block it; the restored database comes
+    back in the state it was backed up in — MULTI_USER."""
+    print(f"Restoring LoopCapitalAM from scenario snapshot {path} ...")
+    client = connect(password=password)
+    client.release(database="LoopCapitalAM")
+    client.execute(
+        database="master",
+        query="IF DATABASEPROPERTYEX('LoopCapitalAM', 'Status') = 'ONLINE' "
+        "ALTER DATABASE LoopCapitalAM SET SINGLE_USER WITH ROLLBACK IMMEDIATE;",
+    )
+    client.execute(database="master", query=f"RESTORE DATABASE LoopCapitalAM FROM DISK = N'{path}' WITH REPLACE;")
+
+
+def ensure_agent_jobs(*, config: ResetConfig, password: str) -> None:
+    """msdb half of a warm reset: keep the existing jobs when their history
+    already matches the scenario (latest OK-job outcome Cancelled=3 for
+    cancelled-run, anything else otherwise); recreate them otherwise."""
+    client = connect(password=password)
+    ready = str(client.scalar(database="msdb", query=_JOBS_READY_SQL)) == "2"
+    latest = client.scalar(database="msdb", query=_OK_JOB_LATEST_STATUS_SQL)
+    cancelled = latest is not None and str(latest) == "3"
+    if ready and cancelled == (config.scenario == "cancelled-run"):
+        print("Agent jobs already have terminal history matching this scenario — keeping them.")
+        return
+    if not (ready and config.scenario == "cancelled-run"):
+        create_agent_jobs_and_wait(password=password)
     if config.scenario == "cancelled-run":
-        print("Scenario 'cancelled-run' (GC-14): marking the OK job's latest run as "
-              "Cancelled (status=3) instead of Succeeded...")
-        sqlcmd(
-            database="msdb",
-            query="""
-            UPDATE h SET h.run_status = 3
-            FROM sysjobhistory h JOIN sysjobs j ON j.job_id = h.job_id
-            WHERE j.name = 'LoopCapital_NightlyExtract_OK' AND h.step_id = 0
-              AND h.instance_id = (
-                SELECT MAX(instance_id) FROM sysjobhistory h2
-                WHERE h2.job_id = h.job_id AND h2.step_id = 0
-              );
-            """,
+        mark_latest_ok_run_cancelled(password=password)
+
+
+def apply_scenario_from_snapshot(*, config: ResetConfig, password: str, rebuild: bool = False) -> None:
+    """--snapshot: restore LoopCapitalAM from this scenario's backup when one
+    exists, otherwise build it in full once and capture the backup."""
+    path = snapshot_path(config=config)
+    if not rebuild and snapshot_exists(path=path, password=password):
+        restore_snapshot(path=path, password=password)
+    else:
+        drop_and_recreate_database(password=password)
+        seed_baseline(
             password=password,
+            row_count=config.row_count,
+            rng_seed=config.rng_seed,
+            anchor_date=config.anchor_date,
         )
-        return
-
-    raise ValueError(f"Unknown scenario: {config.scenario}")
+        if config.scenario == "type-drift":
+            append_type_drift_row(password=password)
+        capture_snapshot(path=path, password=password)
+    ensure_agent_jobs(config=config, password=password)
+    if config.scenario == "disk-pressure":
+        fill_disk()
 
 
 def main() -> int:
@@ -266,6 +383,15 @@ def main() -> int:
             "for a baseline that stays identical across rebuilds on any day."
         ),
     )
+    parser.add_argument(
+        "--snapshot",
+        action="store_true",
+        help="restore LoopCapitalAM from this scenario's backup (taken after the first full build) "
+        "instead of rebuilding it (env: LOOPCAPITAL_SNAPSHOT=1)",
+    )
+    parser.add_argument(
+        "--rebuild-snapshot", action="store_true", help="with --snapshot: full build and re-capture"
+    )
     args = parser.parse_args()
 
     password = os.environ.get("MSSQL_SA_PASSWORD")
@@ -280,10 +406,17 @@ def main() -> int:
         anchor_date=args.anchor_date or os.environ.get("LOOPCAPITAL_ANCHOR_DATE"),
     )
 
-    drop_and_recreate_database(password=password)
-    apply_scenario(config=config, password=password)
-
-    print(f"\nReset complete — scenario '{config.scenario}' applied.")
+    started = time.monotonic()
+    try:
+        if args.snapshot or os.environ.get("LOOPCAPITAL_SNAPSHOT") == "1":
+            apply_scenario_from_snapshot(config=config, password=password, rebuild=args.rebuild_snapshot)
+        else:
+            drop_and_recreate_database(password=password)
+            apply_scenario(config=config, password=password)
+    finally:
+        connect(password=password).close()
+
+    print(f"\nReset complete — scenario '{config.scenario}' applied in {time.monotonic() - started:.1f}s.")
     print("Run ./validate.sh (for disk-pressure) or query holdings_raw/sysjobhistory directly to confirm.")
     return 0
 
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Shared SQL client for the Loop Capital sandbox scripts — one persistent
+TDS session per database instead of one `docker exec ... sqlcmd` per batch.
+
+reset.py, disk_reclaim/seed_bloat.py, disk_reclaim/monitor.py and
+disk_reclaim/run_demo.py each used to shell out to the container's sqlcmd for
+every batch: `run_sql_file_respecting_use` spawned a process per `GO` batch,
+`create_agent_jobs_and_wait` one per 2s poll, seed_bloat one per simulated
+night. Every spawn paid docker exec + sqlcmd start-up + a fresh login.
+
+`SandboxSQL` keeps one autocommit pymssql connection per database, opened on
+first use and reused for every later batch — the same connection shape
+profile_warehouse.py and manifest/synthesize.py already use. A `USE <db>`
+batch in a .sql file switches which pooled session the following batches go
+to (it is never sent, so a pooled session never silently changes database
+underneath its key). SQL errors raise RuntimeError, the same contract
+sqlcmd's -b gave the callers.
+
+pymssql is optional: setup.sh runs `python3 reset.py` and the disk_reclaim
+venv only carries dbt, so without pymssql every call falls back to the
+previous docker exec sqlcmd path — same call shape, same results, just one
+process per batch again.
+
+    client = connect(password=os.environ["MSSQL_SA_PASSWORD"])
+    client.run_sql_file(path="sql/01_create_database.sql")
+    client.sqlcmd(database="LoopCapitalAM", query="SELECT COUNT(*) FROM holdings_raw;")
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+try:
+    import pymssql
+except ImportError:  # plain python3 (setup.sh) or the dbt-only disk_reclaim venv
+    pymssql = None
+
+CONTAINER = "loopcapital-sql-sandbox"
+SQLCMD_BIN = "/opt/mssql-tools18/bin/sqlcmd"
+DEFAULT_HOST = "127.0.0.1"  # NOT localhost — IPv6 ::1 stalls TLS on the emulated container
+DEFAULT_PORT = 1433
+
+# `GO` alone on a line ends a batch (sqlcmd's rule; case-insensitive).
+_GO_LINE = re.compile(r"^[ \t]*GO[ \t]*;?[ \t]*$", re.IGNORECASE | re.MULTILINE)
+_USE_BATCH = re.compile(r"^USE\s+\[?([^\]\s;]+)\]?\s*;?$", re.IGNORECASE)
+
+ResultSet = list[tuple[Any, ...]]
+
+
+def split_batches(content: str) -> list[str]:
+    """A .sql file's GO-separated batches, blank batches dropped."""
+    return [batch for batch in _GO_LINE.split(content) if batch.strip()]
+
+
+def use_target(batch: str) -> str | None:
+    """The database a batch switches to when it is just `USE <db>;` (comments
+    allowed around it), else None."""
+    code = "\n".join(
+        line for line in batch.splitlines() if line.strip() and not line.strip().startswith("--")
+    ).strip()
+    match = _USE_BATCH.match(code)
+    return match.group(1) if match else None
+
+
+def _render(result_sets: list[ResultSet]) -> str:
+    """Result sets as plain text, one row per line — for printing, the way
+    sqlcmd's output used to be echoed."""
+    return "\n\n".join(
+        "\n".join("  ".join("NULL" if v is None else str(v) for v in row) for row in rows)
+        for rows in result_sets
+    )
+
+
+class SandboxSQL:
+    """Pooled sessions against the sandbox's SQL Server, keyed by database."""
+
+    def __init__(self, *, password: str, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        self._password = password
+        self._host = host
+        self._port = port
+        self._sessions: dict[str, Any] = {}
+
+    @property
+    def persistent(self) -> bool:
+        """False when pymssql isn't installed and every batch is a docker exec."""
+        return pymssql is not None
+
+    # ── Public call shape ──────────────────────────────────────────
+
+    def execute(self, *, database: str, query: str) -> list[ResultSet]:
+        """Run one batch; returns every result set it produced. On the
+        docker exec fallback, all rows come back as one result set of strings."""
+        if not self.persistent:
+            return [self._docker_rows(database=database, query=query)]
+        cursor = self._session(database).cursor()
+        try:
+            cursor.execute(query)
+            result_sets: list[ResultSet] = []
+            while True:
+                if cursor.description:
+                    result_sets.append(cursor.fetchall())
+                if not cursor.nextset():
+                    return result_sets
+        except pymssql.Error as exc:
+            raise RuntimeError(f"SQL batch failed against {database}: {exc}") from exc
+
+    def scalar(self, *, database: str, query: str) -> Any:
+        """First column of the first row of the last result set (None if empty)."""
+        result_sets = [rows for rows in self.execute(database=database, query=query) if rows]
+        return result_sets[-1][0][0] if result_sets else None
+
+    def sqlcmd(self, *, database: str, query: str) -> str:
+        """Run one batch and return its output as text — the old `sqlcmd()` shape."""
+        if not self.persistent:
+            return self._docker_sqlcmd(database=database, query=query)
+        return _render(self.execute(database=database, query=query))
+
+    def run_sql_file(self, *, path: str | Path, default_database: str = "master") -> None:
+        """Run a .sql file's GO-separated batches, switching database on each
+        `USE <db>;` batch. The switch picks another pooled session rather than
+        sending USE, so each session stays in the database it is keyed by."""
+        current_db = default_database
+        for batch in split_batches(Path(path).read_text()):
+            target = use_target(batch)
+            if target is not None:
+                current_db = target
+                continue
+            self.execute(database=current_db, query=batch)
+
+    def release(self, *, database: str) -> None:
+        """Close the pooled session for `database` — required before DROP DATABASE,
+        which fails while any session (ours included) is still using it."""
+        session = self._sessions.pop(database.lower(), None)
+        if session is not None:
+            session.close()
+
+    def close(self) -> None:
+        for database in list(self._sessions):
+            self.release(database=database)
+
+    # ── Internals ──────────────────────────────────────────────────
+
+    def _session(self, database: str) -> Any:
+        key = database.lower()
+        if key not in self._sessions:
+            try:
+                self._sessions[key] = pymssql.connect(
+                    server=self._host, port=self._port, user="sa", password=self._password,
+                    database=database, autocommit=True, tds_version="7.4", login_timeout=30,
+                )
+            except pymssql.Error as exc:
+                raise RuntimeError(f"could not open a session on {database}: {exc}") from exc
+        return self._sessions[key]
+
+    def _docker_sqlcmd(self, *, database: str, query: str, extra: tuple[str, ...] = ()) -> str:
+        result = subprocess.run(
+            [
+                "docker", "exec", "-i", CONTAINER, SQLCMD_BIN,
+                "-S", "localhost", "-U", "sa", "-P", self._password, "-C", "-b",
+                "-d", database, *extra, "-Q", query,
+            ],
+            capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            print(result.stdout)
+            print(result.stderr, file=sys.stderr)
+            raise RuntimeError(f"sqlcmd failed (exit {result.returncode}) — see stderr above")
+        return result.stdout
+
+    def _docker_rows(self, *, database: str, query: str) -> ResultSet:
+        # Headerless, trimmed, tab-separated — one data row per line.
+        output = self._docker_sqlcmd(database=database, query=query, extra=("-h", "-1", "-W", "-s", "\t"))
+        return [
+            tuple(None if v == "NULL" else v for v in line.split("\t"))
+            for line in output.splitlines()
+            if line.strip() and not line.startswith("(")  # skip "(N rows affected)"
+        ]
+
+
+_CLIENTS: dict[str, SandboxSQL] = {}
+
+
+def connect(*, password: str) -> SandboxSQL:
+    """The process-wide client for this password, so every caller in one run
+    shares the same pooled sessions. Host/port honour MSSQL_HOST/MSSQL_PORT."""
+    if password not in _CLIENTS:
+        _CLIENTS[password] = SandboxSQL(
+            password=password,
+            host=os.environ.get("MSSQL_HOST", DEFAULT_HOST),
+            port=int(os.environ.get("MSSQL_PORT", str(DEFAULT_PORT))),
+        )
+    return _CLIENTS[password]
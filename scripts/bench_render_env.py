@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Benchmark `flatten_aws_export` on a synthetic multi-env Secrets Manager export.
+
+Usage:
+    scripts/bench_render_env.py                    # 5000 secrets, 5 runs
+    scripts/bench_render_env.py --secrets 20000 --runs 3
+
+The synthetic export mirrors the *lead-style shape: each entry carries a
+`value_parsed` dict with CamelCase keys (so normalization does real work),
+nested connection blocks, and a mix of keys that are unique per secret,
+redundantly shared with identical values, and genuinely colliding.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from render_env import flatten_aws_export  # noqa: E402
+
+ENVS: tuple[str, ...] = ("dev", "staging", "prod", "demo", "sandbox")
+
+
+def synthetic_export(n_secrets: int) -> list[dict[str, Any]]:
+    """Build `n_secrets` entries spread across ENVS with shared + colliding keys."""
+    entries: list[dict[str, Any]] = []
+    for i in range(n_secrets):
+        env = ENVS[i % len(ENVS)]
+        entries.append(
+            {
+                "name": f"{env}/Platform-Service-{i}/Credentials",
+                "value_parsed": {
+                    f"ServiceUser{i}": f"user-{i}",
+                    f"ServicePassword{i}": f"pw-{i:08d}",
+                    "RegionName": "us-east-1",              # redundant, same value
+                    "ApiBaseUrl": f"https://{env}.example.io",  # collides across envs
+                    "Connection": {
+                        "HostName": f"db-{i}.{env}.internal",
+                        "PortNumber": 5432,
+                        "Options": [{"SslMode": "require"}, {"Timeout": 30}],
+                    },
+                },
+            }
+        )
+    return entries
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--secrets", type=int, default=5000)
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    entries = synthetic_export(args.secrets)
+    timings: list[float] = []
+    result: dict[str, Any] = {}
+    for _ in range(args.runs):
+        # flatten_aws_export reports collisions on stderr — keep the bench quiet.
+        with contextlib.redirect_stderr(io.StringIO()):
+            start = time.perf_counter()
+            result = flatten_aws_export(entries)
+            timings.append(time.perf_counter() - start)
+
+    print(f"flatten_aws_export: {args.secrets} secrets, {args.runs} runs")
+    print(f"  keys out : {len(result)}")
+    print(f"  best     : {min(timings) * 1000:.1f} ms")
+    print(f"  median   : {statistics.median(timings) * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,14 @@
 Reads `clients/trials/<slug>/poc.yaml` and writes
 `clients/trials/<slug>/TRACKER.md`. Posts a state + diff message to the
 configured Slack channel unless `--no-slack` is set.
+
+`--all-clients` refreshes every trial in one process: one union Jira fetch,
+one PR listing per distinct repo, then a per-client render + Slack post.
+
+`--serve` keeps the process alive and refreshes every `--interval` seconds
+or on `POST /refresh` (see `serve.py`). The Jira connection, parsed configs
+and section caches stay warm, and Slack is only posted when the diff is
+non-empty.
 """
 
 from __future__ import annotations
@@ -12,14 +20,31 @@ import logging
 import shutil
 import subprocess
 import sys
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from .github_client import fetch_prs_referencing_tickets
-from .jira_client import fetch_tickets
-from .loader import load_config
-from .renderer import compute_phase_progress, render_tracker
-from .slack_notify import post_to_slack
-from .snapshot import build_snapshot, diff_snapshots, load_snapshot, save_snapshot
+from .github_client import (
+    GitHubPR,
+    fetch_prs_by_repo,
+    fetch_prs_referencing_tickets,
+    link_prs_to_tickets,
+)
+from .history import TrackerHistory, history_path
+from .jira_client import JiraSession, JiraTicket, fetch_tickets, fetch_tickets_for_clients
+from .loader import (
+    ALL_CLIENTS_JIRA_CACHE_PATH,
+    ALL_CLIENTS_PR_CACHE_PATH,
+    PocConfig,
+    load_all_configs,
+    load_config,
+)
+from .renderer import SectionCache, render_tracker, tracker_content_sha
+from .serve import SERVE_DEFAULT_INTERVAL_S, SERVE_DEFAULT_PORT, WarmConfigs, serve
+from .slack_notify import message_context
+from .slack_queue import SLACK_COALESCE_WINDOW_S, SLACK_QUEUE_PATH, SlackQueue
+from .snapshot import diff_snapshots, load_snapshot, save_snapshot
+from .state import TrackerState
 
 logging.basicConfig(level=logging.INFO, format="[tracker] %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
@@ -27,6 +52,17 @@ logger = logging.getLogger(__name__)
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
+@dataclass
+class _Warm:
+    """State `--serve` keeps between refreshes; one-shot runs use the defaults."""
+
+    session: JiraSession | None = None
+    section_caches: dict[str, SectionCache] = field(default_factory=dict)
+    slack_queue: SlackQueue | None = None   # None = --no-slack / --dry-run
+    slack_window_s: float = 0               # coalescing window for queued posts
+    slack_on_change_only: bool = False
+
+
 def _check_preconditions() -> int:
     if not shutil.which("gh"):
         logger.error("`gh` CLI not found on PATH. Run `gh auth login` first.")
@@ -55,75 +91,272 @@ def main(argv: list[str] | None = None) -> int:
         "--client", "-c", default="longaeva",
         help="Client slug — must match a directory under clients/trials/",
     )
+    parser.add_argument(
+        "--all-clients", action="store_true",
+        help="Refresh every clients/trials/*/poc.yaml from one shared fetch (ignores --client).",
+    )
     parser.add_argument("--no-slack", action="store_true", help="Skip Slack post.")
     parser.add_argument(
         "--dry-run", action="store_true",
         help="Print what would change without writing files.",
     )
+    parser.add_argument(
+        "--full-refresh", action="store_true",
+        help="Ignore the local Jira ticket + PR caches and re-pull everything.",
+    )
+    parser.add_argument(
+        "--full-body-match", action="store_true",
+        help="Link PRs by scanning full PR bodies, not just the first 400 chars.",
+    )
+    parser.add_argument(
+        "--serve", action="store_true",
+        help="Stay running: refresh every --interval seconds or on POST /refresh.",
+    )
+    parser.add_argument(
+        "--interval", type=int, default=SERVE_DEFAULT_INTERVAL_S,
+        help=f"--serve refresh interval in seconds (default {SERVE_DEFAULT_INTERVAL_S}).",
+    )
+    parser.add_argument(
+        "--port", type=int, default=SERVE_DEFAULT_PORT,
+        help=f"--serve HTTP port on 127.0.0.1 (default {SERVE_DEFAULT_PORT}).",
+    )
     args = parser.parse_args(argv)
 
     precond = _check_preconditions()
     if precond:
         return precond
 
+    if args.serve:
+        return _serve(args=args)
+
+    warm = _Warm(slack_queue=_slack_queue(args=args))
+    if args.all_clients:
+        configs, errors = load_all_configs(repo_root=REPO_ROOT)
+        code = _run_all_clients(configs=configs, errors=errors, args=args, warm=warm)
+    else:
+        try:
+            configs = [load_config(slug=args.client, repo_root=REPO_ROOT)]
+        except (FileNotFoundError, ValueError) as exc:
+            logger.error("%s", exc)
+            return 2
+        _refresh_client(config=configs[0], args=args, warm=warm)
+        code = 0
+
+    # Posts were only queued above; send them (plus anything a previous
+    # run left behind) now that every tracker is written.
+    if warm.slack_queue is not None and configs and configs[0].auth.slack_bot_token:
+        result = warm.slack_queue.flush(token=configs[0].auth.slack_bot_token)
+        logger.info(
+            "Slack: %d posted · %d left queued · %d dropped.",
+            result.sent, result.deferred, result.dropped,
+        )
+    return code
+
+
+def _slack_queue(*, args: argparse.Namespace) -> SlackQueue | None:
+    if args.no_slack or args.dry_run:
+        return None
+    return SlackQueue(path=REPO_ROOT / SLACK_QUEUE_PATH)
+
+
+def _serve(*, args: argparse.Namespace) -> int:
+    """Warm loop: configs re-parsed only on change, one Jira session throughout."""
+    configs = WarmConfigs(repo_root=REPO_ROOT, slug=None if args.all_clients else args.client)
+    warm = _Warm(
+        slack_queue=_slack_queue(args=args),
+        slack_window_s=SLACK_COALESCE_WINDOW_S,
+        slack_on_change_only=True,
+    )
+    stop_sender = threading.Event()
+
+    def refresh() -> None:
+        loaded, errors = configs.get()
+        if not loaded:
+            raise RuntimeError("; ".join(errors) or "no loadable poc.yaml")
+        if warm.session is None:
+            warm.session = JiraSession(config=loaded[0])
+            token = loaded[0].auth.slack_bot_token
+            if warm.slack_queue is not None and token:
+                threading.Thread(
+                    target=warm.slack_queue.run_forever,
+                    kwargs={"token": token, "stop": stop_sender},
+                    name="tracker-slack", daemon=True,
+                ).start()
+        if args.all_clients:
+            _run_all_clients(configs=loaded, errors=errors, args=args, warm=warm)
+        else:
+            _refresh_client(config=loaded[0], args=args, warm=warm)
+
     try:
-        config = load_config(slug=args.client, repo_root=REPO_ROOT)
-    except (FileNotFoundError, ValueError) as exc:
-        logger.error("%s", exc)
-        return 2
+        return serve(refresh=refresh, interval_s=args.interval, port=args.port)
+    finally:
+        stop_sender.set()
+        if warm.session is not None:
+            warm.session.close()
+
 
+def _refresh_client(*, config: PocConfig, args: argparse.Namespace, warm: _Warm) -> None:
     logger.info("Client: %s · Epic: %s · Repos: %d", config.slug, config.epic, len(config.repos))
 
+    # Dry runs never touch disk, so they always do a full (uncached) fetch.
+    jira_cache_path = None if args.dry_run else REPO_ROOT / config.jira_cache_path
+    pr_cache_path = None if args.dry_run else REPO_ROOT / config.pr_cache_path
+
     logger.info("Fetching Jira tickets…")
-    tickets = fetch_tickets(config=config)
+    tickets = fetch_tickets(
+        config=config, session=warm.session,
+        cache_path=jira_cache_path, full_refresh=args.full_refresh,
+    )
     logger.info("Got %d tickets in scope.", len(tickets))
 
     ticket_keys = {t.key for t in tickets}
     logger.info("Fetching PRs referencing %d ticket keys…", len(ticket_keys))
-    pr_map = fetch_prs_referencing_tickets(ticket_keys=ticket_keys, repos=config.repos)
+    pr_map = fetch_prs_referencing_tickets(
+        ticket_keys=ticket_keys,
+        repos=config.repos,
+        cache_path=pr_cache_path,
+        full_refresh=args.full_refresh,
+        full_body=args.full_body_match,
+    )
     pr_count = sum(len(prs) for prs in pr_map.values())
     logger.info("Linked %d PR references across %d repos.", pr_count, len(config.repos))
 
+    _publish(config=config, tickets=tickets, pr_map=pr_map, args=args, warm=warm)
+
+
+def _run_all_clients(
+    *,
+    configs: list[PocConfig],
+    errors: list[str],
+    args: argparse.Namespace,
+    warm: _Warm,
+) -> int:
+    errors = list(errors)  # per-client failures are appended; don't mutate the caller's list
+    for error in errors:
+        logger.error("%s", error)
+    if not configs:
+        logger.error("No loadable poc.yaml under %s.", REPO_ROOT / "clients" / "trials")
+        return 2
+
+    logger.info("Clients: %s", ", ".join(c.slug for c in configs))
+    jira_cache_path = None if args.dry_run else REPO_ROOT / ALL_CLIENTS_JIRA_CACHE_PATH
+    pr_cache_path = None if args.dry_run else REPO_ROOT / ALL_CLIENTS_PR_CACHE_PATH
+
+    logger.info("Fetching Jira tickets for %d client(s) in one pass…", len(configs))
+    tickets_by_slug = fetch_tickets_for_clients(
+        configs=configs, session=warm.session,
+        cache_path=jira_cache_path, full_refresh=args.full_refresh,
+    )
+
+    repos = tuple(dict.fromkeys(repo for c in configs for repo in c.repos))
+    logger.info(
+        "Listing PRs across %d distinct repo(s) (%d configured)…",
+        len(repos), sum(len(c.repos) for c in configs),
+    )
+    prs_by_repo = fetch_prs_by_repo(
+        repos=repos, cache_path=pr_cache_path, full_refresh=args.full_refresh,
+        full_body=args.full_body_match,
+    )
+
+    for config in configs:
+        tickets = tickets_by_slug[config.slug]
+        pr_map = link_prs_to_tickets(
+            prs_by_repo=prs_by_repo,
+            ticket_keys={t.key for t in tickets},
+            repos=config.repos,
+            full_body=args.full_body_match,
+        )
+        logger.info(
+            "[%s] %d tickets · %d PR references.",
+            config.slug, len(tickets), sum(len(prs) for prs in pr_map.values()),
+        )
+        try:
+            _publish(config=config, tickets=tickets, pr_map=pr_map, args=args, warm=warm)
+        except Exception as exc:  # noqa: BLE001 — one client's failure must not skip the rest
+            logger.exception("[%s] publish failed — continuing with the other clients.", config.slug)
+            errors.append(f"{config.slug}: {type(exc).__name__}: {exc}")
+
+    return 2 if errors else 0
+
+
+def _publish(
+    *,
+    config: PocConfig,
+    tickets: list[JiraTicket],
+    pr_map: dict[str, list[GitHubPR]],
+    args: argparse.Namespace,
+    warm: _Warm,
+) -> None:
+    """Render TRACKER.md, diff against the last snapshot, post to Slack."""
     tracker_path = REPO_ROOT / config.tracker_path
     snapshot_path = REPO_ROOT / config.snapshot_path
+    render_cache_path = REPO_ROOT / config.render_cache_path
     existing_text = tracker_path.read_text() if tracker_path.exists() else None
+    state = TrackerState.build(config=config, tickets=tickets, pr_map=pr_map)
 
+    section_cache = warm.section_caches.get(config.slug)
+    if section_cache is None:
+        section_cache = SectionCache.load(path=render_cache_path)
+        warm.section_caches[config.slug] = section_cache
     new_content = render_tracker(
         config=config,
         tickets=tickets,
         pr_map=pr_map,
         existing_text=existing_text,
+        section_cache=section_cache,
+        state=state,
     )
+    logger.info("Sections: %s", section_cache.summary())
 
     if args.dry_run:
         logger.info("--dry-run: would write %d bytes to %s", len(new_content), tracker_path)
-        return 0
+        return
 
-    tracker_path.parent.mkdir(parents=True, exist_ok=True)
-    tracker_path.write_text(new_content)
-    logger.info("Wrote %s (%d bytes).", tracker_path, len(new_content))
+    section_cache.save(path=render_cache_path)
+    if existing_text is not None and (
+        tracker_content_sha(existing_text) == tracker_content_sha(new_content)
+    ):
+        logger.info("%s unchanged — skipped write.", tracker_path)
+    else:
+        tracker_path.parent.mkdir(parents=True, exist_ok=True)
+        tracker_path.write_text(new_content)
+        logger.info("Wrote %s (%d bytes).", tracker_path, len(new_content))
 
     previous = load_snapshot(path=snapshot_path)
-    current = build_snapshot(tickets=tickets, pr_map=pr_map)
+    current = state.snapshot
     diff = diff_snapshots(previous=previous, current=current)
     save_snapshot(snapshot=current, path=snapshot_path)
+    with TrackerHistory(path=history_path(slug=config.slug, repo_root=REPO_ROOT)) as history:
+        events = history.record(
+            snapshot=current,
+            ticket_categories=state.ticket_statuses,
+        )
+    logger.info("History: recorded %d change event(s).", events)
     logger.info(
         "Diff: %d new ticket(s), %d status change(s), %d new PR(s), %d merged PR(s).",
         len(diff.new_tickets), len(diff.status_changes),
         len(diff.new_prs), len(diff.merged_prs),
     )
 
-    if not args.no_slack:
-        phase_progress = compute_phase_progress(
-            config=config, tickets=tickets, pr_map=pr_map
-        )
-        posted = post_to_slack(
-            config=config, diff=diff, tickets=tickets,
-            pr_map=pr_map, phase_progress=phase_progress,
-        )
-        logger.info("Slack: %s", "posted" if posted else "skipped")
-
-    return 0
+    if warm.slack_queue is None:
+        return
+    if not config.auth.slack_bot_token:
+        logger.info("SLACK_BOT_TOKEN not set — skipping Slack post.")
+        return
+    if not config.slack_channel_id:
+        logger.info("slack.channel_id not configured — skipping Slack post.")
+        return
+    if warm.slack_on_change_only and diff.is_empty:
+        logger.info("Slack: skipped (no change since last refresh)")
+        return
+    merged = warm.slack_queue.enqueue(
+        channel=config.slack_channel_id,
+        slug=config.slug,
+        context=message_context(state=state),
+        diff=diff,
+        window_s=warm.slack_window_s,
+    )
+    logger.info("Slack: %s", "merged into pending post" if merged else "queued")
 
 
 if __name__ == "__main__":
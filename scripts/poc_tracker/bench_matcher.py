@@ -0,0 +1,96 @@
+"""Benchmark PR → ticket linking on a synthetic PR set.
+
+Usage:
+    python -m scripts.poc_tracker.bench_matcher                 # 5000 PRs, 500 tickets
+    python -m scripts.poc_tracker.bench_matcher --prs 20000 --tickets 2000
+
+Compares excerpt-only matching (the default) against `--full-body-match`
+over the same PRs, and reports how many links each field contributed. PR
+bodies are a few KB long and a share of them mention tickets only past the
+400-char excerpt, which is what full-body mode exists to catch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+
+from .github_client import BODY_EXCERPT_CHARS, GitHubPR, PR_MATCH_FIELDS, TicketMatcher
+
+_FILLER = (
+    "Refactors the ingestion worker and updates fixtures. See the design doc "
+    "for context; the migration is backwards compatible. "
+)
+
+
+def synthetic_prs(*, n_prs: int, n_tickets: int, seed: int = 7) -> tuple[list[GitHubPR], set[str]]:
+    """PRs referencing tickets in title, branch, early body, and late body."""
+    rng = random.Random(seed)
+    scope = {f"BH-{1000 + i}" for i in range(n_tickets)}
+    all_keys = [f"BH-{1000 + i}" for i in range(n_tickets * 2)]  # half out of scope
+    prs: list[GitHubPR] = []
+    for number in range(1, n_prs + 1):
+        title_key, branch_key, early_key, late_key = (rng.choice(all_keys) for _ in range(4))
+        body = (
+            f"Fixes {early_key}. " + _FILLER * rng.randint(10, 40)
+            + f"\n\nAlso relates to {late_key}.\n" + _FILLER * rng.randint(0, 10)
+        )
+        prs.append(
+            GitHubPR(
+                repo="brighthive/bench", number=number,
+                title=f"{title_key}: update pipeline", state="OPEN", is_draft=False,
+                author="bench", url=f"https://github.com/brighthive/bench/pull/{number}",
+                body_excerpt=body[:BODY_EXCERPT_CHARS],
+                head_branch=f"feature/{branch_key.lower()}-{branch_key}",
+                body=body,
+            )
+        )
+    return prs, scope
+
+
+def _time_matcher(
+    *, matcher: TicketMatcher, prs: list[GitHubPR], runs: int
+) -> tuple[float, dict[str, int], int]:
+    timings: list[float] = []
+    field_hits: dict[str, int] = {}
+    links = 0
+    for _ in range(runs):
+        field_hits = {field: 0 for field in PR_MATCH_FIELDS}
+        links = 0
+        start = time.perf_counter()
+        for pr in prs:
+            for fields in matcher.match(pr).values():
+                links += 1
+                for field in fields:
+                    field_hits[field] += 1
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), field_hits, links
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--prs", type=int, default=5000)
+    ap.add_argument("--tickets", type=int, default=500)
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    prs, scope = synthetic_prs(n_prs=args.prs, n_tickets=args.tickets)
+    body_kb = sum(len(pr.body) for pr in prs) / 1024
+    print(f"{len(prs)} PRs ({body_kb:,.0f} KB of body text), {len(scope)} tickets in scope")
+    for label, full_body in (("excerpt", False), ("full-body", True)):
+        elapsed, field_hits, links = _time_matcher(
+            matcher=TicketMatcher(scope=scope, full_body=full_body), prs=prs, runs=args.runs,
+        )
+        per_field = ", ".join(f"{field}={n}" for field, n in field_hits.items())
+        print(
+            f"  {label:<9}  median {elapsed * 1000:7.1f} ms  "
+            f"({elapsed / len(prs) * 1e6:5.1f} µs/PR)  {links} links  [{per_field}]"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
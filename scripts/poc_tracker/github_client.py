@@ -2,6 +2,10 @@
 
 Returns PRs across the configured repos that mention any of the given Jira
 ticket keys in title or body. Indexed by ticket key for the renderer.
+
+Repos are listed concurrently (bounded by `GH_MAX_WORKERS`). When a cache
+path is given, PRs are persisted per repo and follow-up refreshes only ask
+`gh` for PRs whose `updatedAt` moved since that repo's last fetch.
 """
 
 from __future__ import annotations
@@ -11,13 +15,33 @@ import logging
 import re
 import shlex
 import subprocess
-from dataclasses import dataclass
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 # Match BH-### in PR title or body. Word-boundary so BH-1234 doesn't catch BH-12.
 TICKET_RE = re.compile(r"\bBH-\d+\b")
 
+PR_LIST_LIMIT = 100
+PR_JSON_FIELDS = "number,title,state,isDraft,author,url,body,headRefName,updatedAt"
+GH_TIMEOUT_S = 60
+GH_MAX_WORKERS = 4
+
+# Incremental listings look back this much further than the last fetch so
+# clock skew between us and GitHub never drops an update.
+PR_CACHE_OVERLAP_MINUTES = 5
+# Past this age a repo's cache is discarded and re-listed in full.
+PR_CACHE_MAX_AGE_HOURS = 24
+PR_CACHE_VERSION = 2
+
+BODY_EXCERPT_CHARS = 400
+# PR text fields scanned for ticket keys, in haystack order.
+PR_MATCH_FIELDS: tuple[str, ...] = ("title", "body", "branch")
+
 
 @dataclass(frozen=True)
 class GitHubPR:
@@ -30,6 +54,8 @@ class GitHubPR:
     url: str
     body_excerpt: str   # first 400 chars
     head_branch: str
+    updated_at: str = ""  # ISO-8601 `updatedAt` from gh; cache freshness key
+    body: str = ""        # full body; kept (and scanned) only in full-body match mode
 
     @property
     def short_repo(self) -> str:
@@ -44,32 +70,150 @@ class GitHubPR:
 
 
 def fetch_prs_referencing_tickets(
-    *, ticket_keys: set[str], repos: tuple[str, ...]
+    *,
+    ticket_keys: set[str],
+    repos: tuple[str, ...],
+    cache_path: Path | None = None,
+    full_refresh: bool = False,
+    max_workers: int = GH_MAX_WORKERS,
+    full_body: bool = False,
 ) -> dict[str, list[GitHubPR]]:
     """Across the configured repos, find PRs that reference a tracker ticket.
 
+    With `cache_path`, each repo with a fresh cache entry is listed
+    incrementally (only PRs updated since its last fetch) and merged into the
+    cached set. `full_refresh` re-lists every repo but still rewrites the cache.
+    `full_body` scans whole PR bodies rather than the 400-char excerpt.
+
     Returns: {ticket_key: [GitHubPR, ...]} — multiple PRs per ticket allowed.
     """
-    by_ticket: dict[str, list[GitHubPR]] = {key: [] for key in ticket_keys}
+    prs_by_repo = fetch_prs_by_repo(
+        repos=repos, cache_path=cache_path,
+        full_refresh=full_refresh, max_workers=max_workers, full_body=full_body,
+    )
+    return link_prs_to_tickets(
+        prs_by_repo=prs_by_repo, ticket_keys=ticket_keys, repos=repos, full_body=full_body,
+    )
+
 
+def fetch_prs_by_repo(
+    *,
+    repos: tuple[str, ...],
+    cache_path: Path | None = None,
+    full_refresh: bool = False,
+    max_workers: int = GH_MAX_WORKERS,
+    full_body: bool = False,
+) -> dict[str, list[GitHubPR]]:
+    """List (and cache) PRs for each repo once — shareable across trackers.
+
+    Whole PR bodies are kept (in memory and in the cache) only with
+    `full_body`; otherwise each PR carries just its excerpt.
+    """
+    now = datetime.now(timezone.utc)
+    cache = (
+        _load_pr_cache(path=cache_path, full_body=full_body)
+        if cache_path and not full_refresh else {}
+    )
+    prs_by_repo = list_prs_for_repos(
+        repos=repos, cache=cache, now=now, max_workers=max_workers, full_body=full_body,
+    )
+    if cache_path:
+        _save_pr_cache(
+            path=cache_path, prs_by_repo=prs_by_repo, fetched_at=now, full_body=full_body,
+        )
+    return prs_by_repo
+
+
+def link_prs_to_tickets(
+    *,
+    prs_by_repo: dict[str, list[GitHubPR]],
+    ticket_keys: set[str],
+    repos: tuple[str, ...],
+    full_body: bool = False,
+) -> dict[str, list[GitHubPR]]:
+    """Index the PRs of `repos` by the in-scope ticket keys they reference.
+
+    With `full_body`, whole PR bodies are scanned instead of the excerpt;
+    links only the full body could find are counted in the log.
+    """
+    matcher = TicketMatcher(scope=ticket_keys, full_body=full_body)
+    by_ticket: dict[str, list[GitHubPR]] = {key: [] for key in ticket_keys}
+    field_hits: dict[str, int] = {field: 0 for field in PR_MATCH_FIELDS}
+    beyond_excerpt = 0
     for repo in repos:
+        for pr in prs_by_repo.get(repo, []):
+            for ticket_key, fields in matcher.match(pr).items():
+                by_ticket[ticket_key].append(pr)
+                for field in fields:
+                    field_hits[field] += 1
+                if fields == ("body",) and ticket_key not in TICKET_RE.findall(pr.body_excerpt):
+                    beyond_excerpt += 1
+
+    if full_body:
+        logger.info(
+            "PR links by field: %s · %d found only past the %d-char body excerpt.",
+            ", ".join(f"{field}={n}" for field, n in field_hits.items()),
+            beyond_excerpt, BODY_EXCERPT_CHARS,
+        )
+    return by_ticket
+
+
+def list_prs_for_repos(
+    *,
+    repos: tuple[str, ...],
+    cache: dict[str, tuple[datetime, list[GitHubPR]]],
+    now: datetime,
+    max_workers: int = GH_MAX_WORKERS,
+    full_body: bool = False,
+) -> dict[str, list[GitHubPR]]:
+    """List PRs for every repo concurrently; repos that fail are skipped.
+
+    `cache` maps repo → (fetched_at, PRs). Fresh entries are refreshed with
+    an `updated:>=` search and merged; stale or missing ones get a full list.
+    Without `full_body`, listed PRs drop their whole body (the excerpt stays).
+    """
+    def _one(repo: str) -> tuple[str, list[GitHubPR] | None]:
+        cached = cache.get(repo)
+        if cached and now - cached[0] <= timedelta(hours=PR_CACHE_MAX_AGE_HOURS):
+            fetched_at, cached_prs = cached
+            since = fetched_at - timedelta(minutes=PR_CACHE_OVERLAP_MINUTES)
+        else:
+            since, cached_prs = None, []
         try:
-            prs = _list_recent_prs(repo=repo)
+            fresh = _list_recent_prs(repo=repo, updated_since=since)
         except subprocess.CalledProcessError as exc:
             logger.warning("Skipping %s — gh exited %s: %s", repo, exc.returncode, exc.stderr)
-            continue
+            return repo, None
+        if not full_body:
+            fresh = [replace(pr, body="") for pr in fresh]
+        if since is not None:
+            logger.info("%s: %d PR(s) updated since last fetch.", repo, len(fresh))
+        return repo, _merge_prs(cached=cached_prs, fresh=fresh)
 
-        for pr in prs:
-            referenced = _extract_referenced_tickets(pr=pr, scope=ticket_keys)
-            for ticket_key in referenced:
-                by_ticket[ticket_key].append(pr)
+    if not repos:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(repos)))) as pool:
+        results = list(pool.map(_one, repos))
+    return {repo: prs for repo, prs in results if prs is not None}
 
-    return by_ticket
 
+def _merge_prs(*, cached: list[GitHubPR], fresh: list[GitHubPR]) -> list[GitHubPR]:
+    """Upsert `fresh` over `cached` by PR number; keep the newest PR_LIST_LIMIT."""
+    by_number = {pr.number: pr for pr in cached}
+    for pr in fresh:
+        by_number[pr.number] = pr
+    merged = sorted(by_number.values(), key=lambda pr: pr.number, reverse=True)
+    return merged[:PR_LIST_LIMIT]
 
-def _list_recent_prs(*, repo: str) -> list[GitHubPR]:
+
+def _list_recent_prs(
+    *, repo: str, updated_since: datetime | None = None
+) -> list[GitHubPR]:
     """`gh pr list` — last 100 PRs in any state, with body for keyword scan.
 
+    With `updated_since`, only PRs updated at or after that instant are
+    returned (GitHub search `updated:>=` qualifier).
+
     Strips GITHUB_TOKEN from the env so `gh` falls back to the keyring auth.
     Local shells often have a fine-grained PAT exported that doesn't cover
     every repo the tracker touches.
@@ -77,9 +221,12 @@ def _list_recent_prs(*, repo: str) -> list[GitHubPR]:
     import os
 
     cmd = (
-        f"gh pr list --repo {shlex.quote(repo)} --state all --limit 100 "
-        f"--json number,title,state,isDraft,author,url,body,headRefName"
+        f"gh pr list --repo {shlex.quote(repo)} --state all --limit {PR_LIST_LIMIT} "
+        f"--json {PR_JSON_FIELDS}"
     )
+    if updated_since is not None:
+        stamp = updated_since.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        cmd += f" --search {shlex.quote(f'updated:>={stamp}')}"
     # Subtract token env vars only — keep PATH/HOME/XDG_CONFIG_HOME so `gh`
     # can find its keyring config and binaries.
     env = {**os.environ}
@@ -90,7 +237,7 @@ def _list_recent_prs(*, repo: str) -> list[GitHubPR]:
         check=True,
         capture_output=True,
         text=True,
-        timeout=60,
+        timeout=GH_TIMEOUT_S,
         env=env,
     )
     raw_prs = json.loads(result.stdout)
@@ -103,15 +250,105 @@ def _list_recent_prs(*, repo: str) -> list[GitHubPR]:
             is_draft=bool(p.get("isDraft", False)),
             author=(p.get("author") or {}).get("login", "unknown"),
             url=p["url"],
-            body_excerpt=(p.get("body") or "")[:400],
+            body_excerpt=(p.get("body") or "")[:BODY_EXCERPT_CHARS],
             head_branch=p.get("headRefName", ""),
+            updated_at=p.get("updatedAt", ""),
+            body=p.get("body") or "",
         )
         for p in raw_prs
     ]
 
 
-def _extract_referenced_tickets(*, pr: GitHubPR, scope: set[str]) -> set[str]:
-    """Find any BH-### tokens in title/body/branch that are in the tracker scope."""
-    haystack = f"{pr.title} {pr.body_excerpt} {pr.head_branch}"
-    found = set(TICKET_RE.findall(haystack))
-    return found & scope
+# ── PR cache ───────────────────────────────────────────────────────
+
+
+def _load_pr_cache(
+    *, path: Path, full_body: bool = False
+) -> dict[str, tuple[datetime, list[GitHubPR]]]:
+    """Cached PRs by repo. A cache saved without whole bodies can't serve
+    full-body matching, so it is treated as empty in that mode."""
+    if not path.exists():
+        return {}
+    try:
+        raw = json.loads(path.read_text())
+        if raw.get("version") != PR_CACHE_VERSION:
+            return {}
+        if full_body and not raw.get("full_bodies"):
+            logger.info("PR cache at %s holds body excerpts only — listing every repo in full.", path)
+            return {}
+        return {
+            repo: (
+                datetime.fromisoformat(entry["fetched_at"]),
+                [
+                    GitHubPR(**row) if full_body else replace(GitHubPR(**row), body="")
+                    for row in entry["prs"]
+                ],
+            )
+            for repo, entry in raw["repos"].items()
+        }
+    except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+        logger.warning("PR cache at %s is unreadable — listing every repo in full.", path)
+        return {}
+
+
+def _save_pr_cache(
+    *,
+    path: Path,
+    prs_by_repo: dict[str, list[GitHubPR]],
+    fetched_at: datetime,
+    full_body: bool = False,
+) -> None:
+    payload = {
+        "version": PR_CACHE_VERSION,
+        "full_bodies": full_body,
+        "repos": {
+            repo: {
+                "fetched_at": fetched_at.isoformat(timespec="seconds"),
+                "prs": [asdict(pr) for pr in prs],
+            }
+            for repo, prs in sorted(prs_by_repo.items())
+        },
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=1, sort_keys=True) + "\n")
+
+
+class TicketMatcher:
+    """Finds in-scope ticket keys in PR text with one compiled scan per PR.
+
+    Built once per scope and reused for every PR. Title, body and branch are
+    joined into a single haystack and scanned with `TICKET_RE`; each hit is
+    kept only if it is in scope and attributed back to its source field via
+    the field offsets. By default the body is the 400-char excerpt; with
+    `full_body=True` the whole PR body is scanned.
+    """
+
+    def __init__(self, *, scope: set[str], full_body: bool = False) -> None:
+        self.scope = frozenset(scope)
+        self.full_body = full_body
+
+    def match(self, pr: GitHubPR) -> dict[str, tuple[str, ...]]:
+        """Return {ticket_key: fields it appeared in}, fields in PR_MATCH_FIELDS order."""
+        if not self.scope:
+            return {}
+        body = (pr.body or pr.body_excerpt) if self.full_body else pr.body_excerpt
+        parts = (pr.title, body, pr.head_branch)
+        haystack = "\n".join(parts)
+        # Offset where each field after the first starts in the haystack.
+        starts: list[int] = []
+        offset = 0
+        for part in parts[:-1]:
+            offset += len(part) + 1
+            starts.append(offset)
+
+        found: dict[str, set[str]] = {}
+        for hit in TICKET_RE.finditer(haystack):
+            key = hit.group()
+            if key in self.scope:
+                field = PR_MATCH_FIELDS[bisect_right(starts, hit.start())]
+                found.setdefault(key, set()).add(field)
+        return {
+            key: tuple(f for f in PR_MATCH_FIELDS if f in fields)
+            for key, fields in found.items()
+        }
+
@@ -0,0 +1,332 @@
+"""Append-only refresh history — every snapshot, queryable after the fact.
+
+`snapshot.py` keeps only the previous refresh for the Slack diff. This store
+keeps all of them in SQLite (stdlib) as change events: a ticket gets a row
+only when its status or status category differs from its last recorded
+one (a PR when its state does), plus a NULL tombstone when it leaves scope. A latest-state table, kept in step with
+every write, answers "state now" (and each refresh's change check) with
+one O(k) scan for k tracked keys. "State as of an earlier T" is one index
+seek on (key, ts) per key, O(k log n) for n events. Either way the answer
+has k rows, so O(k) is the floor. Cycle time and burndown come straight
+from the events, with no Jira calls.
+
+CLI:
+    python -m scripts.poc_tracker.history --client loopcapital as-of 2026-07-10T12:00
+    python -m scripts.poc_tracker.history --client loopcapital diff 2026-07-01 2026-07-10
+    python -m scripts.poc_tracker.history --client loopcapital cycle-time
+    python -m scripts.poc_tracker.history --client loopcapital burndown
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .loader import CLIENTS_DIR
+from .snapshot import TrackerDiff, TrackerSnapshot, diff_snapshots
+
+HISTORY_FILENAME = ".tracker-history.sqlite"
+BURNDOWN_BAR_WIDTH = 40
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS refreshes (ts TEXT PRIMARY KEY) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS known_tickets (key TEXT PRIMARY KEY) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS known_prs (pr TEXT PRIMARY KEY) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS ticket_events (
+    key      TEXT NOT NULL,
+    ts       TEXT NOT NULL,
+    status   TEXT,            -- NULL = left tracker scope
+    category TEXT,            -- Jira statusCategory at the time
+    PRIMARY KEY (key, ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS pr_events (
+    pr     TEXT NOT NULL,     -- repo#num
+    ts     TEXT NOT NULL,
+    state  TEXT,              -- NULL = no longer linked
+    PRIMARY KEY (pr, ts)
+) WITHOUT ROWID;
+-- Newest event per key, i.e. the state as of the latest refresh.
+CREATE TABLE IF NOT EXISTS ticket_latest (
+    key      TEXT PRIMARY KEY,
+    ts       TEXT NOT NULL,
+    status   TEXT,
+    category TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS pr_latest (
+    pr     TEXT PRIMARY KEY,
+    ts     TEXT NOT NULL,
+    state  TEXT
+) WITHOUT ROWID;
+"""
+
+# Latest event per known key at or before :ts — one (key, ts) index seek per
+# key. Only used for points before the latest refresh; see `_tickets_as_of`.
+_TICKETS_AS_OF = """
+SELECT k.key, e.status, e.category
+FROM known_tickets k
+JOIN ticket_events e ON e.key = k.key AND e.ts = (
+    SELECT MAX(ts) FROM ticket_events WHERE key = k.key AND ts <= :ts
+)
+"""
+_PRS_AS_OF = """
+SELECT k.pr, e.state
+FROM known_prs k
+JOIN pr_events e ON e.pr = k.pr AND e.ts = (
+    SELECT MAX(ts) FROM pr_events WHERE pr = k.pr AND ts <= :ts
+)
+"""
+
+
+def normalize_ts(value: str | datetime) -> str:
+    """Canonical UTC ISO-8601 (seconds) so timestamps compare lexically.
+
+    Naive inputs are taken as UTC; date-only strings mean midnight UTC.
+    """
+    parsed = value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+class TrackerHistory:
+    """SQLite-backed event log of tracker refreshes for one client.
+
+    A ticket event is written when its status or its status category moves,
+    so a workflow remap that only changes the category still shows up.
+    """
+
+    def __init__(self, *, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+
+    def __enter__(self) -> TrackerHistory:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._db.close()
+
+    # ── Writes ─────────────────────────────────────────────────────
+
+    def record(
+        self, *, snapshot: TrackerSnapshot, ticket_categories: dict[str, str]
+    ) -> int:
+        """Append one refresh; returns the number of change events written."""
+        ts = normalize_ts(snapshot.timestamp)
+        tickets_now = self._tickets_as_of(ts)
+        prs_now = self._prs_as_of(ts)
+
+        ticket_rows = [
+            (key, ts, status, ticket_categories.get(key))
+            for key, status in snapshot.ticket_statuses.items()
+            if tickets_now.get(key, (None, None)) != (status, ticket_categories.get(key))
+        ]
+        ticket_rows.extend(
+            (key, ts, None, None)
+            for key, (status, _) in tickets_now.items()
+            if status is not None and key not in snapshot.ticket_statuses
+        )
+        pr_rows = [
+            (pr, ts, state)
+            for pr, state in snapshot.pr_states.items()
+            if prs_now.get(pr) != state
+        ]
+        pr_rows.extend(
+            (pr, ts, None)
+            for pr, state in prs_now.items()
+            if state is not None and pr not in snapshot.pr_states
+        )
+
+        with self._db:
+            self._db.execute("INSERT OR IGNORE INTO refreshes (ts) VALUES (?)", (ts,))
+            self._db.executemany(
+                "INSERT OR IGNORE INTO known_tickets (key) VALUES (?)",
+                [(row[0],) for row in ticket_rows],
+            )
+            self._db.executemany(
+                "INSERT OR IGNORE INTO known_prs (pr) VALUES (?)",
+                [(row[0],) for row in pr_rows],
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO ticket_events (key, ts, status, category) "
+                "VALUES (?, ?, ?, ?)",
+                ticket_rows,
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO pr_events (pr, ts, state) VALUES (?, ?, ?)",
+                pr_rows,
+            )
+            self._db.executemany(
+                "INSERT INTO ticket_latest (key, ts, status, category) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET ts = excluded.ts, status = excluded.status, "
+                "category = excluded.category WHERE excluded.ts >= ticket_latest.ts",
+                ticket_rows,
+            )
+            self._db.executemany(
+                "INSERT INTO pr_latest (pr, ts, state) VALUES (?, ?, ?) "
+                "ON CONFLICT (pr) DO UPDATE SET ts = excluded.ts, state = excluded.state "
+                "WHERE excluded.ts >= pr_latest.ts",
+                pr_rows,
+            )
+        return len(ticket_rows) + len(pr_rows)
+
+    # ── Point-in-time queries ──────────────────────────────────────
+
+    def snapshot_as_of(self, *, ts: str | datetime) -> TrackerSnapshot | None:
+        """State at the last refresh at or before `ts`; None if none yet."""
+        at = normalize_ts(ts)
+        row = self._db.execute(
+            "SELECT MAX(ts) FROM refreshes WHERE ts <= ?", (at,)
+        ).fetchone()
+        if row[0] is None:
+            return None
+        return TrackerSnapshot(
+            timestamp=row[0],
+            ticket_statuses={
+                key: status
+                for key, (status, _) in self._tickets_as_of(at).items()
+                if status is not None
+            },
+            pr_states={
+                pr: state for pr, state in self._prs_as_of(at).items() if state is not None
+            },
+        )
+
+    def diff(self, *, start: str | datetime, end: str | datetime) -> TrackerDiff:
+        """What changed between the state as of `start` and as of `end`."""
+        empty = TrackerSnapshot(timestamp="", ticket_statuses={}, pr_states={})
+        previous = self.snapshot_as_of(ts=start) or empty
+        current = self.snapshot_as_of(ts=end) or empty
+        return diff_snapshots(previous=previous, current=current)
+
+    # ── Aggregates ─────────────────────────────────────────────────
+
+    def cycle_times(self) -> dict[str, float]:
+        """Days from first In Progress to first Done, per ticket that finished."""
+        started: dict[str, datetime] = {}
+        out: dict[str, float] = {}
+        for key, ts, category in self._db.execute(
+            "SELECT key, ts, category FROM ticket_events "
+            "WHERE category IS NOT NULL ORDER BY key, ts"
+        ):
+            when = datetime.fromisoformat(ts)
+            if category == "In Progress":
+                started.setdefault(key, when)
+            elif category == "Done" and key in started and key not in out:
+                out[key] = (when - started[key]).total_seconds() / 86400
+        return out
+
+    def burndown(self) -> list[tuple[str, int, int]]:
+        """(refresh ts, done, total in scope) for every refresh, oldest first."""
+        events = self._db.execute(
+            "SELECT ts, key, category FROM ticket_events ORDER BY ts"
+        ).fetchall()
+        refreshes = [ts for (ts,) in self._db.execute("SELECT ts FROM refreshes ORDER BY ts")]
+        state: dict[str, str | None] = {}
+        series: list[tuple[str, int, int]] = []
+        i = 0
+        for refresh_ts in refreshes:
+            while i < len(events) and events[i][0] <= refresh_ts:
+                _, key, category = events[i]
+                state[key] = category
+                i += 1
+            in_scope = [c for c in state.values() if c is not None]
+            series.append((refresh_ts, sum(1 for c in in_scope if c == "Done"), len(in_scope)))
+        return series
+
+    # ── Internals ──────────────────────────────────────────────────
+
+    def _is_current(self, ts: str) -> bool:
+        """True when `ts` is at or after the latest refresh (the latest-state tables apply)."""
+        (latest,) = self._db.execute("SELECT MAX(ts) FROM refreshes").fetchone()
+        return latest is None or ts >= latest
+
+    def _tickets_as_of(self, ts: str) -> dict[str, tuple[str | None, str | None]]:
+        query = "SELECT key, status, category FROM ticket_latest" if self._is_current(ts) else _TICKETS_AS_OF
+        return {
+            key: (status, category)
+            for key, status, category in self._db.execute(query, {"ts": ts})
+        }
+
+    def _prs_as_of(self, ts: str) -> dict[str, str | None]:
+        query = "SELECT pr, state FROM pr_latest" if self._is_current(ts) else _PRS_AS_OF
+        return dict(self._db.execute(query, {"ts": ts}).fetchall())
+
+
+def history_path(*, slug: str, repo_root: Path) -> Path:
+    return repo_root / CLIENTS_DIR / slug / HISTORY_FILENAME
+
+
+# ── CLI ────────────────────────────────────────────────────────────
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="poc-tracker-history",
+        description="Query the tracker's refresh history without touching Jira.",
+    )
+    parser.add_argument("--client", "-c", default="longaeva")
+    sub = parser.add_subparsers(dest="command", required=True)
+    as_of = sub.add_parser("as-of", help="Ticket + PR state at a point in time.")
+    as_of.add_argument("ts")
+    diff = sub.add_parser("diff", help="Changes between two points in time.")
+    diff.add_argument("start")
+    diff.add_argument("end")
+    sub.add_parser("cycle-time", help="In Progress → Done duration per ticket.")
+    sub.add_parser("burndown", help="Done vs. in-scope tickets per refresh.")
+    args = parser.parse_args(argv)
+
+    repo_root = Path(__file__).resolve().parents[2]
+    path = history_path(slug=args.client, repo_root=repo_root)
+    if not path.exists():
+        print(f"No history at {path} — run the tracker first.", file=sys.stderr)
+        return 2
+
+    with TrackerHistory(path=path) as history:
+        if args.command == "as-of":
+            snap = history.snapshot_as_of(ts=args.ts)
+            if snap is None:
+                print(f"No refresh at or before {args.ts}.")
+                return 1
+            print(f"As of refresh {snap.timestamp}:")
+            for key, status in sorted(snap.ticket_statuses.items()):
+                print(f"  {key:<10} {status}")
+            for pr, state in sorted(snap.pr_states.items()):
+                print(f"  {pr:<40} {state}")
+        elif args.command == "diff":
+            d = history.diff(start=args.start, end=args.end)
+            for key, old, new in d.status_changes:
+                print(f"  {key:<10} {old} → {new}")
+            for key in d.new_tickets:
+                print(f"  + {key}")
+            for key in d.closed_tickets:
+                print(f"  - {key}")
+            for pr in d.new_prs:
+                print(f"  + {pr}")
+            for pr in d.merged_prs:
+                print(f"  ✓ {pr} merged")
+            if d.is_empty:
+                print("  (no change)")
+        elif args.command == "cycle-time":
+            times = history.cycle_times()
+            for key, days in sorted(times.items(), key=lambda kv: kv[1]):
+                print(f"  {key:<10} {days:6.1f} d")
+            if times:
+                ordered = sorted(times.values())
+                print(f"  median {ordered[len(ordered) // 2]:.1f} d over {len(ordered)} ticket(s)")
+        else:
+            for ts, done, total in history.burndown():
+                remaining = total - done
+                width = round(BURNDOWN_BAR_WIDTH * remaining / total) if total else 0
+                print(f"  {ts[:16]}  {'█' * width:<{BURNDOWN_BAR_WIDTH}} {remaining}/{total} open")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,24 @@
-"""Thin Jira REST client — read-only ticket fetch for the tracker."""
+"""Thin Jira REST client — read-only ticket fetch for the tracker.
+
+Pages go over one keep-alive HTTPS connection (`JiraSession`). When a cache
+path is given, tickets are persisted between runs and follow-up refreshes
+only pull issues whose `updated` moved since the last fetch.
+"""
 
 from __future__ import annotations
 
 import base64
+import hashlib
+import http.client
 import json
 import logging
+import math
 import re
-import urllib.error
-import urllib.request
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
+from urllib.parse import urlsplit
 
 from ._ssl import build_ssl_context
 from .loader import PocConfig
@@ -27,6 +36,14 @@ JIRA_BROWSE_BASE = "https://brighthiveio.atlassian.net/browse"
 
 _TICKET_KEY_RE = re.compile(r"^BH-\d+$")
 
+# Delta fetches look back this much further than the last run so clock skew
+# and Jira's minute-granular relative dates never drop an update.
+CACHE_OVERLAP_MINUTES = 5
+# Force a full re-pull once the cache is this old — catches deleted tickets
+# and anything else a delta query can't see.
+CACHE_MAX_AGE_HOURS = 24
+CACHE_VERSION = 1
+
 
 @dataclass(frozen=True)
 class JiraTicket:
@@ -53,7 +70,171 @@ class JiraTicket:
         return f"{JIRA_BROWSE_BASE}/{self.key}"
 
 
-def fetch_tickets(*, config: PocConfig) -> list[JiraTicket]:
+class JiraError(RuntimeError):
+    """A Jira API call answered with an HTTP error status."""
+
+    def __init__(self, *, status: int, body: bytes) -> None:
+        super().__init__(f"Jira search failed: {status} {body[:300]!r}")
+        self.status = status
+
+
+class JiraSession:
+    """One persistent HTTPS connection to Jira, reused across every page.
+
+    `urllib.request.urlopen` opens (and TLS-handshakes) a fresh socket per
+    call; paging 500 tickets cost five handshakes. The session reconnects
+    once if the server drops the idle connection between requests, and
+    discards the connection after any other failure so one slow reply
+    can't poison a long-lived session.
+    """
+
+    def __init__(self, *, config: PocConfig, timeout: float = 30) -> None:
+        parts = urlsplit(config.auth.jira_base_url)
+        self._host = parts.netloc
+        self._path_prefix = parts.path.rstrip("/")
+        self._timeout = timeout
+        self._headers = {
+            "Authorization": _basic_auth_header(config=config),
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+        }
+        self._conn: http.client.HTTPSConnection | None = None
+
+    def __enter__(self) -> JiraSession:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def post_json(self, *, path: str, body: dict[str, Any]) -> dict[str, Any]:
+        data = json.dumps(body).encode("utf-8")
+        for attempt in (1, 2):
+            conn = self._connection()
+            try:
+                conn.request("POST", self._path_prefix + path, body=data, headers=self._headers)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                self.close()
+                if attempt == 2:
+                    raise
+                logger.info("Jira closed the keep-alive connection — reconnecting.")
+                continue
+            except BaseException:
+                # Anything else (a read timeout, an interrupted request) leaves the
+                # connection mid-exchange; http.client would refuse every later
+                # request on it with CannotSendRequest. Drop it so the next call
+                # starts clean.
+                self.close()
+                raise
+            if resp.status >= 400:
+                raise JiraError(status=resp.status, body=raw)
+            return json.loads(raw)
+        raise AssertionError("unreachable")
+
+    def _connection(self) -> http.client.HTTPSConnection:
+        if self._conn is None:
+            self._conn = http.client.HTTPSConnection(
+                self._host, timeout=self._timeout, context=build_ssl_context()
+            )
+        return self._conn
+
+
+def fetch_tickets(
+    *,
+    config: PocConfig,
+    session: JiraSession | None = None,
+    cache_path: Path | None = None,
+    full_refresh: bool = False,
+) -> list[JiraTicket]:
+    """Fetch every ticket in the tracker scope.
+
+    With `cache_path`, a warm cache turns the refresh into a delta: only
+    issues updated since the last run are pulled, the rest are served from
+    the cache. `full_refresh` ignores the cache but still rewrites it.
+    Pass `session` to share one connection across callers.
+    """
+    jql = build_jql(config=config)
+    logger.info("Tracker JQL: %s", jql)
+
+    projects = _scope_projects(configs=[config])
+    if session is None:
+        with JiraSession(config=config) as owned:
+            return _fetch_with_cache(
+                session=owned, jql=jql, projects=projects,
+                cache_path=cache_path, full_refresh=full_refresh,
+            )
+    return _fetch_with_cache(
+        session=session, jql=jql, projects=projects,
+        cache_path=cache_path, full_refresh=full_refresh,
+    )
+
+
+def fetch_tickets_for_clients(
+    *,
+    configs: list[PocConfig],
+    session: JiraSession | None = None,
+    cache_path: Path | None = None,
+    full_refresh: bool = False,
+) -> dict[str, list[JiraTicket]]:
+    """One deduplicated fetch for several trackers; returns {slug: tickets}.
+
+    Every client's epic/key scope is OR-ed into a single union query, and
+    membership is resolved locally from `parent_key` and explicit keys. Each
+    distinct `keyword_jql` is its own query with its own MAX_TICKETS cap, so
+    one noisy clause can't crowd the other clients out of the union. Both
+    go through the delta cache (keyword caches sit next to `cache_path`),
+    and each client keeps at most MAX_TICKETS after the split.
+    """
+    if not configs:
+        return {}
+    client_jqls = list(dict.fromkeys(build_jql(config=replace(c, keyword_jql="")) for c in configs))
+    union_jql = " OR ".join(f"({jql})" for jql in client_jqls)
+    keyword_jqls = list(dict.fromkeys(c.keyword_jql for c in configs if c.keyword_jql))
+    projects = _scope_projects(configs=configs)
+    logger.info("Union JQL across %d client(s): %s", len(configs), union_jql)
+
+    def _run(active: JiraSession) -> dict[str, list[JiraTicket]]:
+        tickets = _fetch_with_cache(
+            session=active, jql=union_jql, projects=projects, cache_path=cache_path,
+            full_refresh=full_refresh, max_tickets=MAX_TICKETS * len(client_jqls),
+        )
+        keyword_tickets = {
+            kw: _fetch_with_cache(
+                session=active, jql=kw, projects=projects, full_refresh=full_refresh,
+                cache_path=_keyword_cache_path(cache_path=cache_path, jql=kw) if cache_path else None,
+            )
+            for kw in keyword_jqls
+        }
+        by_key = {t.key: t for t in tickets}
+        for hits in keyword_tickets.values():
+            by_key.update((t.key, t) for t in hits)
+        out: dict[str, list[JiraTicket]] = {}
+        for c in configs:
+            keyword_hits = {t.key for t in keyword_tickets.get(c.keyword_jql, ())}
+            scoped = [t for t in by_key.values() if _in_scope(ticket=t, config=c, keyword_hits=keyword_hits)]
+            if len(scoped) > MAX_TICKETS:
+                logger.warning(
+                    "%s: hit MAX_TICKETS=%d cap — truncating. Tighten keyword_jql.", c.slug, MAX_TICKETS,
+                )
+                scoped = scoped[:MAX_TICKETS]
+            out[c.slug] = scoped
+        return out
+
+    if session is None:
+        with JiraSession(config=configs[0]) as owned:
+            return _run(owned)
+    return _run(session)
+
+
+def build_jql(*, config: PocConfig) -> str:
+    """Scope JQL for one client: parent epic(s) OR explicit keys OR keyword clause."""
     bad = [
         k for k in (config.epic, *config.adjacent_epics, *config.ticket_keys)
         if not _TICKET_KEY_RE.fullmatch(k)
@@ -67,51 +248,143 @@ def fetch_tickets(*, config: PocConfig) -> list[JiraTicket]:
         parts.append(f"key in ({','.join(config.ticket_keys)})")
     if config.keyword_jql:
         parts.append(config.keyword_jql)
-    jql = " OR ".join(f"({p})" for p in parts)
-    logger.info("Tracker JQL: %s", jql)
-    return _search_all(config=config, jql=jql)
+    return " OR ".join(f"({p})" for p in parts)
+
+
+def _scope_projects(*, configs: list[PocConfig]) -> tuple[str, ...]:
+    """Jira project keys the configured epics and tickets live in (e.g. ("BH",))."""
+    keys = (k for c in configs for k in (c.epic, *c.adjacent_epics, *c.ticket_keys))
+    return tuple(sorted({key.split("-", 1)[0] for key in keys}))
+
+
+def _in_scope(*, ticket: JiraTicket, config: PocConfig, keyword_hits: set[str]) -> bool:
+    """Local mirror of `build_jql` — keyword clauses come pre-resolved as keys."""
+    return (
+        ticket.parent_key in (config.epic, *config.adjacent_epics)
+        or ticket.key in config.ticket_keys
+        or ticket.key in keyword_hits
+    )
+
+
+def _fetch_with_cache(
+    *,
+    session: JiraSession,
+    jql: str,
+    projects: tuple[str, ...],
+    cache_path: Path | None,
+    full_refresh: bool,
+    max_tickets: int = MAX_TICKETS,
+) -> list[JiraTicket]:
+    started = datetime.now(timezone.utc)
+    cache = None
+    if cache_path and not full_refresh:
+        cache = _load_cache(path=cache_path, jql=jql, now=started)
+
+    tickets = None
+    if cache is not None:
+        cached, fetched_at = cache
+        try:
+            tickets = _apply_delta(
+                session=session, jql=jql, projects=projects, cached=cached,
+                since_minutes=_minutes_since(fetched_at, now=started),
+                max_tickets=max_tickets,
+            )
+        except JiraError as exc:
+            if exc.status != 400:
+                raise
+            logger.warning("Jira rejected the delta query (%s) — doing a full fetch.", exc)
+    if tickets is None:
+        tickets = _search_all(session=session, jql=jql, max_tickets=max_tickets)
+
+    if cache_path:
+        _save_cache(path=cache_path, jql=jql, tickets=tickets, fetched_at=started)
+    return tickets
+
+
+def _apply_delta(
+    *,
+    session: JiraSession,
+    jql: str,
+    projects: tuple[str, ...],
+    cached: dict[str, JiraTicket],
+    since_minutes: int,
+    max_tickets: int = MAX_TICKETS,
+) -> list[JiraTicket]:
+    """Merge issues updated in the last `since_minutes` into the cached set.
 
+    Two small queries: in-scope issues that changed (upserted), and issues
+    in the scope's projects that changed but no longer match the scope JQL,
+    intersected locally with the cache (evicted — e.g. a keyword-matched
+    ticket that moved to Done). The second query never lists cached keys, so
+    it stays the same size as the cache grows and an issue that was deleted
+    or moved out of the project can't make Jira reject it; those drop out at
+    the next full fetch.
+    """
+    window = f"updated >= -{since_minutes}m"
+    changed = _search_all(
+        session=session, jql=f"({jql}) AND {window}", max_tickets=max_tickets
+    )
+    merged = dict(cached)
+    for ticket in changed:
+        merged[ticket.key] = ticket
+
+    if cached and projects:
+        left_scope = [
+            ticket for ticket in _search_all(
+                session=session,
+                jql=f"project in ({','.join(projects)}) AND {window} AND NOT ({jql})",
+                fields=("updated",),
+            )
+            if ticket.key in cached
+        ]
+        for ticket in left_scope:
+            merged.pop(ticket.key, None)
+    else:
+        left_scope = []
 
-def _search_all(*, config: PocConfig, jql: str) -> list[JiraTicket]:
+    logger.info(
+        "Jira delta (%dm window): %d changed, %d left scope, %d served from cache.",
+        since_minutes, len(changed), len(left_scope),
+        len(merged) - len(changed),
+    )
+    tickets = list(merged.values())
+    if len(tickets) > max_tickets:
+        logger.warning(
+            "Hit MAX_TICKETS=%d cap — truncating. Tighten keyword_jql.",
+            max_tickets,
+        )
+        tickets = tickets[:max_tickets]
+    return tickets
+
+
+def _search_all(
+    *,
+    session: JiraSession,
+    jql: str,
+    fields: tuple[str, ...] = JIRA_FIELDS,
+    max_tickets: int = MAX_TICKETS,
+) -> list[JiraTicket]:
     tickets: list[JiraTicket] = []
     next_token: str | None = None
-    auth_header = _basic_auth_header(config=config)
-    ssl_ctx = build_ssl_context()
 
     while True:
         body: dict[str, Any] = {
             "jql": jql,
-            "fields": list(JIRA_FIELDS),
+            "fields": list(fields),
             "maxResults": JIRA_PAGE_SIZE,
         }
         if next_token:
             body["nextPageToken"] = next_token
 
-        req = urllib.request.Request(
-            url=f"{config.auth.jira_base_url}{JIRA_SEARCH_PATH}",
-            method="POST",
-            data=json.dumps(body).encode("utf-8"),
-            headers={
-                "Authorization": auth_header,
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            },
-        )
-        try:
-            with urllib.request.urlopen(req, timeout=30, context=ssl_ctx) as resp:
-                payload = json.loads(resp.read())
-        except urllib.error.HTTPError as exc:
-            raise RuntimeError(
-                f"Jira search failed: {exc.code} {exc.read()[:300]!r}"
-            ) from exc
+        payload = session.post_json(path=JIRA_SEARCH_PATH, body=body)
 
         for issue in payload.get("issues", []):
             tickets.append(_parse_issue(issue=issue))
 
-        if len(tickets) >= MAX_TICKETS:
+        if len(tickets) >= max_tickets:
             logger.warning(
                 "Hit MAX_TICKETS=%d cap — truncating. Tighten keyword_jql.",
-                MAX_TICKETS,
+                max_tickets,
             )
             break
 
@@ -129,6 +402,62 @@ def _search_all(*, config: PocConfig, jql: str) -> list[JiraTicket]:
     return unique
 
 
+# ── Ticket cache ───────────────────────────────────────────────────
+
+
+def _load_cache(
+    *, path: Path, jql: str, now: datetime
+) -> tuple[dict[str, JiraTicket], datetime] | None:
+    """Return (tickets by key, fetched_at) or None when a full fetch is needed."""
+    if not path.exists():
+        return None
+    try:
+        raw = json.loads(path.read_text())
+        fetched_at = datetime.fromisoformat(raw["fetched_at"])
+        tickets = {
+            row["key"]: JiraTicket(**{**row, "labels": tuple(row.get("labels") or ())})
+            for row in raw["tickets"]
+        }
+    except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+        logger.warning("Jira cache at %s is unreadable — doing a full fetch.", path)
+        return None
+    if raw.get("version") != CACHE_VERSION or raw.get("jql_sha") != _jql_sha(jql):
+        logger.info("Jira cache is for a different scope — doing a full fetch.")
+        return None
+    if (now - fetched_at).total_seconds() > CACHE_MAX_AGE_HOURS * 3600:
+        logger.info("Jira cache older than %dh — doing a full fetch.", CACHE_MAX_AGE_HOURS)
+        return None
+    return tickets, fetched_at
+
+
+def _save_cache(
+    *, path: Path, jql: str, tickets: list[JiraTicket], fetched_at: datetime
+) -> None:
+    payload = {
+        "version": CACHE_VERSION,
+        "jql_sha": _jql_sha(jql),
+        "fetched_at": fetched_at.isoformat(timespec="seconds"),
+        "tickets": [asdict(t) for t in sorted(tickets, key=lambda t: t.key)],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=1, sort_keys=True) + "\n")
+
+
+def _keyword_cache_path(*, cache_path: Path, jql: str) -> Path:
+    """Sibling cache file for one `keyword_jql` (matches the `.tracker-*-cache.json` ignore)."""
+    stem = cache_path.stem.removesuffix("-cache")
+    return cache_path.with_name(f"{stem}-kw-{_jql_sha(jql)[:12]}-cache{cache_path.suffix}")
+
+
+def _jql_sha(jql: str) -> str:
+    return hashlib.sha256(jql.encode("utf-8")).hexdigest()
+
+
+def _minutes_since(then: datetime, *, now: datetime) -> int:
+    elapsed = max(0.0, (now - then).total_seconds())
+    return math.ceil(elapsed / 60) + CACHE_OVERLAP_MINUTES
+
+
 def _basic_auth_header(*, config: PocConfig) -> str:
     creds = f"{config.auth.jira_user_email}:{config.auth.jira_api_token}"
     return "Basic " + base64.b64encode(creds.encode("utf-8")).decode("ascii")
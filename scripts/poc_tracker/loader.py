@@ -18,6 +18,9 @@ import yaml
 logger = logging.getLogger(__name__)
 
 CLIENTS_DIR = Path("clients/trials")
+# Shared fetch caches for `--all-clients` refreshes (union of every scope).
+ALL_CLIENTS_JIRA_CACHE_PATH = CLIENTS_DIR / ".tracker-all-jira-cache.json"
+ALL_CLIENTS_PR_CACHE_PATH = CLIENTS_DIR / ".tracker-all-pr-cache.json"
 
 
 @dataclass(frozen=True)
@@ -118,6 +121,18 @@ class PocConfig:
     def snapshot_path(self) -> Path:
         return CLIENTS_DIR / self.slug / ".tracker-snapshot.json"
 
+    @property
+    def jira_cache_path(self) -> Path:
+        return CLIENTS_DIR / self.slug / ".tracker-jira-cache.json"
+
+    @property
+    def pr_cache_path(self) -> Path:
+        return CLIENTS_DIR / self.slug / ".tracker-pr-cache.json"
+
+    @property
+    def render_cache_path(self) -> Path:
+        return CLIENTS_DIR / self.slug / ".tracker-render-cache.json"
+
     @property
     def tracker_github_url(self) -> str:
         return (
@@ -171,6 +186,22 @@ def load_config(*, slug: str, repo_root: Path) -> PocConfig:
     )
 
 
+def load_all_configs(*, repo_root: Path) -> tuple[list[PocConfig], list[str]]:
+    """Load every clients/trials/<slug>/poc.yaml.
+
+    Returns (configs, errors) — one bad YAML shouldn't block every other
+    client's refresh, so load failures are collected instead of raised.
+    """
+    configs: list[PocConfig] = []
+    errors: list[str] = []
+    for yaml_path in sorted((repo_root / CLIENTS_DIR).glob("*/poc.yaml")):
+        try:
+            configs.append(load_config(slug=yaml_path.parent.name, repo_root=repo_root))
+        except (FileNotFoundError, ValueError) as exc:
+            errors.append(str(exc))
+    return configs, errors
+
+
 def _parse_phase(payload: dict[str, Any]) -> Phase:
     expectations = tuple(
         Expectation(
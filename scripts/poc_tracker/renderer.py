@@ -4,16 +4,30 @@ Auto sections (day-by-day, scoreboard, summary, status grid, recent activity)
 are overwritten on every refresh. Manual sections (Blockers / This Week /
 Daily Notes / Open Questions) are preserved across refreshes via in-page
 HTML comment markers.
+
+Auto sections are memoized through an optional `SectionCache`: each section
+is keyed by a hash of only the inputs it reads, so a refresh where one
+ticket moved re-renders just the sections that ticket feeds.
+
+Every section reads its indexes and expectation verdicts from one
+`TrackerState`; callers that also post to Slack pass the same state in.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
 
 from .github_client import GitHubPR
 from .jira_client import JIRA_BROWSE_BASE, JiraTicket
-from .loader import Expectation, Phase, PocConfig
+from .loader import PocConfig
+from .state import TrackerState
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +61,70 @@ RECENT_ACTIVITY_DAYS = 14
 RECENT_ACTIVITY_MAX_ROWS = 20
 SUMMARY_CLIP_CHARS = 70
 
+# The one header line that changes on every refresh; excluded from
+# `tracker_content_sha` so an otherwise identical tracker isn't rewritten.
+_REFRESH_LINE_PREFIX = "_Last refreshed "
+SECTION_CACHE_VERSION = 1
+
+
+# ── Section memoization ────────────────────────────────────────────
+
+
+@dataclass
+class SectionCache:
+    """Rendered auto sections keyed by a hash of each section's inputs.
+
+    `entries` maps section name → (input_sha, text). `timings` (ms) and
+    `hits` describe the most recent render; the caller logs them.
+    """
+
+    entries: dict[str, tuple[str, str]] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+    hits: set[str] = field(default_factory=set)
+
+    @classmethod
+    def load(cls, *, path: Path) -> SectionCache:
+        if not path.exists():
+            return cls()
+        try:
+            raw = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return cls()
+        if raw.get("version") != SECTION_CACHE_VERSION:
+            return cls()
+        return cls(
+            entries={
+                name: (entry["input_sha"], entry["text"])
+                for name, entry in (raw.get("sections") or {}).items()
+            }
+        )
+
+    def save(self, *, path: Path) -> None:
+        payload = {
+            "version": SECTION_CACHE_VERSION,
+            "sections": {
+                name: {"input_sha": sha, "text": text}
+                for name, (sha, text) in sorted(self.entries.items())
+            },
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, indent=1) + "\n")
+
+    def summary(self) -> str:
+        """One log line: `name 0.42ms (cached), …`."""
+        return ", ".join(
+            f"{name} {ms:.2f}ms" + (" (cached)" if name in self.hits else "")
+            for name, ms in self.timings.items()
+        )
+
+
+def tracker_content_sha(text: str) -> str:
+    """SHA of a rendered tracker, ignoring the `_Last refreshed …` header line."""
+    body = "\n".join(
+        line for line in text.splitlines() if not line.startswith(_REFRESH_LINE_PREFIX)
+    )
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
 
 # ── Public entry ───────────────────────────────────────────────────
 
@@ -58,11 +136,13 @@ def render_tracker(
     pr_map: dict[str, list[GitHubPR]],
     existing_text: str | None,
     now: datetime | None = None,
+    section_cache: SectionCache | None = None,
+    state: TrackerState | None = None,
 ) -> str:
     now = now or datetime.now(timezone.utc)
-    auto = _render_auto_sections(
-        config=config, tickets=tickets, pr_map=pr_map, now=now
-    )
+    if state is None:
+        state = TrackerState.build(config=config, tickets=tickets, pr_map=pr_map)
+    auto = _render_auto_sections(state=state, now=now, section_cache=section_cache)
     manual = _read_manual_sections(existing_text=existing_text or "")
     return _compose(config=config, auto=auto, manual=manual, now=now)
 
@@ -73,20 +153,11 @@ def compute_phase_progress(
     tickets: list[JiraTicket],
     pr_map: dict[str, list[GitHubPR]],
 ) -> list[tuple[str, int, int, int]]:
-    """Used by the Slack post to show per-phase progress without re-rendering."""
-    ticket_statuses = {t.key: t.status_category for t in tickets}
-    merged_pr_keys = _merged_pr_keys(pr_map=pr_map)
-    open_pr_ticket_keys = _open_pr_ticket_keys(pr_map=pr_map)
-    out = []
-    for phase in config.phases:
-        green, wip, total = _phase_progress(
-            phase=phase,
-            ticket_statuses=ticket_statuses,
-            merged_pr_keys=merged_pr_keys,
-            open_pr_ticket_keys=open_pr_ticket_keys,
-        )
-        out.append((phase.title, green, wip, total))
-    return out
+    """(phase_title, green, wip, total) per phase, without rendering.
+
+    Prefer `TrackerState.phase_progress` when a state is already built.
+    """
+    return TrackerState.build(config=config, tickets=tickets, pr_map=pr_map).phase_progress
 
 
 # ── Composition ─────────────────────────────────────────────────────
@@ -99,7 +170,7 @@ def _compose(
         [
             f"# {config.slug.title()} — Live Tracker",
             "",
-            f"_Last refreshed **{now.strftime('%Y-%m-%d %H:%M UTC')}** by "
+            f"{_REFRESH_LINE_PREFIX}**{now.strftime('%Y-%m-%d %H:%M UTC')}** by "
             f"`make {config.slug}-tracker`. Auto sections are overwritten — "
             "manual sections (🚨 Blockers, 🎯 This Week, 📝 Daily Notes, "
             "❓ Open Questions) are preserved._",
@@ -170,35 +241,83 @@ def _extract_section(*, existing_text: str, name: str) -> str | None:
 
 def _render_auto_sections(
     *,
-    config: PocConfig,
-    tickets: list[JiraTicket],
-    pr_map: dict[str, list[GitHubPR]],
+    state: TrackerState,
     now: datetime,
+    section_cache: SectionCache | None = None,
 ) -> str:
-    chunks = [
-        _render_day_by_day(config=config, tickets=tickets, pr_map=pr_map),
-        "",
-        _render_scoreboard(config=config, tickets=tickets, pr_map=pr_map),
-        "",
-        _render_summary(tickets=tickets, pr_map=pr_map),
-        "",
-        _render_status_grid(tickets=tickets, pr_map=pr_map),
-        "",
-        _render_recent_activity(tickets=tickets, now=now),
+    config, tickets, pr_map = state.config, state.tickets, state.pr_map
+    cache = section_cache if section_cache is not None else SectionCache()
+    cache.timings.clear()
+    cache.hits.clear()
+    recent = _recent_tickets(tickets=tickets, now=now)
+
+    # (name, inputs the section reads, renderer). Inputs are projections —
+    # e.g. the summary only sees status categories, so a summary-text edit
+    # on a ticket re-renders the status grid but not the summary.
+    sections: list[tuple[str, Callable[[], Any], Callable[[], str]]] = [
+        (
+            "day-by-day",
+            lambda: (config.phases, _ticket_fields(tickets, "status_category"), _pr_index(pr_map)),
+            lambda: _render_day_by_day(state=state),
+        ),
+        (
+            "scoreboard",
+            lambda: (
+                config.ownership,
+                _ticket_fields(tickets, "assignee_name", "status_category", "summary", "updated"),
+                sorted(state.open_pr_ticket_keys),
+            ),
+            lambda: _render_scoreboard(state=state),
+        ),
+        (
+            "summary",
+            lambda: (_ticket_fields(tickets, "status_category"), _pr_index(pr_map)),
+            lambda: _render_summary(tickets=tickets, pr_map=pr_map),
+        ),
+        (
+            "status-grid",
+            lambda: (
+                _ticket_fields(tickets, "summary", "assignee_name", "status_category"),
+                _pr_index(pr_map),
+            ),
+            lambda: _render_status_grid(state=state),
+        ),
+        (
+            "recent-activity",
+            lambda: [(t.key, t.updated, t.status, t.assignee_name) for t, _ in recent],
+            lambda: _render_recent_activity(recent=recent, now=now),
+        ),
     ]
-    return "\n".join(chunks)
 
+    chunks: list[str] = []
+    for name, inputs, render in sections:
+        start = time.perf_counter()
+        input_sha = hashlib.sha256(repr(inputs()).encode("utf-8")).hexdigest()
+        cached = cache.entries.get(name)
+        if cached and cached[0] == input_sha:
+            text = cached[1]
+            cache.hits.add(name)
+        else:
+            text = render()
+            cache.entries[name] = (input_sha, text)
+        cache.timings[name] = (time.perf_counter() - start) * 1000
+        chunks.append(text)
+    return "\n\n".join(chunks)
+
+
+def _ticket_fields(tickets: list[JiraTicket], *names: str) -> list[tuple[Any, ...]]:
+    """Sorted (key, *fields) rows — the slice of ticket state a section reads."""
+    return sorted((t.key, *(getattr(t, n) for n in names)) for t in tickets)
+
+
+def _pr_index(pr_map: dict[str, list[GitHubPR]]) -> list[tuple[str, list[tuple[Any, ...]]]]:
+    return sorted(
+        (key, sorted((pr.repo, pr.number, pr.state, pr.is_draft, pr.url) for pr in prs))
+        for key, prs in pr_map.items()
+    )
 
-def _render_day_by_day(
-    *,
-    config: PocConfig,
-    tickets: list[JiraTicket],
-    pr_map: dict[str, list[GitHubPR]],
-) -> str:
-    ticket_statuses = {t.key: t.status_category for t in tickets}
-    merged_pr_keys = _merged_pr_keys(pr_map=pr_map)
-    open_pr_ticket_keys = _open_pr_ticket_keys(pr_map=pr_map)
 
+def _render_day_by_day(*, state: TrackerState) -> str:
     lines = [
         "## 🗓️ Day-by-day — task / day / progress",
         "",
@@ -207,13 +326,7 @@ def _render_day_by_day(
         "Auto-fills as tickets move and PRs merge._",
         "",
     ]
-    for phase in config.phases:
-        green, wip, total = _phase_progress(
-            phase=phase,
-            ticket_statuses=ticket_statuses,
-            merged_pr_keys=merged_pr_keys,
-            open_pr_ticket_keys=open_pr_ticket_keys,
-        )
+    for phase, (_, green, wip, total) in zip(state.config.phases, state.phase_progress):
         wip_note = f", {wip} 🟡" if wip else ""
         lines.append(f"### {phase.title} ({green}/{total} 🟢{wip_note})")
         lines.append("")
@@ -223,26 +336,17 @@ def _render_day_by_day(
         lines.append("| | Day | Outcome | Linked |")
         lines.append("|---|---|---|---|")
         for exp in phase.expectations:
-            checkbox = _expectation_checkbox(
-                expectation=exp,
-                ticket_statuses=ticket_statuses,
-                merged_pr_keys=merged_pr_keys,
-                open_pr_ticket_keys=open_pr_ticket_keys,
-            )
-            linked = _format_linked(linked=exp.linked, pr_map=pr_map)
+            checkbox = state.verdicts[exp].checkbox
+            linked = _format_linked(linked=exp.linked, pr_urls=state.pr_urls)
             lines.append(f"| {checkbox} | {exp.day} | {exp.outcome} | {linked} |")
         lines.append("")
     return "\n".join(lines)
 
 
-def _render_scoreboard(
-    *,
-    config: PocConfig,
-    tickets: list[JiraTicket],
-    pr_map: dict[str, list[GitHubPR]],
-) -> str:
+def _render_scoreboard(*, state: TrackerState) -> str:
+    config = state.config
     by_assignee: dict[str, list[JiraTicket]] = {}
-    for ticket in tickets:
+    for ticket in state.tickets:
         by_assignee.setdefault(ticket.assignee_name or "_unassigned_", []).append(
             ticket
         )
@@ -266,13 +370,13 @@ def _render_scoreboard(
         in_flight = [
             t for t in owner_tickets
             if not t.is_done
-            and (t.status_category == "In Progress" or _has_open_pr(pr_map=pr_map, key=t.key))
+            and (t.status_category == "In Progress" or state.has_open_pr(t.key))
         ]
         queued = [
             t for t in owner_tickets
             if not t.is_done
             and t.status_category != "In Progress"
-            and not _has_open_pr(pr_map=pr_map, key=t.key)
+            and not state.has_open_pr(t.key)
         ]
         rows.append((owner, done, in_flight, queued, _last_shipped(tickets=done)))
 
@@ -308,16 +412,15 @@ def _render_summary(
     )
 
 
-def _render_status_grid(
-    *, tickets: list[JiraTicket], pr_map: dict[str, list[GitHubPR]]
-) -> str:
+def _render_status_grid(*, state: TrackerState) -> str:
+    pr_map = state.pr_map
     buckets: dict[str, list[JiraTicket]] = {
         "🟡 To Do": [], "🟢 In Progress": [], "🔵 In Review": [], "✅ Done": [],
     }
-    for t in tickets:
+    for t in state.tickets:
         if t.is_done:
             buckets["✅ Done"].append(t)
-        elif _has_open_pr(pr_map=pr_map, key=t.key):
+        elif state.has_open_pr(t.key):
             buckets["🔵 In Review"].append(t)
         elif t.status_category == "In Progress":
             buckets["🟢 In Progress"].append(t)
@@ -343,11 +446,20 @@ def _render_status_grid(
     return "\n".join(lines)
 
 
-def _render_recent_activity(*, tickets: list[JiraTicket], now: datetime) -> str:
+def _recent_tickets(
+    *, tickets: list[JiraTicket], now: datetime
+) -> list[tuple[JiraTicket, datetime]]:
+    """Tickets updated in the last RECENT_ACTIVITY_DAYS, newest first."""
     cutoff = now.timestamp() - RECENT_ACTIVITY_DAYS * 86400
     parsed = [(t, _parse_iso(t.updated)) for t in tickets]
     recent = [(t, ts) for t, ts in parsed if ts and ts.timestamp() >= cutoff]
-    recent.sort(key=lambda pair: pair[1] or datetime.min, reverse=True)
+    recent.sort(key=lambda pair: pair[1], reverse=True)
+    return recent
+
+
+def _render_recent_activity(
+    *, recent: list[tuple[JiraTicket, datetime]], now: datetime
+) -> str:
     lines = [f"## 🕒 Recent activity ({RECENT_ACTIVITY_DAYS} days)", ""]
     if not recent:
         lines.append(f"_No ticket updates in the last {RECENT_ACTIVITY_DAYS} days._")
@@ -366,77 +478,7 @@ def _render_recent_activity(*, tickets: list[JiraTicket], now: datetime) -> str:
 # ── Helpers ────────────────────────────────────────────────────────
 
 
-def _expectation_checkbox(
-    *,
-    expectation: Expectation,
-    ticket_statuses: dict[str, str],
-    merged_pr_keys: set[str],
-    open_pr_ticket_keys: set[str],
-) -> str:
-    state = expectation.is_green(
-        ticket_statuses=ticket_statuses, merged_pr_keys=merged_pr_keys
-    )
-    if state is None:
-        return "🔲"  # manual / awaiting external (no linked item)
-    if state is True:
-        return "🟢"  # done — ticket closed / PR merged
-    if expectation.is_wip(
-        ticket_statuses=ticket_statuses,
-        merged_pr_keys=merged_pr_keys,
-        open_pr_ticket_keys=open_pr_ticket_keys,
-    ):
-        return "🟡"  # in progress — PR open or ticket in review
-    return "⬜"  # linked but not started
-
-
-def _phase_progress(
-    *,
-    phase: Phase,
-    ticket_statuses: dict[str, str],
-    merged_pr_keys: set[str],
-    open_pr_ticket_keys: set[str],
-) -> tuple[int, int, int]:
-    auto_total = 0
-    auto_green = 0
-    auto_wip = 0
-    for exp in phase.expectations:
-        result = exp.is_green(
-            ticket_statuses=ticket_statuses, merged_pr_keys=merged_pr_keys
-        )
-        if result is None:
-            continue
-        auto_total += 1
-        if result:
-            auto_green += 1
-        elif exp.is_wip(
-            ticket_statuses=ticket_statuses,
-            merged_pr_keys=merged_pr_keys,
-            open_pr_ticket_keys=open_pr_ticket_keys,
-        ):
-            auto_wip += 1
-    return auto_green, auto_wip, auto_total
-
-
-def _open_pr_ticket_keys(*, pr_map: dict[str, list[GitHubPR]]) -> set[str]:
-    return {
-        key
-        for key, prs in pr_map.items()
-        if any(pr.state == "OPEN" for pr in prs)
-    }
-
-
-def _merged_pr_keys(*, pr_map: dict[str, list[GitHubPR]]) -> set[str]:
-    return {
-        f"{pr.short_repo}#{pr.number}"
-        for prs in pr_map.values()
-        for pr in prs
-        if pr.state == "MERGED"
-    }
-
-
-def _format_linked(
-    *, linked: tuple[str, ...], pr_map: dict[str, list[GitHubPR]]
-) -> str:
+def _format_linked(*, linked: tuple[str, ...], pr_urls: dict[str, str]) -> str:
     if not linked:
         return "_manual_"
     parts: list[str] = []
@@ -444,22 +486,11 @@ def _format_linked(
         if item.startswith("BH-"):
             parts.append(f"[{item}]({JIRA_BROWSE_BASE}/{item})")
             continue
-        pr_url: str | None = None
-        for prs in pr_map.values():
-            for pr in prs:
-                if f"{pr.short_repo}#{pr.number}" == item:
-                    pr_url = pr.url
-                    break
-            if pr_url:
-                break
+        pr_url = pr_urls.get(item)
         parts.append(f"[{item}]({pr_url})" if pr_url else item)
     return ", ".join(parts)
 
 
-def _has_open_pr(*, pr_map: dict[str, list[GitHubPR]], key: str) -> bool:
-    return any(pr.state == "OPEN" for pr in pr_map.get(key, []))
-
-
 def _format_pr_links(*, pr_map: dict[str, list[GitHubPR]], key: str) -> str:
     prs = pr_map.get(key, [])
     if not prs:
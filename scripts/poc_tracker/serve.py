@@ -0,0 +1,227 @@
+"""Long-lived `--serve` mode — refresh on an interval or on demand.
+
+The one-shot CLI re-checks `gh auth status`, re-parses poc.yaml, opens a
+fresh Jira connection and reloads every cache on each cron tick. In serve
+mode those stay warm in one process: `RefreshLoop` re-runs the refresh
+every `interval_s` (± jitter so several trackers don't hit Jira in
+lockstep), backs off exponentially with full jitter after failures, and
+wakes early when something POSTs to the local HTTP endpoint:
+
+    curl -X POST localhost:8765/refresh     # refresh now
+    curl localhost:8765/status              # last run, failures, next due
+
+The endpoint binds to 127.0.0.1 only and has no auth — it can trigger a
+refresh, nothing else.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable
+
+from .loader import CLIENTS_DIR, PocConfig, load_all_configs, load_config
+
+logger = logging.getLogger(__name__)
+
+SERVE_DEFAULT_INTERVAL_S = 300
+SERVE_DEFAULT_HOST = "127.0.0.1"
+SERVE_DEFAULT_PORT = 8765
+SERVE_JITTER_FRACTION = 0.1
+SERVE_BACKOFF_BASE_S = 30
+SERVE_BACKOFF_MAX_S = 1800
+
+
+# ── Refresh loop ───────────────────────────────────────────────────
+
+
+@dataclass
+class RefreshStatus:
+    runs: int = 0
+    consecutive_failures: int = 0
+    last_started: str = ""
+    last_finished: str = ""
+    last_duration_s: float = 0.0
+    last_error: str = ""
+    next_due_in_s: float = 0.0
+
+
+class RefreshLoop:
+    """Runs `refresh()` forever; `trigger()` wakes it early, `stop()` ends it."""
+
+    def __init__(
+        self,
+        *,
+        refresh: Callable[[], None],
+        interval_s: float = SERVE_DEFAULT_INTERVAL_S,
+        rng: random.Random | None = None,
+    ) -> None:
+        self._refresh = refresh
+        self._interval_s = interval_s
+        self._rng = rng or random.Random()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._status = RefreshStatus()
+
+    def trigger(self) -> None:
+        self._wake.set()
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._wake.set()
+
+    def status(self) -> RefreshStatus:
+        with self._lock:
+            return RefreshStatus(**asdict(self._status))
+
+    def next_delay(self) -> float:
+        """Seconds until the next run: jittered interval, or backoff after failures."""
+        failures = self._status.consecutive_failures
+        if failures:
+            ceiling = min(SERVE_BACKOFF_MAX_S, SERVE_BACKOFF_BASE_S * 2 ** (failures - 1))
+            return self._rng.uniform(ceiling / 2, ceiling)
+        spread = self._interval_s * SERVE_JITTER_FRACTION
+        return self._interval_s + self._rng.uniform(-spread, spread)
+
+    def run_once(self) -> bool:
+        """One refresh; never raises. Returns True on success."""
+        started = time.perf_counter()
+        with self._lock:
+            self._status.last_started = _utc_now()
+        try:
+            self._refresh()
+        except Exception as exc:  # noqa: BLE001 — the daemon outlives one bad refresh
+            logger.exception("Refresh failed")
+            ok, error = False, f"{type(exc).__name__}: {exc}"
+        else:
+            ok, error = True, ""
+        with self._lock:
+            self._status.runs += 1
+            self._status.last_finished = _utc_now()
+            self._status.last_duration_s = round(time.perf_counter() - started, 3)
+            self._status.last_error = error
+            self._status.consecutive_failures = 0 if ok else self._status.consecutive_failures + 1
+        return ok
+
+    def run_forever(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.clear()
+            self.run_once()
+            delay = self.next_delay()
+            with self._lock:
+                self._status.next_due_in_s = round(delay, 1)
+            logger.info("Next refresh in %.0fs (or on POST /refresh).", delay)
+            if self._wake.wait(timeout=delay) and not self._stopping.is_set():
+                logger.info("Refresh requested over HTTP.")
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+# ── Local HTTP endpoint ────────────────────────────────────────────
+
+
+def make_http_server(
+    *, loop: RefreshLoop, host: str = SERVE_DEFAULT_HOST, port: int = SERVE_DEFAULT_PORT
+) -> ThreadingHTTPServer:
+    """`POST /refresh` → 202 and wake the loop; `GET /status` → JSON status."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802 — http.server naming
+            if self.path != "/refresh":
+                self._reply(404, {"error": "not found"})
+                return
+            loop.trigger()
+            self._reply(202, {"queued": True})
+
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path == "/status":
+                self._reply(200, asdict(loop.status()))
+            elif self.path == "/healthz":
+                self._reply(200, {"ok": True})
+            else:
+                self._reply(404, {"error": "not found"})
+
+        def _reply(self, code: int, body: dict) -> None:
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            logger.debug("http: " + format, *args)
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def serve(
+    *,
+    refresh: Callable[[], None],
+    interval_s: float = SERVE_DEFAULT_INTERVAL_S,
+    host: str = SERVE_DEFAULT_HOST,
+    port: int = SERVE_DEFAULT_PORT,
+) -> int:
+    """Block running the loop + endpoint until Ctrl-C."""
+    loop = RefreshLoop(refresh=refresh, interval_s=interval_s)
+    server = make_http_server(loop=loop, host=host, port=port)
+    threading.Thread(target=server.serve_forever, name="tracker-http", daemon=True).start()
+    logger.info(
+        "Serving on http://%s:%d — refreshing every ~%ds.", host, server.server_port, interval_s
+    )
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        logger.info("Stopping.")
+    finally:
+        loop.stop()
+        server.shutdown()
+        server.server_close()
+    return 0
+
+
+# ── Warm configs ───────────────────────────────────────────────────
+
+
+class WarmConfigs:
+    """Parsed poc.yaml files, re-parsed only when a file's mtime changes."""
+
+    def __init__(self, *, repo_root: Path, slug: str | None) -> None:
+        self._repo_root = repo_root
+        self._slug = slug  # None = every client
+        self._stamp: tuple[tuple[str, int], ...] | None = None
+        self._loaded: tuple[list[PocConfig], list[str]] = ([], [])
+
+    def get(self) -> tuple[list[PocConfig], list[str]]:
+        stamp = self._mtimes()
+        if stamp != self._stamp:
+            if self._stamp is not None:
+                logger.info("poc.yaml changed — reloading configs.")
+            self._loaded = self._load()
+            self._stamp = stamp
+        return self._loaded
+
+    def _mtimes(self) -> tuple[tuple[str, int], ...]:
+        pattern = f"{self._slug}/poc.yaml" if self._slug else "*/poc.yaml"
+        return tuple(
+            (str(path), path.stat().st_mtime_ns)
+            for path in sorted((self._repo_root / CLIENTS_DIR).glob(pattern))
+        )
+
+    def _load(self) -> tuple[list[PocConfig], list[str]]:
+        if self._slug is None:
+            return load_all_configs(repo_root=self._repo_root)
+        try:
+            return [load_config(slug=self._slug, repo_root=self._repo_root)], []
+        except (FileNotFoundError, ValueError) as exc:
+            return [], [str(exc)]
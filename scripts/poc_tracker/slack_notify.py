@@ -8,100 +8,125 @@ diff highlights since the last refresh.
 from __future__ import annotations
 
 import json
-import logging
+import urllib.error
 import urllib.request
 from collections import Counter
+from dataclasses import dataclass
+from typing import Any
 
 from ._ssl import build_ssl_context
-from .github_client import GitHubPR
-from .jira_client import JiraTicket
-from .loader import PocConfig
 from .snapshot import TrackerDiff
+from .state import TrackerState
 
-logger = logging.getLogger(__name__)
 
+SLACK_POST_URL = "https://slack.com/api/chat.postMessage"
+SLACK_TIMEOUT_S = 15
 
-def post_to_slack(
+
+@dataclass(frozen=True)
+class SendResult:
+    ok: bool
+    error: str = ""
+    retry_after_s: float | None = None   # set when Slack rate-limited us
+    permanent: bool = False              # retrying won't help (bad channel/token)
+
+
+def send_message(
     *,
-    config: PocConfig,
-    diff: TrackerDiff,
-    tickets: list[JiraTicket],
-    pr_map: dict[str, list[GitHubPR]],
-    phase_progress: list[tuple[str, int, int, int]],
-) -> bool:
-    """Post the full state + diff. Returns True on success.
-
-    Caller passes pre-computed `phase_progress` so we don't duplicate the
-    expectations logic. Each tuple is (phase_title, green, wip, total).
-    """
-    if not config.auth.slack_bot_token:
-        logger.info("SLACK_BOT_TOKEN not set — skipping Slack post.")
-        return False
-    if not config.slack_channel_id:
-        logger.info("slack.channel_id not configured — skipping Slack post.")
-        return False
-
-    text, blocks = _render_message(
-        config=config,
-        diff=diff,
-        tickets=tickets,
-        pr_map=pr_map,
-        phase_progress=phase_progress,
-    )
-    payload = {
-        "channel": config.slack_channel_id,
-        "text": text,
-        "blocks": blocks,
-    }
+    token: str,
+    channel: str,
+    text: str,
+    blocks: list[dict],
+    api_url: str = SLACK_POST_URL,
+) -> SendResult:
+    """One `chat.postMessage` call. Never raises — failures come back as a result."""
+    payload = {"channel": channel, "text": text, "blocks": blocks}
     req = urllib.request.Request(
-        url="https://slack.com/api/chat.postMessage",
+        url=api_url,
         method="POST",
         data=json.dumps(payload).encode("utf-8"),
         headers={
-            "Authorization": f"Bearer {config.auth.slack_bot_token}",
+            "Authorization": f"Bearer {token}",
             "Content-Type": "application/json; charset=utf-8",
         },
     )
     try:
-        with urllib.request.urlopen(req, timeout=15, context=build_ssl_context()) as resp:
+        with urllib.request.urlopen(
+            req, timeout=SLACK_TIMEOUT_S, context=build_ssl_context()
+        ) as resp:
             body = json.loads(resp.read())
-    except Exception:  # noqa: BLE001 — don't block tracker on Slack outage
-        logger.warning("Slack post failed", exc_info=True)
-        return False
-    if not body.get("ok"):
-        logger.warning("Slack rejected post: %s", body.get("error"))
-        return False
-    return True
+    except urllib.error.HTTPError as exc:
+        if exc.code == 429:
+            return SendResult(
+                ok=False, error="HTTP 429", retry_after_s=_retry_after(exc.headers)
+            )
+        return SendResult(ok=False, error=f"HTTP {exc.code}")
+    except Exception as exc:  # noqa: BLE001 — don't block tracker on Slack outage
+        return SendResult(ok=False, error=f"{type(exc).__name__}: {exc}")
+    if body.get("ok"):
+        return SendResult(ok=True)
+    error = body.get("error") or "unknown error"
+    if error == "ratelimited":
+        return SendResult(ok=False, error=error, retry_after_s=_retry_after({}))
+    return SendResult(ok=False, error=error, permanent=error in _PERMANENT_ERRORS)
+
+
+# Slack `error` codes where a retry can only fail the same way.
+_PERMANENT_ERRORS = frozenset({
+    "channel_not_found", "not_in_channel", "is_archived", "invalid_auth",
+    "not_authed", "account_inactive", "token_revoked", "invalid_blocks",
+    "msg_too_long", "no_text",
+})
+
+
+def _retry_after(headers: Any) -> float:
+    try:
+        return max(1.0, float(headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return 30.0
+
+
+def message_context(*, state: TrackerState) -> dict[str, Any]:
+    """The state-only half of a post, as JSON-safe values.
+
+    The outbound queue persists this next to the diff so a queued post can
+    be re-composed (with a merged diff) without the `TrackerState`.
+    """
+    config, tickets = state.config, state.tickets
+    return {
+        "slug": config.slug,
+        "done": sum(1 for t in tickets if t.is_done),
+        "total": len(tickets),
+        "phase_lines": "\n".join(
+            f"• *{title}* — {green}/{total_p} 🟢" + (f" · {wip} 🟡" if wip else "")
+            for title, green, wip, total_p in state.phase_progress
+        ),
+        "scoreboard_lines": _format_scoreboard(state=state),
+        "tracker_url": config.tracker_github_url,
+    }
 
 
 def _render_message(
-    *,
-    config: PocConfig,
-    diff: TrackerDiff,
-    tickets: list[JiraTicket],
-    pr_map: dict[str, list[GitHubPR]],
-    phase_progress: list[tuple[str, int, int, int]],
+    *, state: TrackerState, diff: TrackerDiff
+) -> tuple[str, list[dict]]:
+    return compose_message(context=message_context(state=state), diff=diff)
+
+
+def compose_message(
+    *, context: dict[str, Any], diff: TrackerDiff
 ) -> tuple[str, list[dict]]:
     """Compose a Slack post with phase progress + scoreboard + diff highlights."""
-    total = len(tickets)
-    done = sum(1 for t in tickets if t.is_done)
     headline = (
-        f"📊 {config.slug.title()} tracker · {done}/{total} done · "
+        f"📊 {context['slug'].title()} tracker · {context['done']}/{context['total']} done · "
         + _format_diff_headline(diff=diff)
     )
 
-    phase_lines = "\n".join(
-        f"• *{title}* — {green}/{total_p} 🟢" + (f" · {wip} 🟡" if wip else "")
-        for title, green, wip, total_p in phase_progress
-    )
-    scoreboard_lines = _format_scoreboard(tickets=tickets, pr_map=pr_map)
-
     blocks: list[dict] = [
         {"type": "section", "text": {"type": "mrkdwn", "text": f"*{headline}*"}},
         {"type": "section", "text": {"type": "mrkdwn",
-            "text": "*Phase progress*\n" + (phase_lines or "_no phases configured_")}},
+            "text": "*Phase progress*\n" + (context["phase_lines"] or "_no phases configured_")}},
         {"type": "section", "text": {"type": "mrkdwn",
-            "text": "*Who's done what*\n" + (scoreboard_lines or "_no tickets in scope_")}},
+            "text": "*Who's done what*\n" + (context["scoreboard_lines"] or "_no tickets in scope_")}},
     ]
 
     diff_chunks = _format_diff_chunks(diff=diff)
@@ -112,7 +137,7 @@ def _render_message(
         {
             "type": "context",
             "elements": [
-                {"type": "mrkdwn", "text": f"<{config.tracker_github_url}|Open full tracker>"}
+                {"type": "mrkdwn", "text": f"<{context['tracker_url']}|Open full tracker>"}
             ],
         }
     )
@@ -157,19 +182,15 @@ def _format_diff_chunks(*, diff: TrackerDiff) -> list[str]:
     return chunks
 
 
-def _format_scoreboard(
-    *, tickets: list[JiraTicket], pr_map: dict[str, list[GitHubPR]]
-) -> str:
+def _format_scoreboard(*, state: TrackerState) -> str:
     """Per-assignee one-liner: name · ✅n 🔵n 🟡n."""
     by_assignee: dict[str, Counter[str]] = {}
-    for t in tickets:
+    for t in state.tickets:
         owner = t.assignee_name or "_unassigned_"
         bucket = by_assignee.setdefault(owner, Counter())
         if t.is_done:
             bucket["done"] += 1
-        elif t.status_category == "In Progress" or any(
-            pr.state == "OPEN" for pr in pr_map.get(t.key, [])
-        ):
+        elif t.status_category == "In Progress" or state.has_open_pr(t.key):
             bucket["in_flight"] += 1
         else:
             bucket["queued"] += 1
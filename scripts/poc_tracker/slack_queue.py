@@ -0,0 +1,274 @@
+"""Persistent outbound Slack queue — refreshes enqueue, a drain posts.
+
+Each refresh used to make one blocking `chat.postMessage` per client and
+drop the post on any failure. Refreshes now `enqueue` into a
+SQLite outbox (stdlib) and return immediately; `drain` posts whatever is
+due. That buys:
+
+- **Coalescing** — a post waits `window_s` after its first enqueue. Another
+  refresh for the same (channel, client) inside that window merges its diff
+  into the pending row (`merge_diffs`) and replaces the state half, so
+  `--serve` refreshing every few minutes produces one message, not five.
+- **Rate limits** — HTTP 429 / `ratelimited` holds the whole channel until
+  `Retry-After` has passed; other transient failures back off
+  exponentially with full jitter, up to `SLACK_MAX_ATTEMPTS`.
+- **Crash safety** — rows live on disk until Slack acknowledges them, so a
+  crashed or killed refresh is retried by the next run. A row claimed by a
+  drain that died is released after `SLACK_CLAIM_TIMEOUT_S`.
+
+Posts for different clients are not merged even when they share a channel:
+each post's phase progress and scoreboard describe one client.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from .loader import CLIENTS_DIR
+from .slack_notify import SLACK_POST_URL, SendResult, compose_message, send_message
+from .snapshot import TrackerDiff, diff_from_dict, merge_diffs
+
+logger = logging.getLogger(__name__)
+
+SLACK_QUEUE_PATH = CLIENTS_DIR / ".tracker-slack-queue.sqlite"
+SLACK_COALESCE_WINDOW_S = 120
+SLACK_BACKOFF_BASE_S = 5
+SLACK_BACKOFF_MAX_S = 900
+SLACK_MAX_ATTEMPTS = 8
+SLACK_CLAIM_TIMEOUT_S = 300
+SLACK_FLUSH_TIMEOUT_S = 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id          INTEGER PRIMARY KEY,
+    channel     TEXT NOT NULL,
+    slug        TEXT NOT NULL,
+    context     TEXT NOT NULL,      -- slack_notify.message_context, JSON
+    diff        TEXT NOT NULL,      -- TrackerDiff, JSON
+    enqueued_at REAL NOT NULL,
+    due_at      REAL NOT NULL,
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    last_error  TEXT NOT NULL DEFAULT '',
+    claimed_at  REAL                -- NULL = not being sent right now
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (due_at);
+CREATE TABLE IF NOT EXISTS channel_holds (
+    channel    TEXT PRIMARY KEY,
+    not_before REAL NOT NULL        -- Retry-After deadline
+) WITHOUT ROWID;
+"""
+
+Sender = Callable[..., SendResult]
+
+
+@dataclass(frozen=True)
+class DrainResult:
+    sent: int = 0
+    deferred: int = 0   # will be retried later
+    dropped: int = 0    # permanent error or out of attempts
+
+
+class SlackQueue:
+    """SQLite outbox of pending Slack posts. Safe to share across threads."""
+
+    def __init__(
+        self,
+        *,
+        path: Path,
+        api_url: str = SLACK_POST_URL,
+        clock: Callable[[], float] = time.time,
+        rng: random.Random | None = None,
+        sender: Sender = send_message,
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._api_url = api_url
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._sender = sender
+        self._lock = threading.Lock()
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    # ── Producer side ──────────────────────────────────────────────
+
+    def enqueue(
+        self,
+        *,
+        channel: str,
+        slug: str,
+        context: dict[str, Any],
+        diff: TrackerDiff,
+        window_s: float = SLACK_COALESCE_WINDOW_S,
+    ) -> bool:
+        """Queue a post. Returns True when it was merged into a pending one."""
+        now = self._clock()
+        with self._lock, self._connect() as db:
+            row = db.execute(
+                "SELECT id, diff, due_at FROM outbox "
+                "WHERE channel = ? AND slug = ? AND claimed_at IS NULL "
+                "ORDER BY id DESC LIMIT 1",
+                (channel, slug),
+            ).fetchone()
+            if row is not None:
+                row_id, raw_diff, due_at = row
+                merged = merge_diffs(earlier=diff_from_dict(json.loads(raw_diff)), later=diff)
+                db.execute(
+                    "UPDATE outbox SET context = ?, diff = ?, due_at = ? WHERE id = ?",
+                    (
+                        json.dumps(context), json.dumps(asdict(merged)),
+                        min(due_at, now + window_s), row_id,
+                    ),
+                )
+                return True
+            db.execute(
+                "INSERT INTO outbox (channel, slug, context, diff, enqueued_at, due_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (channel, slug, json.dumps(context), json.dumps(asdict(diff)), now, now + window_s),
+            )
+            return False
+
+    # ── Consumer side ──────────────────────────────────────────────
+
+    def drain(self, *, token: str) -> DrainResult:
+        """Post every due row once. Never raises on Slack errors."""
+        sent = deferred = dropped = 0
+        for row in self._claim_due():
+            row_id, channel, slug, raw_context, raw_diff, attempts = row
+            if self._held_until(channel) > self._clock():
+                self._release(row_id=row_id, due_at=self._held_until(channel))
+                deferred += 1
+                continue
+            text, blocks = compose_message(
+                context=json.loads(raw_context), diff=diff_from_dict(json.loads(raw_diff))
+            )
+            result = self._sender(
+                token=token, channel=channel, text=text, blocks=blocks, api_url=self._api_url
+            )
+            if result.ok:
+                self._delete(row_id=row_id)
+                sent += 1
+            elif result.retry_after_s is not None:
+                until = self._clock() + result.retry_after_s
+                self._hold(channel=channel, until=until)
+                self._release(row_id=row_id, due_at=until, error=result.error)
+                logger.info("Slack rate-limited %s — retrying in %.0fs.", channel, result.retry_after_s)
+                deferred += 1
+            elif result.permanent or attempts + 1 >= SLACK_MAX_ATTEMPTS:
+                self._delete(row_id=row_id)
+                logger.warning(
+                    "Dropping Slack post for %s after %d attempt(s): %s",
+                    slug, attempts + 1, result.error,
+                )
+                dropped += 1
+            else:
+                ceiling = min(SLACK_BACKOFF_MAX_S, SLACK_BACKOFF_BASE_S * 2 ** attempts)
+                self._release(
+                    row_id=row_id,
+                    due_at=self._clock() + self._rng.uniform(0, ceiling),
+                    error=result.error,
+                    attempts=attempts + 1,
+                )
+                logger.info("Slack post for %s failed (%s) — will retry.", slug, result.error)
+                deferred += 1
+        return DrainResult(sent=sent, deferred=deferred, dropped=dropped)
+
+    def flush(self, *, token: str, timeout_s: float = SLACK_FLUSH_TIMEOUT_S) -> DrainResult:
+        """Drain until empty or `timeout_s`; whatever is left stays on disk."""
+        deadline = self._clock() + timeout_s
+        sent = dropped = 0
+        while True:
+            result = self.drain(token=token)
+            sent += result.sent
+            dropped += result.dropped
+            due = self.next_due()
+            if due is None or due > deadline:
+                return DrainResult(sent=sent, deferred=self.pending(), dropped=dropped)
+            time.sleep(max(0.0, due - self._clock()))
+
+    def run_forever(self, *, token: str, stop: threading.Event, poll_s: float = 1.0) -> None:
+        """Background drain for `--serve`; returns once `stop` is set."""
+        while not stop.is_set():
+            try:
+                self.drain(token=token)
+            except sqlite3.Error:
+                logger.exception("Slack queue drain failed")
+            stop.wait(poll_s)
+
+    def pending(self) -> int:
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+    def next_due(self) -> float | None:
+        with self._connect() as db:
+            return db.execute(
+                "SELECT MIN(due_at) FROM outbox WHERE claimed_at IS NULL"
+            ).fetchone()[0]
+
+    # ── Internals ──────────────────────────────────────────────────
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Short-lived connections: cheap, and no cross-thread sharing.
+        db = sqlite3.connect(self._path, timeout=30)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def _claim_due(self) -> list[tuple[Any, ...]]:
+        now = self._clock()
+        with self._lock, self._connect() as db:
+            db.execute(
+                "UPDATE outbox SET claimed_at = NULL WHERE claimed_at < ?",
+                (now - SLACK_CLAIM_TIMEOUT_S,),
+            )
+            rows = db.execute(
+                "SELECT id, channel, slug, context, diff, attempts FROM outbox "
+                "WHERE claimed_at IS NULL AND due_at <= ? ORDER BY due_at, id",
+                (now,),
+            ).fetchall()
+            db.executemany(
+                "UPDATE outbox SET claimed_at = ? WHERE id = ?", [(now, row[0]) for row in rows]
+            )
+        return rows
+
+    def _release(
+        self, *, row_id: int, due_at: float, error: str = "", attempts: int | None = None
+    ) -> None:
+        with self._lock, self._connect() as db:
+            db.execute(
+                "UPDATE outbox SET claimed_at = NULL, due_at = ?, "
+                "last_error = COALESCE(NULLIF(?, ''), last_error), "
+                "attempts = COALESCE(?, attempts) WHERE id = ?",
+                (due_at, error, attempts, row_id),
+            )
+
+    def _delete(self, *, row_id: int) -> None:
+        with self._lock, self._connect() as db:
+            db.execute("DELETE FROM outbox WHERE id = ?", (row_id,))
+
+    def _hold(self, *, channel: str, until: float) -> None:
+        with self._lock, self._connect() as db:
+            db.execute(
+                "INSERT INTO channel_holds (channel, not_before) VALUES (?, ?) "
+                "ON CONFLICT (channel) DO UPDATE SET not_before = MAX(not_before, excluded.not_before)",
+                (channel, until),
+            )
+
+    def _held_until(self, channel: str) -> float:
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT not_before FROM channel_holds WHERE channel = ?", (channel,)
+            ).fetchone()
+        return row[0] if row else 0.0
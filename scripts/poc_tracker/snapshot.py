@@ -119,3 +119,42 @@ def diff_snapshots(
         new_prs=new_prs,
         merged_prs=merged_prs,
     )
+
+
+def merge_diffs(*, earlier: TrackerDiff, later: TrackerDiff) -> TrackerDiff:
+    """One diff spanning both windows — used to coalesce queued Slack posts.
+
+    A ticket that moved A → B → C reads A → C; one that moved back to its
+    starting status drops out. A ticket added then removed cancels out, and
+    so does one removed then re-added (it existed before either window).
+    """
+    changes = {key: (old, new) for key, old, new in earlier.status_changes}
+    for key, old, new in later.status_changes:
+        first = changes[key][0] if key in changes else old
+        changes[key] = (first, new)
+    new_tickets = (set(earlier.new_tickets) - set(later.closed_tickets)) | (
+        set(later.new_tickets) - set(earlier.closed_tickets)
+    )
+    closed_tickets = (set(earlier.closed_tickets) - set(later.new_tickets)) | (
+        set(later.closed_tickets) - set(earlier.new_tickets)
+    )
+    return TrackerDiff(
+        new_tickets=sorted(new_tickets),
+        closed_tickets=sorted(closed_tickets),
+        status_changes=sorted(
+            (key, old, new) for key, (old, new) in changes.items() if old != new
+        ),
+        new_prs=sorted(set(earlier.new_prs) | set(later.new_prs)),
+        merged_prs=sorted(set(earlier.merged_prs) | set(later.merged_prs)),
+    )
+
+
+def diff_from_dict(raw: dict) -> TrackerDiff:
+    """Inverse of `dataclasses.asdict(diff)` (JSON turns tuples into lists)."""
+    return TrackerDiff(
+        new_tickets=list(raw.get("new_tickets", [])),
+        closed_tickets=list(raw.get("closed_tickets", [])),
+        status_changes=[tuple(change) for change in raw.get("status_changes", [])],
+        new_prs=list(raw.get("new_prs", [])),
+        merged_prs=list(raw.get("merged_prs", [])),
+    )
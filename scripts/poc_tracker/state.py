@@ -0,0 +1,127 @@
+"""Per-refresh tracker state — indexes + expectation verdicts, built once.
+
+The renderer, the Slack post, and the snapshot diff all need the same
+derived views of (tickets, pr_map): ticket status categories, merged PR
+keys, tickets with an open PR, and each expectation's green/WIP verdict.
+`TrackerState.build` computes them in one pass so every consumer reads the
+same answers and `Expectation.is_green`/`is_wip` run once per expectation.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .github_client import GitHubPR
+from .jira_client import JiraTicket
+from .loader import Expectation, PocConfig
+from .snapshot import TrackerSnapshot, build_snapshot
+
+
+@dataclass(frozen=True)
+class Verdict:
+    """Evaluated state of one expectation row."""
+
+    green: bool | None   # None = manual (no linked items)
+    wip: bool
+
+    @property
+    def checkbox(self) -> str:
+        if self.green is None:
+            return "🔲"  # manual / awaiting external (no linked item)
+        if self.green:
+            return "🟢"  # done — ticket closed / PR merged
+        if self.wip:
+            return "🟡"  # in progress — PR open or ticket in review
+        return "⬜"  # linked but not started
+
+
+@dataclass(frozen=True)
+class TrackerState:
+    config: PocConfig
+    tickets: list[JiraTicket]
+    pr_map: dict[str, list[GitHubPR]]
+    ticket_statuses: dict[str, str]           # key -> statusCategory
+    merged_pr_keys: frozenset[str]            # repo#num of merged PRs
+    open_pr_ticket_keys: frozenset[str]       # tickets with >=1 open PR
+    pr_urls: dict[str, str]                   # repo#num -> url
+    verdicts: dict[Expectation, Verdict]
+    phase_progress: list[tuple[str, int, int, int]]  # (title, green, wip, total)
+    snapshot: TrackerSnapshot
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        config: PocConfig,
+        tickets: list[JiraTicket],
+        pr_map: dict[str, list[GitHubPR]],
+    ) -> TrackerState:
+        ticket_statuses = {t.key: t.status_category for t in tickets}
+        merged: set[str] = set()
+        open_keys: set[str] = set()
+        pr_urls: dict[str, str] = {}
+        for key, prs in pr_map.items():
+            for pr in prs:
+                label = f"{pr.short_repo}#{pr.number}"
+                pr_urls.setdefault(label, pr.url)
+                if pr.state == "MERGED":
+                    merged.add(label)
+                elif pr.state == "OPEN":
+                    open_keys.add(key)
+
+        verdicts: dict[Expectation, Verdict] = {}
+        phase_progress: list[tuple[str, int, int, int]] = []
+        for phase in config.phases:
+            green = wip = total = 0
+            for exp in phase.expectations:
+                verdict = verdicts.get(exp)
+                if verdict is None:
+                    verdict = _evaluate(
+                        expectation=exp,
+                        ticket_statuses=ticket_statuses,
+                        merged_pr_keys=merged,
+                        open_pr_ticket_keys=open_keys,
+                    )
+                    verdicts[exp] = verdict
+                if verdict.green is None:
+                    continue
+                total += 1
+                if verdict.green:
+                    green += 1
+                elif verdict.wip:
+                    wip += 1
+            phase_progress.append((phase.title, green, wip, total))
+
+        return cls(
+            config=config,
+            tickets=tickets,
+            pr_map=pr_map,
+            ticket_statuses=ticket_statuses,
+            merged_pr_keys=frozenset(merged),
+            open_pr_ticket_keys=frozenset(open_keys),
+            pr_urls=pr_urls,
+            verdicts=verdicts,
+            phase_progress=phase_progress,
+            snapshot=build_snapshot(tickets=tickets, pr_map=pr_map),
+        )
+
+    def has_open_pr(self, key: str) -> bool:
+        return key in self.open_pr_ticket_keys
+
+
+def _evaluate(
+    *,
+    expectation: Expectation,
+    ticket_statuses: dict[str, str],
+    merged_pr_keys: set[str],
+    open_pr_ticket_keys: set[str],
+) -> Verdict:
+    green = expectation.is_green(
+        ticket_statuses=ticket_statuses, merged_pr_keys=merged_pr_keys
+    )
+    wip = green is False and expectation.is_wip(
+        ticket_statuses=ticket_statuses,
+        merged_pr_keys=merged_pr_keys,
+        open_pr_ticket_keys=open_pr_ticket_keys,
+    )
+    return Verdict(green=green, wip=wip)
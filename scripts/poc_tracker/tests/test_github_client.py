@@ -0,0 +1,143 @@
+"""Tests for concurrent PR listing + the per-repo PR cache.
+
+No `gh` calls — `_list_recent_prs` is replaced by a fake that records the
+`updated_since` it was called with.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import threading
+
+from scripts.poc_tracker import github_client
+from scripts.poc_tracker.github_client import (
+    GitHubPR,
+    TicketMatcher,
+    fetch_prs_referencing_tickets,
+    link_prs_to_tickets,
+)
+
+
+def _pr(repo: str, number: int, *, title: str = "", state: str = "OPEN") -> GitHubPR:
+    return GitHubPR(
+        repo=repo, number=number, title=title, state=state, is_draft=False,
+        author="alice", url=f"https://github.com/{repo}/pull/{number}",
+        body_excerpt="", head_branch="", updated_at="2026-06-01T12:00:00Z",
+    )
+
+
+class FakeGh:
+    def __init__(self, responses: dict[str, list[GitHubPR]], *, fail: set[str] = frozenset()):
+        self.responses = responses
+        self.fail = fail
+        self.calls: list[tuple[str, object]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, *, repo, updated_since=None):
+        with self._lock:
+            self.calls.append((repo, updated_since))
+        if repo in self.fail:
+            raise subprocess.CalledProcessError(1, "gh", stderr="HTTP 404")
+        return self.responses.get(repo, [])
+
+
+class TestPrFetch:
+    def test_links_prs_across_repos(self, monkeypatch):
+        fake = FakeGh({
+            "o/a": [_pr("o/a", 1, title="BH-1 fix")],
+            "o/b": [_pr("o/b", 7, title="BH-2 and BH-99")],
+        })
+        monkeypatch.setattr(github_client, "_list_recent_prs", fake)
+        out = fetch_prs_referencing_tickets(ticket_keys={"BH-1", "BH-2"}, repos=("o/a", "o/b"))
+        assert [pr.number for pr in out["BH-1"]] == [1]
+        assert [pr.number for pr in out["BH-2"]] == [7]
+        assert sorted(repo for repo, _ in fake.calls) == ["o/a", "o/b"]
+
+    def test_failed_repo_is_skipped(self, monkeypatch):
+        fake = FakeGh({"o/a": [_pr("o/a", 1, title="BH-1")]}, fail={"o/b"})
+        monkeypatch.setattr(github_client, "_list_recent_prs", fake)
+        out = fetch_prs_referencing_tickets(ticket_keys={"BH-1"}, repos=("o/a", "o/b"))
+        assert [pr.number for pr in out["BH-1"]] == [1]
+
+    def test_warm_cache_lists_incrementally_and_merges(self, monkeypatch, tmp_path):
+        cache = tmp_path / "prs.json"
+        monkeypatch.setattr(github_client, "_list_recent_prs", FakeGh({
+            "o/a": [_pr("o/a", 1, title="BH-1"), _pr("o/a", 2, title="BH-2")],
+        }))
+        fetch_prs_referencing_tickets(ticket_keys={"BH-1", "BH-2"}, repos=("o/a",), cache_path=cache)
+
+        fake = FakeGh({"o/a": [_pr("o/a", 2, title="BH-2", state="MERGED")]})
+        monkeypatch.setattr(github_client, "_list_recent_prs", fake)
+        out = fetch_prs_referencing_tickets(ticket_keys={"BH-1", "BH-2"}, repos=("o/a",), cache_path=cache)
+
+        assert fake.calls[0][1] is not None  # incremental `updated:>=` listing
+        assert [pr.state for pr in out["BH-1"]] == ["OPEN"]    # served from cache
+        assert [pr.state for pr in out["BH-2"]] == ["MERGED"]  # upserted
+        saved = json.loads(cache.read_text())
+        assert [row["number"] for row in saved["repos"]["o/a"]["prs"]] == [2, 1]
+
+    def test_full_refresh_ignores_cache(self, monkeypatch, tmp_path):
+        cache = tmp_path / "prs.json"
+        monkeypatch.setattr(github_client, "_list_recent_prs", FakeGh({"o/a": [_pr("o/a", 1)]}))
+        fetch_prs_referencing_tickets(ticket_keys=set(), repos=("o/a",), cache_path=cache)
+        fake = FakeGh({"o/a": []})
+        monkeypatch.setattr(github_client, "_list_recent_prs", fake)
+        fetch_prs_referencing_tickets(
+            ticket_keys=set(), repos=("o/a",), cache_path=cache, full_refresh=True,
+        )
+        assert fake.calls == [("o/a", None)]
+
+    def test_cache_keeps_whole_bodies_only_in_full_body_mode(self, monkeypatch, tmp_path):
+        cache = tmp_path / "prs.json"
+        pr = GitHubPR(**{**_pr("o/a", 1).__dict__, "body_excerpt": "short", "body": "short" + "x" * 1000})
+        monkeypatch.setattr(github_client, "_list_recent_prs", FakeGh({"o/a": [pr]}))
+        fetch_prs_referencing_tickets(ticket_keys=set(), repos=("o/a",), cache_path=cache)
+        saved = json.loads(cache.read_text())
+        assert saved["repos"]["o/a"]["prs"][0]["body"] == ""
+        assert saved["repos"]["o/a"]["prs"][0]["body_excerpt"] == "short"
+
+        # An excerpt-only cache can't serve full-body matching: re-list in full.
+        fake = FakeGh({"o/a": [pr]})
+        monkeypatch.setattr(github_client, "_list_recent_prs", fake)
+        fetch_prs_referencing_tickets(ticket_keys=set(), repos=("o/a",), cache_path=cache, full_body=True)
+        assert fake.calls == [("o/a", None)]
+        assert json.loads(cache.read_text())["repos"]["o/a"]["prs"][0]["body"] == pr.body
+
+    def test_merge_keeps_newest_limit(self, monkeypatch):
+        monkeypatch.setattr(github_client, "PR_LIST_LIMIT", 2)
+        merged = github_client._merge_prs(
+            cached=[_pr("o/a", 1), _pr("o/a", 2)], fresh=[_pr("o/a", 3)],
+        )
+        assert [pr.number for pr in merged] == [3, 2]
+
+
+class TestTicketMatcher:
+    def _pr(self, *, title="", body="", branch="") -> GitHubPR:
+        return GitHubPR(
+            repo="o/a", number=1, title=title, state="OPEN", is_draft=False,
+            author="alice", url="u", body_excerpt=body[:400], head_branch=branch, body=body,
+        )
+
+    def test_reports_matching_fields(self):
+        pr = self._pr(title="BH-1: fix", body="closes BH-2 and BH-1", branch="feat/BH-3")
+        got = TicketMatcher(scope={"BH-1", "BH-2", "BH-3"}).match(pr)
+        assert got == {"BH-1": ("title", "body"), "BH-2": ("body",), "BH-3": ("branch",)}
+
+    def test_respects_scope_and_word_boundary(self):
+        pr = self._pr(title="BH-12 BH-1234 BH-99")
+        assert TicketMatcher(scope={"BH-12", "BH-123"}).match(pr) == {"BH-12": ("title",)}
+
+    def test_full_body_finds_refs_past_excerpt(self):
+        pr = self._pr(body="x" * 500 + " BH-7")
+        assert TicketMatcher(scope={"BH-7"}).match(pr) == {}
+        assert TicketMatcher(scope={"BH-7"}, full_body=True).match(pr) == {"BH-7": ("body",)}
+
+    def test_link_prs_full_body_mode(self):
+        pr = self._pr(body="x" * 500 + " BH-7")
+        prs_by_repo = {"o/a": [pr]}
+        assert link_prs_to_tickets(prs_by_repo=prs_by_repo, ticket_keys={"BH-7"}, repos=("o/a",)) == {"BH-7": []}
+        linked = link_prs_to_tickets(
+            prs_by_repo=prs_by_repo, ticket_keys={"BH-7"}, repos=("o/a",), full_body=True,
+        )
+        assert linked == {"BH-7": [pr]}
@@ -0,0 +1,85 @@
+"""Tests for the append-only refresh history store."""
+
+from __future__ import annotations
+
+import pytest
+
+from scripts.poc_tracker.history import TrackerHistory, normalize_ts
+from scripts.poc_tracker.snapshot import TrackerSnapshot
+
+
+def _snap(ts: str, tickets: dict[str, str], prs: dict[str, str] | None = None) -> TrackerSnapshot:
+    return TrackerSnapshot(timestamp=ts, ticket_statuses=tickets, pr_states=prs or {})
+
+
+_CATEGORY = {"To Do": "To Do", "In Progress": "In Progress", "Done": "Done"}
+
+
+@pytest.fixture
+def history(tmp_path):
+    with TrackerHistory(path=tmp_path / "history.sqlite") as h:
+        for ts, tickets, prs in (
+            ("2026-07-01T10:00:00+00:00", {"BH-1": "To Do", "BH-2": "To Do"}, {}),
+            ("2026-07-02T10:00:00+00:00", {"BH-1": "In Progress", "BH-2": "To Do"}, {"repo#1": "OPEN"}),
+            ("2026-07-04T10:00:00+00:00", {"BH-1": "Done", "BH-3": "To Do"}, {"repo#1": "MERGED"}),
+        ):
+            h.record(
+                snapshot=_snap(ts, tickets, prs),
+                ticket_categories={k: _CATEGORY[v] for k, v in tickets.items()},
+            )
+        yield h
+
+
+class TestHistory:
+    def test_only_changes_are_stored(self, tmp_path):
+        with TrackerHistory(path=tmp_path / "h.sqlite") as h:
+            assert h.record(snapshot=_snap("2026-07-01", {"BH-1": "To Do"}), ticket_categories={}) == 1
+            assert h.record(snapshot=_snap("2026-07-02", {"BH-1": "To Do"}), ticket_categories={}) == 0
+
+    def test_state_as_of(self, history):
+        snap = history.snapshot_as_of(ts="2026-07-03T00:00:00+00:00")
+        assert snap.timestamp == "2026-07-02T10:00:00+00:00"
+        assert snap.ticket_statuses == {"BH-1": "In Progress", "BH-2": "To Do"}
+        assert snap.pr_states == {"repo#1": "OPEN"}
+        assert history.snapshot_as_of(ts="2026-06-30") is None
+
+    def test_left_scope_is_tombstoned(self, history):
+        latest = history.snapshot_as_of(ts="2026-07-05")
+        assert latest.ticket_statuses == {"BH-1": "Done", "BH-3": "To Do"}
+
+    def test_diff_between_points(self, history):
+        d = history.diff(start="2026-07-01T12:00", end="2026-07-05")
+        assert d.status_changes == [("BH-1", "To Do", "Done")]
+        assert d.new_tickets == ["BH-3"]
+        assert d.closed_tickets == ["BH-2"]
+        assert d.new_prs == ["repo#1"]
+
+    def test_current_state_matches_event_replay(self, history):
+        current = history.snapshot_as_of(ts="2026-07-05")
+        assert current.ticket_statuses == {"BH-1": "Done", "BH-3": "To Do"}
+        assert history._tickets_as_of("2026-07-05T00:00:00+00:00") == {
+            key: tuple(row) for key, *row in history._db.execute(
+                "SELECT k.key, e.status, e.category FROM known_tickets k JOIN ticket_events e "
+                "ON e.key = k.key AND e.ts = (SELECT MAX(ts) FROM ticket_events WHERE key = k.key)"
+            )
+        }
+
+    def test_category_only_change_is_recorded(self, tmp_path):
+        with TrackerHistory(path=tmp_path / "h.sqlite") as h:
+            h.record(snapshot=_snap("2026-07-01", {"BH-1": "Review"}), ticket_categories={"BH-1": "In Progress"})
+            assert h.record(
+                snapshot=_snap("2026-07-02", {"BH-1": "Review"}), ticket_categories={"BH-1": "Done"},
+            ) == 1
+            assert h._tickets_as_of("2026-07-03T00:00:00+00:00") == {"BH-1": ("Review", "Done")}
+
+    def test_cycle_time_and_burndown(self, history):
+        assert history.cycle_times() == {"BH-1": pytest.approx(2.0)}
+        assert history.burndown() == [
+            ("2026-07-01T10:00:00+00:00", 0, 2),
+            ("2026-07-02T10:00:00+00:00", 0, 2),
+            ("2026-07-04T10:00:00+00:00", 1, 2),
+        ]
+
+    def test_normalize_ts_converts_to_utc(self):
+        assert normalize_ts("2026-07-01T06:00:00-04:00") == "2026-07-01T10:00:00+00:00"
+        assert normalize_ts("2026-07-01") == "2026-07-01T00:00:00+00:00"
@@ -0,0 +1,257 @@
+"""Tests for the Jira client's ticket cache + delta refresh.
+
+No network — a fake session answers `post_json` from canned issue payloads
+and records every JQL it was asked for.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from scripts.poc_tracker import jira_client
+from scripts.poc_tracker.jira_client import JiraSession, fetch_tickets, fetch_tickets_for_clients
+from scripts.poc_tracker.loader import Auth, PocConfig
+
+
+def _config(
+    *, slug: str = "acme", epic: str = "BH-100",
+    ticket_keys: tuple[str, ...] = (), keyword_jql: str = "",
+) -> PocConfig:
+    return PocConfig(
+        slug=slug, trial_dates="TBD", epic=epic, adjacent_epics=(),
+        ticket_keys=ticket_keys, keyword_jql=keyword_jql, repos=(), slack_channel_id="",
+        ownership=(), phases=(),
+        auth=Auth(
+            jira_base_url="https://jira.example.com", jira_user_email="a@b.c",
+            jira_api_token="t", slack_bot_token=None,
+        ),
+    )
+
+
+def _issue(
+    key: str, *, status: str = "To Do", parent: str | None = None,
+    updated: str = "2026-06-01T12:00:00+00:00",
+) -> dict:
+    return {
+        "key": key,
+        "fields": {
+            "parent": {"key": parent} if parent else None,
+            "summary": f"summary {key}",
+            "status": {"name": status, "statusCategory": {"name": status}},
+            "issuetype": {"name": "Task"},
+            "labels": ["poc"],
+            "updated": updated,
+        },
+    }
+
+
+class FakeSession:
+    """Routes queries by shape: full scope, delta window, or left-scope check."""
+
+    def __init__(self, *, full=(), changed=(), left_scope=(), keyword=None, reject_delta=False):
+        self.full = list(full)
+        self.changed = list(changed)
+        self.left_scope = list(left_scope)
+        self.keyword = keyword or {}
+        self.reject_delta = reject_delta
+        self.jqls: list[str] = []
+
+    def post_json(self, *, path, body):
+        jql = body["jql"]
+        self.jqls.append(jql)
+        if self.reject_delta and "updated >=" in jql:
+            raise jira_client.JiraError(status=400, body=b"bad JQL")
+        if jql in self.keyword:
+            return {"issues": self.keyword[jql]}
+        if "NOT (" in jql:
+            return {"issues": self.left_scope}
+        if "updated >=" in jql:
+            return {"issues": self.changed}
+        return {"issues": self.full}
+
+
+class FakeConnection:
+    """Mimics http.client's state machine: after a failed read, later requests are refused."""
+
+    def __init__(self, *, fail_with: BaseException | None = None):
+        self.fail_with = fail_with
+        self.broken = False
+        self.closed = False
+
+    def request(self, method, url, body=None, headers=None):
+        if self.broken:
+            raise http.client.CannotSendRequest("Request-sent")
+
+    def getresponse(self):
+        if self.fail_with is not None:
+            self.broken = True
+            raise self.fail_with
+        return FakeResponse()
+
+    def close(self):
+        self.closed = True
+
+
+class FakeResponse:
+    status = 200
+
+    def read(self):
+        return b'{"issues": []}'
+
+
+class TestJiraSession:
+    def test_timeout_discards_connection_so_next_call_succeeds(self, monkeypatch):
+        connections = [FakeConnection(fail_with=TimeoutError("read timed out")), FakeConnection()]
+        monkeypatch.setattr(jira_client.http.client, "HTTPSConnection", lambda *a, **kw: connections.pop(0))
+        monkeypatch.setattr(jira_client, "build_ssl_context", lambda: None)
+        session = JiraSession(config=_config())
+        with pytest.raises(TimeoutError):
+            session.post_json(path="/search", body={})
+        assert session.post_json(path="/search", body={}) == {"issues": []}
+        assert not connections  # the timed-out connection was replaced, not reused
+
+
+class TestTicketCache:
+    def test_cold_cache_does_full_fetch_and_persists(self, tmp_path):
+        cache = tmp_path / "cache.json"
+        session = FakeSession(full=[_issue("BH-1"), _issue("BH-2")])
+        tickets = fetch_tickets(config=_config(), session=session, cache_path=cache)
+        assert sorted(t.key for t in tickets) == ["BH-1", "BH-2"]
+        assert len(session.jqls) == 1 and "updated >=" not in session.jqls[0]
+        saved = json.loads(cache.read_text())
+        assert [row["key"] for row in saved["tickets"]] == ["BH-1", "BH-2"]
+
+    def test_warm_cache_only_pulls_delta(self, tmp_path):
+        cache = tmp_path / "cache.json"
+        fetch_tickets(
+            config=_config(), cache_path=cache,
+            session=FakeSession(full=[_issue("BH-1"), _issue("BH-2"), _issue("BH-3")]),
+        )
+        session = FakeSession(
+            changed=[_issue("BH-2", status="Done"), _issue("BH-4")],
+            left_scope=[_issue("BH-3")],
+        )
+        tickets = {t.key: t for t in fetch_tickets(config=_config(), session=session, cache_path=cache)}
+        assert sorted(tickets) == ["BH-1", "BH-2", "BH-4"]  # BH-3 evicted, BH-4 new
+        assert tickets["BH-2"].status == "Done"
+        assert tickets["BH-1"].labels == ("poc",)  # served from cache, tuple restored
+        assert all("updated >=" in jql for jql in session.jqls)
+
+    def test_left_scope_query_does_not_list_cached_keys(self, tmp_path):
+        cache = tmp_path / "cache.json"
+        fetch_tickets(
+            config=_config(), cache_path=cache,
+            session=FakeSession(full=[_issue("BH-1"), _issue("BH-2")]),
+        )
+        # BH-77 left some other scope; it was never cached, so it isn't "evicted".
+        session = FakeSession(left_scope=[_issue("BH-2"), _issue("BH-77")])
+        tickets = fetch_tickets(config=_config(), session=session, cache_path=cache)
+        assert [t.key for t in tickets] == ["BH-1"]
+        left_jql = next(jql for jql in session.jqls if "NOT (" in jql)
+        assert "key in" not in left_jql and left_jql.startswith("project in (BH) AND")
+
+    def test_rejected_delta_falls_back_to_full_fetch(self, tmp_path):
+        cache = tmp_path / "cache.json"
+        fetch_tickets(config=_config(), session=FakeSession(full=[_issue("BH-1")]), cache_path=cache)
+        session = FakeSession(full=[_issue("BH-1"), _issue("BH-2")], reject_delta=True)
+        tickets = fetch_tickets(config=_config(), session=session, cache_path=cache)
+        assert sorted(t.key for t in tickets) == ["BH-1", "BH-2"]
+        assert "updated >=" not in session.jqls[-1]
+
+    def test_scope_change_invalidates_cache(self, tmp_path):
+        cache = tmp_path / "cache.json"
+        fetch_tickets(config=_config(), session=FakeSession(full=[_issue("BH-1")]), cache_path=cache)
+        other = PocConfig(**{**_config().__dict__, "epic": "BH-200"})
+        session = FakeSession(full=[_issue("BH-9")])
+        tickets = fetch_tickets(config=other, session=session, cache_path=cache)
+        assert [t.key for t in tickets] == ["BH-9"]
+        assert "updated >=" not in session.jqls[0]
+
+    def test_full_refresh_ignores_cache(self, tmp_path):
+        cache = tmp_path / "cache.json"
+        fetch_tickets(config=_config(), session=FakeSession(full=[_issue("BH-1")]), cache_path=cache)
+        session = FakeSession(full=[_issue("BH-5")])
+        tickets = fetch_tickets(
+            config=_config(), session=session, cache_path=cache, full_refresh=True,
+        )
+        assert [t.key for t in tickets] == ["BH-5"]
+
+    @pytest.mark.parametrize("age_hours, expect_delta", [(1, True), (48, False)])
+    def test_stale_cache_forces_full_fetch(self, tmp_path, age_hours, expect_delta):
+        cache = tmp_path / "cache.json"
+        fetch_tickets(config=_config(), session=FakeSession(full=[_issue("BH-1")]), cache_path=cache)
+        raw = json.loads(cache.read_text())
+        raw["fetched_at"] = (
+            datetime.now(timezone.utc) - timedelta(hours=age_hours)
+        ).isoformat(timespec="seconds")
+        cache.write_text(json.dumps(raw))
+        session = FakeSession(full=[_issue("BH-1")])
+        fetch_tickets(config=_config(), session=session, cache_path=cache)
+        assert ("updated >=" in session.jqls[0]) is expect_delta
+
+    def test_delta_window_includes_overlap(self):
+        now = datetime(2026, 6, 1, 12, 0, tzinfo=timezone.utc)
+        minutes = jira_client._minutes_since(now - timedelta(seconds=90), now=now)
+        assert minutes == 2 + jira_client.CACHE_OVERLAP_MINUTES
+
+
+class TestMultiClientFetch:
+    def test_union_fetch_splits_by_client_scope(self):
+        acme = _config(slug="acme", epic="BH-100", keyword_jql='summary ~ "acme"')
+        widgets = _config(slug="widgets", epic="BH-200", ticket_keys=("BH-7",))
+        session = FakeSession(
+            full=[
+                _issue("BH-1", parent="BH-100"),
+                _issue("BH-2", parent="BH-200"),
+                _issue("BH-7"),
+                _issue("BH-9"),  # keyword match for acme only
+            ],
+            keyword={'summary ~ "acme"': [_issue("BH-9")]},
+        )
+        out = fetch_tickets_for_clients(configs=[acme, widgets], session=session)
+        assert sorted(t.key for t in out["acme"]) == ["BH-1", "BH-9"]
+        assert sorted(t.key for t in out["widgets"]) == ["BH-2", "BH-7"]
+        # One union query + one keyword query — not one per client.
+        assert len(session.jqls) == 2
+        assert "parent = BH-100" in session.jqls[0] and "parent = BH-200" in session.jqls[0]
+        assert 'summary ~ "acme"' not in session.jqls[0]
+
+    def test_noisy_keyword_cannot_crowd_out_other_clients(self, monkeypatch):
+        monkeypatch.setattr(jira_client, "MAX_TICKETS", 3)
+        noisy = _config(slug="noisy", epic="BH-100", keyword_jql='text ~ "data"')
+        quiet = _config(slug="quiet", epic="BH-200")
+        session = FakeSession(
+            full=[_issue("BH-1", parent="BH-200"), _issue("BH-2", parent="BH-200")],
+            keyword={'text ~ "data"': [_issue(f"BH-{n}") for n in range(10, 20)]},
+        )
+        out = fetch_tickets_for_clients(configs=[noisy, quiet], session=session)
+        assert sorted(t.key for t in out["quiet"]) == ["BH-1", "BH-2"]
+        assert len(out["noisy"]) == 3  # capped per client
+
+    def test_keyword_queries_use_the_delta_cache(self, tmp_path):
+        cache = tmp_path / ".tracker-all-jira-cache.json"
+        acme = _config(slug="acme", epic="BH-100", keyword_jql='summary ~ "acme"')
+        fetch_tickets_for_clients(
+            configs=[acme], cache_path=cache,
+            session=FakeSession(
+                full=[_issue("BH-1", parent="BH-100")],
+                keyword={'summary ~ "acme"': [_issue("BH-9")]},
+            ),
+        )
+        session = FakeSession(changed=[_issue("BH-10")])
+        out = fetch_tickets_for_clients(configs=[acme], cache_path=cache, session=session)
+        assert sorted(t.key for t in out["acme"]) == ["BH-1", "BH-10", "BH-9"]
+        assert all("updated >=" in jql for jql in session.jqls)
+        assert len(list(tmp_path.glob(".tracker-all-jira-kw-*-cache.json"))) == 1
+
+    def test_identical_scopes_are_deduplicated(self):
+        session = FakeSession(full=[_issue("BH-1", parent="BH-100")])
+        out = fetch_tickets_for_clients(
+            configs=[_config(slug="a"), _config(slug="b")], session=session,
+        )
+        assert session.jqls[0].count("parent = BH-100") == 1
+        assert [t.key for t in out["a"]] == [t.key for t in out["b"]] == ["BH-1"]
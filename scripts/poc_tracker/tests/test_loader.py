@@ -20,9 +20,18 @@ from scripts.poc_tracker.loader import (
     Auth,
     Expectation,
     PocConfig,
+    load_all_configs,
     load_config,
 )
-from scripts.poc_tracker.renderer import compute_phase_progress, render_tracker
+from scripts.poc_tracker.renderer import (
+    SectionCache,
+    compute_phase_progress,
+    render_tracker,
+    tracker_content_sha,
+)
+from scripts.poc_tracker.slack_notify import _render_message
+from scripts.poc_tracker.snapshot import diff_snapshots
+from scripts.poc_tracker.state import TrackerState
 
 
 @pytest.fixture(autouse=True)
@@ -100,6 +109,17 @@ class TestLoader:
         # Different config objects — agnosticism check
         assert a is not w
 
+    def test_load_all_configs_collects_errors(self, tmp_path):
+        for slug, epic in (("acme", "BH-1"), ("widgets", "BH-2")):
+            _write_yaml(
+                repo_root=tmp_path, slug=slug,
+                body=f"slug: {slug}\nscope:\n  epic: {epic}\nrepos: []\n",
+            )
+        _write_yaml(repo_root=tmp_path, slug="broken", body="slug: broken\nscope: {}\n")
+        configs, errors = load_all_configs(repo_root=tmp_path)
+        assert [c.slug for c in configs] == ["acme", "widgets"]
+        assert len(errors) == 1 and "scope.epic is required" in errors[0]
+
 
 # ── Expectation logic ──────────────────────────────────────────────
 
@@ -202,3 +222,88 @@ class TestRenderer:
         assert "Phase 1 (0/1 🟢, 1 🟡)" in out
         progress = compute_phase_progress(config=config, tickets=tickets, pr_map={})
         assert progress == [("Phase 1", 0, 1, 1)]
+
+
+class TestTrackerState:
+    def _pr(self, number: int, *, state: str) -> GitHubPR:
+        return GitHubPR(
+            repo="acme/repo", number=number, title="BH-101", state=state, is_draft=False,
+            author="alice", url=f"https://github.com/acme/repo/pull/{number}",
+            body_excerpt="", head_branch="",
+        )
+
+    def test_indexes_and_verdicts(self, tmp_path):
+        config = _config(tmp_path=tmp_path)
+        tickets = [_ticket("BH-101", status="To Do", category="To Do")]
+        pr_map = {"BH-101": [self._pr(1, state="OPEN"), self._pr(2, state="MERGED")]}
+        state = TrackerState.build(config=config, tickets=tickets, pr_map=pr_map)
+        assert state.ticket_statuses == {"BH-101": "To Do"}
+        assert state.merged_pr_keys == {"repo#2"}
+        assert state.open_pr_ticket_keys == {"BH-101"}
+        assert state.pr_urls["repo#1"].endswith("/pull/1")
+        linked, manual = config.phases[0].expectations
+        assert state.verdicts[linked].checkbox == "🟡"  # open PR → WIP
+        assert state.verdicts[manual].checkbox == "🔲"
+        assert state.phase_progress == [("Phase 1", 0, 1, 1)]
+        assert state.snapshot.pr_states == {"repo#1": "OPEN", "repo#2": "MERGED"}
+
+    def test_renderer_and_slack_share_state(self, tmp_path):
+        config = _config(tmp_path=tmp_path)
+        tickets = [_ticket("BH-101", status="To Do", category="To Do")]
+        pr_map = {"BH-101": [self._pr(1, state="OPEN")]}
+        state = TrackerState.build(config=config, tickets=tickets, pr_map=pr_map)
+        out = render_tracker(
+            config=config, tickets=tickets, pr_map=pr_map, existing_text=None,
+            now=_now(), state=state,
+        )
+        assert "Phase 1 (0/1 🟢, 1 🟡)" in out
+        diff = diff_snapshots(previous=None, current=state.snapshot)
+        _, blocks = _render_message(state=state, diff=diff)
+        texts = [b["text"]["text"] for b in blocks if b["type"] == "section"]
+        assert "*Phase 1* — 0/1 🟢 · 1 🟡" in texts[1]
+        assert "*Alice* — ✅0 🔵1 🟡0" in texts[2]  # open PR counts as in flight
+
+
+class TestSectionCache:
+    def test_only_affected_sections_rerender(self, tmp_path):
+        config = _config(tmp_path=tmp_path)
+        cache = SectionCache()
+        tickets = [_ticket("BH-101", status="To Do", category="To Do")]
+        first = render_tracker(
+            config=config, tickets=tickets, pr_map={}, existing_text=None,
+            now=_now(), section_cache=cache,
+        )
+        assert cache.hits == set()
+
+        renamed = [JiraTicket(**{**tickets[0].__dict__, "summary": "new summary"})]
+        render_tracker(
+            config=config, tickets=renamed, pr_map={}, existing_text=first,
+            now=_now(), section_cache=cache,
+        )
+        # Summary text feeds the scoreboard + status grid only.
+        assert cache.hits == {"day-by-day", "summary", "recent-activity"}
+        assert set(cache.timings) == {
+            "day-by-day", "scoreboard", "summary", "status-grid", "recent-activity",
+        }
+
+    def test_cached_render_matches_fresh_render(self, tmp_path):
+        config = _config(tmp_path=tmp_path)
+        tickets = [_ticket("BH-101", status="Done", category="Done")]
+        cache = SectionCache()
+        kwargs = dict(config=config, tickets=tickets, pr_map={}, existing_text=None, now=_now())
+        render_tracker(**kwargs, section_cache=cache)
+        cache.save(path=tmp_path / "render.json")
+        reloaded = SectionCache.load(path=tmp_path / "render.json")
+        assert render_tracker(**kwargs, section_cache=reloaded) == render_tracker(**kwargs)
+        assert len(reloaded.hits) == 5
+
+    def test_content_sha_ignores_refresh_timestamp(self, tmp_path):
+        config = _config(tmp_path=tmp_path)
+        tickets = [_ticket("BH-101", status="Done", category="Done")]
+        a = render_tracker(config=config, tickets=tickets, pr_map={}, existing_text=None, now=_now())
+        b = render_tracker(
+            config=config, tickets=tickets, pr_map={}, existing_text=None,
+            now=_now().replace(hour=13),
+        )
+        assert a != b
+        assert tracker_content_sha(a) == tracker_content_sha(b)
@@ -0,0 +1,129 @@
+"""Tests for `--serve`: refresh loop backoff, HTTP trigger, warm configs.
+
+No Jira / GitHub — the loop drives a fake refresh callable and the HTTP
+server binds an ephemeral port on 127.0.0.1.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import textwrap
+import threading
+import urllib.request
+
+import pytest
+
+from scripts.poc_tracker import serve
+from scripts.poc_tracker.serve import RefreshLoop, WarmConfigs, make_http_server
+
+
+@pytest.fixture(autouse=True)
+def _set_jira_env(monkeypatch):
+    monkeypatch.setenv("JIRA_USER_EMAIL", "test@example.com")
+    monkeypatch.setenv("JIRA_API_TOKEN", "fake-token")
+
+
+class FlakyRefresh:
+    def __init__(self, *, fail_first: int = 0):
+        self.fail_first = fail_first
+        self.calls = 0
+        self.ran = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.ran.set()
+        if self.calls <= self.fail_first:
+            raise RuntimeError("Jira search failed: 503")
+
+
+class TestRefreshLoop:
+    def test_interval_is_jittered_within_bounds(self):
+        loop = RefreshLoop(refresh=FlakyRefresh(), interval_s=100, rng=random.Random(1))
+        delays = {round(loop.next_delay(), 3) for _ in range(50)}
+        assert len(delays) > 1
+        assert all(90 <= d <= 110 for d in delays)
+
+    def test_failures_back_off_exponentially_and_reset(self):
+        refresh = FlakyRefresh(fail_first=3)
+        loop = RefreshLoop(refresh=refresh, interval_s=100, rng=random.Random(1))
+        ceilings = []
+        for _ in range(3):
+            assert loop.run_once() is False
+            ceilings.append(loop.next_delay())
+        base = serve.SERVE_BACKOFF_BASE_S
+        assert base / 2 <= ceilings[0] <= base
+        assert 2 * base <= ceilings[2] <= 4 * base
+        assert loop.status().last_error == "RuntimeError: Jira search failed: 503"
+
+        assert loop.run_once() is True
+        status = loop.status()
+        assert status.consecutive_failures == 0 and status.runs == 4
+        assert 90 <= loop.next_delay() <= 110
+
+    def test_backoff_is_capped(self):
+        loop = RefreshLoop(refresh=FlakyRefresh(fail_first=99), rng=random.Random(1))
+        for _ in range(20):
+            loop.run_once()
+        assert loop.next_delay() <= serve.SERVE_BACKOFF_MAX_S
+
+
+class TestHttpEndpoint:
+    def test_post_refresh_wakes_loop(self):
+        refresh = FlakyRefresh()
+        loop = RefreshLoop(refresh=refresh, interval_s=3600)
+        server = make_http_server(loop=loop, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        worker = threading.Thread(target=loop.run_forever, daemon=True)
+        worker.start()
+        base = f"http://127.0.0.1:{server.server_port}"
+        try:
+            assert refresh.ran.wait(timeout=5)  # initial refresh
+            refresh.ran.clear()
+            req = urllib.request.Request(f"{base}/refresh", method="POST")
+            with urllib.request.urlopen(req, timeout=5) as resp:
+                assert resp.status == 202
+            assert refresh.ran.wait(timeout=5)  # woke long before the 1h interval
+            with urllib.request.urlopen(f"{base}/status", timeout=5) as resp:
+                status = json.loads(resp.read())
+            assert status["runs"] >= 1 and status["consecutive_failures"] == 0
+        finally:
+            loop.stop()
+            worker.join(timeout=5)
+            server.shutdown()
+            server.server_close()
+        assert refresh.calls == 2
+
+
+class TestWarmConfigs:
+    def _write(self, tmp_path, *, trial_dates: str) -> None:
+        path = tmp_path / "clients" / "trials" / "acme"
+        path.mkdir(parents=True, exist_ok=True)
+        (path / "poc.yaml").write_text(textwrap.dedent(f"""
+            slug: acme
+            trial_dates: "{trial_dates}"
+            scope:
+              epic: BH-100
+        """).strip())
+
+    def test_reparses_only_on_change(self, tmp_path, monkeypatch):
+        self._write(tmp_path, trial_dates="TBD")
+        calls = []
+        real = serve.load_config
+        monkeypatch.setattr(serve, "load_config", lambda **kw: calls.append(kw) or real(**kw))
+        warm = WarmConfigs(repo_root=tmp_path, slug="acme")
+        first, _ = warm.get()
+        second, _ = warm.get()
+        assert first is second and len(calls) == 1
+
+        self._write(tmp_path, trial_dates="June")
+        yaml_path = tmp_path / "clients" / "trials" / "acme" / "poc.yaml"
+        stat = yaml_path.stat()
+        os.utime(yaml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        reloaded, _ = warm.get()
+        assert len(calls) == 2 and reloaded[0].trial_dates == "June"
+
+    def test_missing_config_reports_error(self, tmp_path):
+        configs, errors = WarmConfigs(repo_root=tmp_path, slug="nope").get()
+        assert configs == [] and "No PoC config" in errors[0]
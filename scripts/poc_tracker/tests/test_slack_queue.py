@@ -0,0 +1,198 @@
+"""Tests for the persistent outbound Slack queue.
+
+No slack.com — `StubSlack` is a local `chat.postMessage` look-alike that
+answers from a script of responses and records every payload it received.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from scripts.poc_tracker import slack_queue
+from scripts.poc_tracker.slack_queue import SlackQueue
+from scripts.poc_tracker.snapshot import TrackerDiff, merge_diffs
+
+
+class StubSlack:
+    """Scripted Slack API: each request pops (status, headers, body); default is ok."""
+
+    def __init__(self, script=()):
+        self.script = list(script)
+        self.posts: list[dict] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):  # noqa: N802
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                stub.posts.append(payload)
+                status, headers, body = stub.script.pop(0) if stub.script else (200, {}, {"ok": True})
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/api/chat.postMessage"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def stub():
+    server = StubSlack()
+    yield server
+    server.close()
+
+
+def _diff(**kw) -> TrackerDiff:
+    base = dict(new_tickets=[], closed_tickets=[], status_changes=[], new_prs=[], merged_prs=[])
+    return TrackerDiff(**{**base, **kw})
+
+
+def _context(*, done: int = 1) -> dict:
+    return {
+        "slug": "acme", "done": done, "total": 3, "phase_lines": "• *Phase 1* — 1/1 🟢",
+        "scoreboard_lines": "• *Alice* — ✅1 🔵0 🟡0", "tracker_url": "https://example.com/t",
+    }
+
+
+def _queue(tmp_path, stub, clock) -> SlackQueue:
+    return SlackQueue(path=tmp_path / "outbox.sqlite", api_url=stub.url, clock=clock)
+
+
+class TestSlackQueue:
+    def test_coalesces_diffs_within_window(self, tmp_path, stub):
+        clock = FakeClock()
+        queue = _queue(tmp_path, stub, clock)
+        queue.enqueue(channel="C1", slug="acme", context=_context(done=1),
+                      diff=_diff(status_changes=[("BH-1", "To Do", "In Progress")]))
+        clock.now += 30
+        merged = queue.enqueue(channel="C1", slug="acme", context=_context(done=2),
+                               diff=_diff(status_changes=[("BH-1", "In Progress", "Done")],
+                                          merged_prs=["repo#4"]))
+        assert merged is True
+        assert queue.drain(token="t").sent == 0  # window still open
+
+        clock.now += slack_queue.SLACK_COALESCE_WINDOW_S
+        assert queue.drain(token="t").sent == 1
+        assert len(stub.posts) == 1
+        post = stub.posts[0]
+        assert post["channel"] == "C1"
+        assert "2/3 done" in post["text"]  # latest state wins
+        texts = json.dumps(post["blocks"], ensure_ascii=False)
+        assert "`BH-1` To Do → Done" in texts and "repo#4" in texts
+        assert queue.pending() == 0
+
+    def test_clients_sharing_a_channel_post_separately(self, tmp_path, stub):
+        queue = _queue(tmp_path, stub, FakeClock())
+        queue.enqueue(channel="C1", slug="acme", context=_context(), diff=_diff(), window_s=0)
+        merged = queue.enqueue(channel="C1", slug="widgets", context=_context(), diff=_diff(), window_s=0)
+        assert merged is False
+        assert queue.drain(token="t").sent == 2
+
+    def test_retry_after_holds_channel(self, tmp_path):
+        server = StubSlack(script=[(429, {"Retry-After": "7"}, {"ok": False, "error": "ratelimited"})])
+        try:
+            clock = FakeClock()
+            queue = _queue(tmp_path, server, clock)
+            queue.enqueue(channel="C1", slug="acme", context=_context(), diff=_diff(), window_s=0)
+            queue.enqueue(channel="C1", slug="widgets", context=_context(), diff=_diff(), window_s=0)
+            result = queue.drain(token="t")
+            assert (result.sent, result.deferred) == (0, 2)
+            assert len(server.posts) == 1  # second row never hit the rate-limited channel
+            assert queue.next_due() == pytest.approx(clock.now + 7)
+
+            clock.now += 6
+            assert queue.drain(token="t").sent == 0
+            clock.now += 1
+            assert queue.drain(token="t").sent == 2
+        finally:
+            server.close()
+
+    def test_transient_failure_backs_off_then_drops(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(slack_queue, "SLACK_MAX_ATTEMPTS", 3)
+        server = StubSlack(script=[(500, {}, {"ok": False})] * 3)
+        try:
+            clock = FakeClock()
+            queue = _queue(tmp_path, server, clock)
+            queue.enqueue(channel="C1", slug="acme", context=_context(), diff=_diff(), window_s=0)
+            for _ in range(2):
+                assert queue.drain(token="t").deferred == 1
+                clock.now += slack_queue.SLACK_BACKOFF_MAX_S
+            assert queue.drain(token="t").dropped == 1
+            assert queue.pending() == 0
+        finally:
+            server.close()
+
+    def test_permanent_error_is_dropped_immediately(self, tmp_path):
+        server = StubSlack(script=[(200, {}, {"ok": False, "error": "channel_not_found"})])
+        try:
+            queue = _queue(tmp_path, server, FakeClock())
+            queue.enqueue(channel="C404", slug="acme", context=_context(), diff=_diff(), window_s=0)
+            assert queue.drain(token="t").dropped == 1
+        finally:
+            server.close()
+
+    def test_survives_restart(self, tmp_path, stub):
+        clock = FakeClock()
+        SlackQueue(path=tmp_path / "outbox.sqlite", api_url="http://127.0.0.1:9/", clock=clock).enqueue(
+            channel="C1", slug="acme", context=_context(), diff=_diff(), window_s=0,
+        )
+        # Fresh process, same file.
+        reopened = _queue(tmp_path, stub, clock)
+        assert reopened.flush(token="t", timeout_s=0).sent == 1
+        assert len(stub.posts) == 1
+
+    def test_stale_claim_is_released(self, tmp_path, stub):
+        clock = FakeClock()
+        queue = _queue(tmp_path, stub, clock)
+        queue.enqueue(channel="C1", slug="acme", context=_context(), diff=_diff(), window_s=0)
+        queue._claim_due()  # a drain that died mid-send
+        assert queue.drain(token="t").sent == 0
+        clock.now += slack_queue.SLACK_CLAIM_TIMEOUT_S + 1
+        assert queue.drain(token="t").sent == 1
+
+
+class TestMergeDiffs:
+    def test_status_chain_collapses_and_round_trip_drops(self):
+        merged = merge_diffs(
+            earlier=_diff(status_changes=[("BH-1", "To Do", "In Progress"), ("BH-2", "To Do", "Done")]),
+            later=_diff(status_changes=[("BH-1", "In Progress", "Done"), ("BH-2", "Done", "To Do")]),
+        )
+        assert merged.status_changes == [("BH-1", "To Do", "Done")]
+
+    def test_added_then_removed_cancels(self):
+        merged = merge_diffs(
+            earlier=_diff(new_tickets=["BH-5"], new_prs=["r#1"]),
+            later=_diff(closed_tickets=["BH-5"], merged_prs=["r#1"]),
+        )
+        assert merged.new_tickets == [] and merged.closed_tickets == []
+        assert merged.new_prs == ["r#1"] and merged.merged_prs == ["r#1"]
+
+    def test_removed_then_readded_cancels(self):
+        merged = merge_diffs(
+            earlier=_diff(closed_tickets=["BH-6"]),
+            later=_diff(new_tickets=["BH-6", "BH-7"]),
+        )
+        assert merged.new_tickets == ["BH-7"] and merged.closed_tickets == []
@@ -93,11 +93,6 @@ def normalize_nested_keys(value: Any) -> Any:
     return value
 
 
-def _values_equal(a: Any, b: Any) -> bool:
-    """Deep-equality check for normalized vault values (handles dict/list/scalar)."""
-    return a == b
-
-
 def set_aws_key(env_data: dict[str, Any], key: str, value: Any) -> None:
     """Store a flattened AWS secret key plus any compatibility aliases.
 
@@ -134,8 +129,9 @@ def flatten_aws_export(entries: list[dict[str, Any]]) -> dict[str, Any]:
     """
     flattened: dict[str, Any] = {}
 
-    # First pass: store each secret under its namespaced key and count
-    # how many secrets contribute each inner key.
+    # First pass: normalize each secret exactly once, store it under its
+    # namespaced key, and record which secrets contribute each inner key.
+    # Owner lists hold references into the normalized secret — no copies.
     inner_key_owners: dict[str, list[tuple[str, Any]]] = {}
 
     for entry in entries:
@@ -147,17 +143,19 @@ def flatten_aws_export(entries: list[dict[str, Any]]) -> dict[str, Any]:
         parsed_value = entry.get("value_parsed")
 
         if isinstance(parsed_value, dict):
-            normalized_secret = normalize_nested_keys(parsed_value)
-            if normalized_name:
-                flattened[normalized_name] = normalized_secret
-
-            for raw_key, raw_value in parsed_value.items():
+            # Same result as normalize_nested_keys(parsed_value), but every raw
+            # key is an owner: two raw keys of one secret that normalize alike
+            # are still two owners (and a collision if their values differ).
+            normalized_secret: dict[str, Any] = {}
+            for raw_key, raw_inner in parsed_value.items():
                 nk = normalize_key(str(raw_key))
                 if not nk:
                     continue
-                inner_key_owners.setdefault(nk, []).append(
-                    (raw_name, normalize_nested_keys(raw_value))
-                )
+                inner = normalize_nested_keys(raw_inner)
+                normalized_secret[nk] = inner
+                inner_key_owners.setdefault(nk, []).append((raw_name, inner))
+            if normalized_name:
+                flattened[normalized_name] = normalized_secret
             continue
 
         raw_value = entry.get("value")
@@ -169,16 +167,16 @@ def flatten_aws_export(entries: list[dict[str, Any]]) -> dict[str, Any]:
     # Second pass: promote keys to the flat namespace when either:
     #   - exactly one secret defines it, OR
     #   - multiple secrets define it with the same value (redundant copies).
-    # Real value-divergence collisions are skipped — templates must use
-    # namespaced refs to disambiguate.
+    # Each shared key is one `==` pass against its first owner's value, so the
+    # pass is linear in total value size. Real value-divergence collisions are
+    # skipped — templates must use namespaced refs to disambiguate.
     colliding: dict[str, list[str]] = {}
     for nk, owners in inner_key_owners.items():
-        values = [v for _, v in owners]
-        all_same = all(_values_equal(values[0], v) for v in values[1:])
-        if all_same:
-            set_aws_key(flattened, nk, values[0])
-        else:
+        first_value = owners[0][1]
+        if any(v != first_value for _, v in owners[1:]):
             colliding[nk] = [name for name, _ in owners]
+            continue
+        set_aws_key(flattened, nk, first_value)
 
     if colliding:
         print(